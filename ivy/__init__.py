@@ -253,10 +253,6 @@ class Node(str):
     pass
 
 
-array_significant_figures_stack = list()
-array_decimal_values_stack = list()
-warning_level_stack = list()
-nan_policy_stack = list()
 warn_to_regex = {"all": "!.*", "ivy_only": "^(?!.*ivy).*$", "none": ".*"}
 
 
@@ -269,6 +265,69 @@ _MIN_BASE = 1e-5
 import threading
 
 
+class ThreadLocalStack:
+    """A list-like stack, the contents of which are separate for each thread.
+
+    Used for the global modes and defaults, such as the default dtype and device
+    stacks, so that they can be set and unset from multiple threads concurrently.
+    The main thread's stack is the base for the others, such that each thread starts
+    with a copy of the main thread's stack as it is when the thread first uses it.
+    """
+
+    def __init__(self):
+        self._base = list()
+        self._local = threading.local()
+
+    @property
+    def _items(self):
+        try:
+            return self._local.items
+        except AttributeError:
+            if threading.current_thread() is threading.main_thread():
+                self._local.items = self._base
+            else:
+                self._local.items = list(self._base)
+            return self._local.items
+
+    def append(self, item):
+        self._items.append(item)
+
+    def pop(self, index=-1):
+        return self._items.pop(index)
+
+    def clear(self):
+        self._items.clear()
+
+    def copy(self):
+        return list(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def __eq__(self, other):
+        return self._items == list(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self._items)
+
+
+array_significant_figures_stack = ThreadLocalStack()
+array_decimal_values_stack = ThreadLocalStack()
+warning_level_stack = ThreadLocalStack()
+nan_policy_stack = ThreadLocalStack()
+
+
 # devices
 # ToDo: add gpu and tpu for valid devices when we test for them
 all_devices = ("cpu", "gpu", "tpu")
@@ -622,7 +681,7 @@ from .backend_handler import (
     choose_random_backend,
     clear_backend_stack,
 )
-from . import assertions, backend_handler, func_wrapper, exceptions
+from . import assertions, backend_handler, batching, func_wrapper, exceptions
 from . import functional
 from .functional import *
 from . import stateful
@@ -72,6 +72,10 @@ class Array(
     ArrayWithStatisticalExperimental,
     ArrayWithUtilityExperimental,
 ):
+    # the metadata of the native array is computed on first access
+    __slots__ = ("_data", "_size", "_dtype", "_device", "backend", "__weakref__")
+    _pre_repr = "ivy."
+
     def __init__(self, data):
         ArrayWithActivations.__init__(self)
         ArrayWithCreation.__init__(self)
@@ -122,20 +126,23 @@ class Array(
                 ivy.is_native_array(data), "data must be native array"
             )
             self._data = data
-        self._shape = self._data.shape
-        self._size = (
-            functools.reduce(mul, self._data.shape) if len(self._data.shape) > 0 else 0
-        )
-        self._dtype = ivy.dtype(self._data)
-        self._device = ivy.dev(self._data)
-        self._dev_str = ivy.as_ivy_dev(self._device)
-        self._pre_repr = "ivy."
-        if "gpu" in self._dev_str:
-            self._post_repr = ", dev={})".format(self._dev_str)
-        else:
-            self._post_repr = ")"
+        self._size = None
+        self._dtype = None
+        self._device = None
         self.backend = ivy.current_backend_str()
 
+    @classmethod
+    def _from_native(cls, data):
+        # wraps a native array without validating it, such as the output of a backend
+        # function, and without calling the no-op initializers of the base classes
+        self = object.__new__(cls)
+        self._data = data
+        self._size = None
+        self._dtype = None
+        self._device = None
+        self.backend = ivy.current_backend_str()
+        return self
+
     # Properties #
     # ---------- #
 
@@ -144,14 +151,25 @@ class Array(
         """The native array being wrapped in self."""
         return self._data
 
+    def _own_backend(self):
+        # the backend of the native array, which may no longer be the global backend
+        # by the time the lazy metadata is first read
+        if self.backend == ivy.current_backend_str():
+            return ivy
+        return ivy.backend_handler._determine_backend_from_args((self._data,))
+
     @property
     def dtype(self) -> ivy.Dtype:
         """Data type of the array elements"""
+        if self._dtype is None:
+            self._dtype = self._own_backend().dtype(self._data)
         return self._dtype
 
     @property
     def device(self) -> ivy.Device:
         """Hardware device the array data resides on."""
+        if self._device is None:
+            self._device = self._own_backend().dev(self._data)
         return self._device
 
     @property
@@ -173,16 +191,19 @@ class Array(
     @property
     def ndim(self) -> int:
         """Number of array dimensions (axes)."""
-        return len(tuple(self._shape))
+        return len(tuple(self._data.shape))
 
     @property
     def shape(self) -> ivy.Shape:
         """Array dimensions."""
-        return ivy.Shape(self._shape)
+        return ivy.Shape(self._data.shape)
 
     @property
     def size(self) -> Optional[int]:
         """Number of elements in the array."""
+        if self._size is None:
+            shape = self._data.shape
+            self._size = functools.reduce(mul, shape) if len(shape) > 0 else 0
         return self._size
 
     @property
@@ -243,12 +264,14 @@ class Array(
             ivy.get_backend(self.backend) if self.backend else ivy.current_backend()
         )
         arr_np = backend.to_numpy(self._data)
-        rep = ivy.vec_sig_fig(arr_np, sig_fig) if self._size > 0 else np.array(arr_np)
+        rep = ivy.vec_sig_fig(arr_np, sig_fig) if self.size > 0 else np.array(arr_np)
+        dev_str = ivy.as_ivy_dev(self.device)
+        post_repr = ", dev={})".format(dev_str) if "gpu" in dev_str else ")"
         with np.printoptions(precision=dec_vals):
             return (
                 self._pre_repr
                 + rep.__repr__()[:-1].partition(", dtype")[0].partition(", dev")[0]
-                + self._post_repr.format(ivy.current_backend_str())
+                + post_repr
             )
 
     def __dir__(self):
@@ -269,7 +292,7 @@ class Array(
             self._data.__setitem__(query, val)
         except (AttributeError, TypeError):
             self._data = ivy.scatter_nd(query, val, reduction="replace", out=self)._data
-            self._dtype = ivy.dtype(self._data)
+            self._dtype = None
 
     def __contains__(self, key):
         return self._data.__contains__(key)
@@ -297,7 +320,11 @@ class Array(
         ivy_array = ivy.array(state["data"])
         ivy.unset_backend()
 
-        self.__dict__ = ivy_array.__dict__
+        self._data = ivy_array.data
+        self._size = None
+        self._dtype = None
+        self._device = None
+        self.backend = ivy_array.backend
 
         # TODO: what about placement of the array on the right device ?
         # device = backend.as_native_dev(state["device_str"])
@@ -28,7 +28,7 @@ def _to_ivy(x: Any) -> Any:
         return x
     elif isinstance(x, ivy.Container):
         return x.to_ivy()
-    return ivy.Array(x) if ivy.is_native_array(x) else x
+    return ivy.Array._from_native(x) if ivy.is_native_array(x) else x
 
 
 # Wrapped #
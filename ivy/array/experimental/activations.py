@@ -3,4 +3,4 @@ import abc
 
 
 class ArrayWithActivationsExperimental(abc.ABC):
-    pass
+    __slots__ = ()
@@ -7,6 +7,8 @@ import ivy
 
 
 class ArrayWithLayersExperimental(abc.ABC):
+    __slots__ = ()
+
     def max_pool1d(
         self: ivy.Array,
         kernel: Union[int, Tuple[int]],
@@ -7,6 +7,8 @@ import ivy
 
 
 class ArrayWithLinearAlgebraExperimental(abc.ABC):
+    __slots__ = ()
+
     def diagflat(
         self: Union[ivy.Array, ivy.NativeArray],
         *,
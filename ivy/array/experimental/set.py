@@ -3,4 +3,4 @@ import abc
 
 
 class ArrayWithSetExperimental(abc.ABC):
-    pass
+    __slots__ = ()
@@ -8,6 +8,8 @@ import ivy
 
 
 class ArrayWithSortingExperimental(abc.ABC):
+    __slots__ = ()
+
     # msort
     def msort(
         self: ivy.Array,
@@ -9,6 +9,8 @@ import ivy
 
 
 class ArrayWithLayers(abc.ABC):
+    __slots__ = ()
+
     def linear(
         self: ivy.Array,
         weight: Union[ivy.Array, ivy.NativeArray],
@@ -106,6 +108,8 @@ class ArrayWithLayers(abc.ABC):
         /,
         *,
         mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+        is_causal: bool = False,
+        chunk_size: Optional[int] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         """
@@ -135,6 +139,14 @@ class ArrayWithLayers(abc.ABC):
             The mask input array. The mask to apply to the query-key values.
             Default is None. The shape of mask input should be in
             *[batch_shape,num_queries,num_keys]*.
+        is_causal
+            Whether each query only attends to the keys at or before its own
+            position, with the last query aligned with the last key.
+            Default is ``False``.
+        chunk_size
+            If given, the keys and values are processed in chunks of this many keys,
+            with a running softmax, to bound the memory of the similarities.
+            Default is ``None``.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -175,6 +187,8 @@ class ArrayWithLayers(abc.ABC):
             v,
             scale,
             mask=mask,
+            is_causal=is_causal,
+            chunk_size=chunk_size,
             out=out,
         )
 
@@ -192,6 +206,8 @@ class ArrayWithLayers(abc.ABC):
         to_q_v=None,
         to_kv_v=None,
         to_out_v=None,
+        is_causal: bool = False,
+        chunk_size: Optional[int] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         return ivy.multi_head_attention(
@@ -206,6 +222,8 @@ class ArrayWithLayers(abc.ABC):
             to_q_v=to_q_v,
             to_kv_v=to_kv_v,
             to_out_v=to_out_v,
+            is_causal=is_causal,
+            chunk_size=chunk_size,
             out=out,
         )
 
@@ -7,6 +7,8 @@ import ivy
 
 
 class ArrayWithRandom(abc.ABC):
+    __slots__ = ()
+
     def random_uniform(
         self: ivy.Array,
         /,
@@ -16,6 +18,7 @@ class ArrayWithRandom(abc.ABC):
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
         dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
         seed: Optional[int] = None,
+        key: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         """ivy.Array instance method variant of ivy.random_uniform. This method simply
@@ -44,6 +47,9 @@ class ArrayWithRandom(abc.ABC):
             type will be the default floating-point data type. Default ``None``
         seed
             A python integer. Used to create a random seed distribution
+        key
+            A key of the counter-based generator, as returned by ``ivy.PRNGKey``.
+            If given, ``seed`` is ignored. Default is ``None``.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -102,6 +108,7 @@ class ArrayWithRandom(abc.ABC):
             device=device,
             dtype=dtype,
             seed=seed,
+            key=key,
             out=out,
         )
 
@@ -114,6 +121,7 @@ class ArrayWithRandom(abc.ABC):
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
         dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
         seed: Optional[int] = None,
+        key: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         """ivy.Array instance method variant of ivy.random_normal. This method simply
@@ -140,6 +148,9 @@ class ArrayWithRandom(abc.ABC):
              type will be the default floating-point data type. Default ``None``
         seed
             A python integer. Used to create a random seed distribution
+        key
+            A key of the counter-based generator, as returned by ``ivy.PRNGKey``.
+            If given, ``seed`` is ignored. Default is ``None``.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -198,6 +209,7 @@ class ArrayWithRandom(abc.ABC):
             device=device,
             dtype=dtype,
             seed=seed,
+            key=key,
             out=out,
         )
 
@@ -211,6 +223,7 @@ class ArrayWithRandom(abc.ABC):
         replace: bool = True,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
         seed: Optional[int] = None,
+        key: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         """ivy.Array instance method variant of ivy.multinomial. This method simply
@@ -235,6 +248,9 @@ class ArrayWithRandom(abc.ABC):
             (Default value = None)
         seed
             A python integer. Used to create a random seed distribution
+        key
+            A key of the counter-based generator, as returned by ``ivy.PRNGKey``.
+            If given, ``seed`` is ignored. Default is ``None``.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -252,6 +268,7 @@ class ArrayWithRandom(abc.ABC):
             replace=replace,
             device=device,
             seed=seed,
+            key=key,
             out=out,
         )
 
@@ -264,6 +281,7 @@ class ArrayWithRandom(abc.ABC):
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
         dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
         seed: Optional[int] = None,
+        key: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         """ivy.Array instance method variant of ivy.randint. This method simply
@@ -289,6 +307,9 @@ class ArrayWithRandom(abc.ABC):
              type will be the default integer data type. Default ``None``
         seed
             A python integer. Used to create a random seed distribution
+        key
+            A key of the counter-based generator, as returned by ``ivy.PRNGKey``.
+            If given, ``seed`` is ignored. Default is ``None``.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -348,6 +369,7 @@ class ArrayWithRandom(abc.ABC):
             device=device,
             dtype=dtype,
             seed=seed,
+            key=key,
             out=out,
         )
 
@@ -356,6 +378,7 @@ class ArrayWithRandom(abc.ABC):
         /,
         *,
         seed: Optional[int] = None,
+        key: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         """ivy.Array instance method variant of ivy.shuffle. This method simply
@@ -368,6 +391,9 @@ class ArrayWithRandom(abc.ABC):
             Input array. Should have a numeric data type.
         seed
             A python integer. Used to create a random seed distribution
+        key
+            A key of the counter-based generator, as returned by ``ivy.PRNGKey``.
+            If given, ``seed`` is ignored. Default is ``None``.
         out
             optional output array, for writing the result to. It must have a
             shape that the inputs broadcast to.
@@ -384,4 +410,4 @@ class ArrayWithRandom(abc.ABC):
         >>> print(y)
         ivy.array([2, 5, 9])
         """
-        return ivy.shuffle(self, seed=seed, out=out)
+        return ivy.shuffle(self, seed=seed, key=key, out=out)
@@ -6,12 +6,16 @@ from ivy import verbosity
 from typing import Optional
 
 # local
-from ivy.func_wrapper import _wrap_function
+from ivy.func_wrapper import _wrap_function, _find_first_leaf
 
+# ToDo: the backend stack is still shared by all threads, as the wrapped functions of
+#  the current backend live in the ivy namespace itself. Per-thread backends need the
+#  namespace to dispatch to the cached namespace of each thread's backend.
 backend_stack = []
 implicit_backend = "numpy"
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = dict()
+_backend_namespaces = dict()
 
 
 class ContextManager:
@@ -73,24 +77,17 @@ def _determine_backend_from_args(args):
     <module 'ivy.functional.backends.jax' from '/ivy/ivy/functional/backends/jax/__init__.py'>    # noqa
 
     """
-    for arg in args:
-        arg_type = type(arg)
-        # function is called recursively if arg is a list/tuple
-        if arg_type in [list, tuple]:
-            lib = _determine_backend_from_args(arg)
-            if lib:
-                return lib
-        # function is called recursively if arg is a dict
-        elif arg_type is dict:
-            lib = _determine_backend_from_args(list(arg.values()))
-            if lib:
-                return lib
-        else:
-            # use the _array_types dict to map the module where arg comes from, to the
-            # corresponding Ivy backend
-            if arg.__class__.__module__ in _array_types:
-                module_name = _array_types[arg.__class__.__module__]
-                return importlib.import_module(module_name)
+    # only exact lists, tuples and dicts are searched, as some native classes such as
+    # torch.Size are derived from tuple
+    arg = _find_first_leaf(
+        args,
+        lambda x: x.__class__.__module__ in _array_types,
+        include_derived=False,
+    )
+    if arg is not None:
+        # use the _array_types dict to map the module where arg comes from, to the
+        # corresponding Ivy backend
+        return importlib.import_module(_array_types[arg.__class__.__module__])
 
 
 def fn_name_from_version_specific_fn_name(name, version):
@@ -140,6 +137,58 @@ def fn_name_from_version_specific_fn_name(name, version):
             return name[0:i]
 
 
+def _update_original_dict(new_original_dict):
+    # the cached backend namespaces are built from ivy_original_dict, so they are
+    # invalidated if any of its entries have since changed
+    global ivy_original_dict
+    if new_original_dict.keys() != ivy_original_dict.keys() or any(
+        new_original_dict[k] is not v for k, v in ivy_original_dict.items()
+    ):
+        _backend_namespaces.clear()
+    ivy_original_dict = new_original_dict
+
+
+def _build_backend_namespace(backend):
+    """Wrap the functions of ``backend`` for the ivy namespace.
+
+    Parameters
+    ----------
+    backend
+        the backend module to build the namespace for
+
+    Returns
+    -------
+    ret
+        the wrapped entries to set in the ivy namespace, and the keys to remove from
+        it as they are not supported by the backend.
+    """
+    set_backend_to_specific_version(backend)
+    namespace = dict()
+    invalid = list()
+    for k, v in ivy_original_dict.items():
+        compositional = k not in backend.__dict__
+        if k not in backend.__dict__:
+            if k in backend.invalid_dtypes and k in ivy.__dict__:
+                invalid.append(k)
+                continue
+            backend.__dict__[k] = v
+        namespace[k] = _wrap_function(
+            key=k, to_wrap=backend.__dict__[k], original=v, compositional=compositional
+        )
+    return namespace, invalid
+
+
+def _set_backend_namespace(backend):
+    # the wrapped namespace of each backend is only built the first time it is set,
+    # after which switching to it is a dictionary update
+    if backend.__name__ not in _backend_namespaces:
+        _backend_namespaces[backend.__name__] = _build_backend_namespace(backend)
+    namespace, invalid = _backend_namespaces[backend.__name__]
+    ivy.__dict__.update(namespace)
+    for k in invalid:
+        ivy.__dict__.pop(k, None)
+
+
 def set_backend_to_specific_version(backend):
     """
     Updates the backend dict to make the original function
@@ -241,36 +290,27 @@ def set_backend(backend: str):
         "backend must be one from {}".format(list(_backend_dict.keys())),
     )
     ivy.locks["backend_setter"].acquire()
-    global ivy_original_dict
-    if not backend_stack:
-        ivy_original_dict = ivy.__dict__.copy()
-    if isinstance(backend, str):
-        temp_stack = list()
-        while backend_stack:
-            temp_stack.append(unset_backend())
-        backend = importlib.import_module(_backend_dict[backend])
-        for fw in reversed(temp_stack):
-            backend_stack.append(fw)
-    if backend.current_backend_str() == "numpy":
-        ivy.set_default_device("cpu")
-    elif backend.current_backend_str() == "jax":
-        ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
-    backend_stack.append(backend)
-    set_backend_to_specific_version(backend)
-    for k, v in ivy_original_dict.items():
-        compositional = k not in backend.__dict__
-        if k not in backend.__dict__:
-            if k in backend.invalid_dtypes and k in ivy.__dict__:
-                del ivy.__dict__[k]
-                continue
-            backend.__dict__[k] = v
-        ivy.__dict__[k] = _wrap_function(
-            key=k, to_wrap=backend.__dict__[k], original=v, compositional=compositional
-        )
+    try:
+        if not backend_stack:
+            _update_original_dict(ivy.__dict__.copy())
+        if isinstance(backend, str):
+            temp_stack = list()
+            while backend_stack:
+                temp_stack.append(unset_backend())
+            backend = importlib.import_module(_backend_dict[backend])
+            for fw in reversed(temp_stack):
+                backend_stack.append(fw)
+        if backend.current_backend_str() == "numpy":
+            ivy.set_default_device("cpu")
+        elif backend.current_backend_str() == "jax":
+            ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
+        backend_stack.append(backend)
+        _set_backend_namespace(backend)
+    finally:
+        ivy.locks["backend_setter"].release()
 
     if verbosity.level > 0:
         verbosity.cprint("backend stack: {}".format(backend_stack))
-    ivy.locks["backend_setter"].release()
 
 
 def set_numpy_backend():
@@ -330,9 +370,8 @@ def get_backend(backend: Optional[str] = None):
     # ToDo: change this so that it doesn't depend at all on the global ivy. Currently
     #  all backend-agnostic implementations returned in this module will still
     #  use the global ivy backend.
-    global ivy_original_dict
     if not backend_stack:
-        ivy_original_dict = ivy.__dict__.copy()
+        _update_original_dict(ivy.__dict__.copy())
     # current global backend is retrieved if backend isn't specified,
     # otherwise `backend` argument will be used
     if backend is None:
@@ -394,16 +433,12 @@ def unset_backend():
                 ivy.set_default_device("cpu")
             elif new_backend.current_backend_str() == "jax":
                 ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
-        new_backend_dict = (
-            backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
-        )
-        # wrap backend functions if there still is a backend, and add functions
-        # to ivy namespace
-        for k, v in new_backend_dict.items():
-            if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
-            if k in ivy_original_dict:
-                ivy.__dict__[k] = v
+        # swap in the cached namespace of the previously set backend, or Ivy's
+        # original namespace if there is no previously set backend
+        if backend_stack:
+            _set_backend_namespace(backend_stack[-1])
+        else:
+            ivy.__dict__.update(ivy_original_dict)
     if verbosity.level > 0:
         verbosity.cprint("backend stack: {}".format(backend_stack))
     return backend
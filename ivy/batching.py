@@ -0,0 +1,603 @@
+"""Batching rules used by :func:`ivy.vmap` on backends without a native vmap.
+
+The mapped arguments are passed to the vectorized function as :class:`BatchedArray`
+instances, which hold the whole batch of native arrays with the mapped axis first.
+When an ivy function is called with a :class:`BatchedArray`, the dispatcher hands
+the call to the batching rule registered under the function name, which calls the
+function once on the whole batch. Functions without a batching rule raise
+:class:`BatchingRuleError`, after which ``vmap`` falls back to a loop over the
+mapped axis.
+"""
+
+# global
+import functools
+import inspect
+from typing import Callable, Dict, Optional, Sequence
+
+# local
+import ivy
+
+
+class BatchingRuleError(Exception):
+    """Raised when a function cannot be applied to a whole batch at once."""
+
+
+class BatchedArray:
+    """A batch of native arrays, stacked along a leading mapped axis.
+
+    The attributes describe a single example of the batch, so that the vectorized
+    function sees the same shapes as it does when called on each example.
+
+    Parameters
+    ----------
+    value
+        The native array holding the whole batch, with the mapped axis first.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    @property
+    def shape(self):
+        return ivy.Shape(tuple(self.value.shape[1:]))
+
+    @property
+    def ndim(self):
+        return len(self.value.shape) - 1
+
+    @property
+    def dtype(self):
+        return self.value.dtype
+
+    @property
+    def batch_size(self):
+        return self.value.shape[0]
+
+    def __repr__(self):
+        return "BatchedArray(batch_size={}, shape={}, dtype={})".format(
+            self.batch_size, tuple(self.shape), self.dtype
+        )
+
+    def __len__(self):
+        return self.shape[0]
+
+    # methods of the same name as an ivy function with a batching rule, such as
+    # x.sum() or x.reshape(shape), call that function
+    def __getattr__(self, name):
+        if name not in _BATCHING_RULES:
+            raise AttributeError(
+                "'BatchedArray' object has no attribute '{}'".format(name)
+            )
+        return functools.partial(getattr(ivy, name), self)
+
+    def __getitem__(self, query):
+        if not isinstance(query, tuple):
+            query = (query,)
+        if not all(
+            isinstance(q, (int, slice)) or q is None or q is Ellipsis for q in query
+        ):
+            raise BatchingRuleError("only basic indexing can be batched")
+        return BatchedArray(self.value[(slice(None),) + query])
+
+    # data dependent control flow and conversions cannot be batched
+    def __bool__(self):
+        raise BatchingRuleError("the truth value of a batched array is undefined")
+
+    def __iter__(self):
+        raise BatchingRuleError("batched arrays cannot be iterated over")
+
+    def __array__(self, *args, **kwargs):
+        raise BatchingRuleError("batched arrays cannot be converted to numpy")
+
+    def __float__(self):
+        raise BatchingRuleError("batched arrays cannot be converted to float")
+
+    def __int__(self):
+        raise BatchingRuleError("batched arrays cannot be converted to int")
+
+    def __neg__(self):
+        return ivy.negative(self)
+
+    def __abs__(self):
+        return ivy.abs(self)
+
+    def __add__(self, other):
+        return ivy.add(self, other)
+
+    def __radd__(self, other):
+        return ivy.add(other, self)
+
+    def __sub__(self, other):
+        return ivy.subtract(self, other)
+
+    def __rsub__(self, other):
+        return ivy.subtract(other, self)
+
+    def __mul__(self, other):
+        return ivy.multiply(self, other)
+
+    def __rmul__(self, other):
+        return ivy.multiply(other, self)
+
+    def __truediv__(self, other):
+        return ivy.divide(self, other)
+
+    def __rtruediv__(self, other):
+        return ivy.divide(other, self)
+
+    def __pow__(self, other):
+        return ivy.pow(self, other)
+
+    def __rpow__(self, other):
+        return ivy.pow(other, self)
+
+    def __matmul__(self, other):
+        return ivy.matmul(self, other)
+
+    def __rmatmul__(self, other):
+        return ivy.matmul(other, self)
+
+    def __lt__(self, other):
+        return ivy.less(self, other)
+
+    def __le__(self, other):
+        return ivy.less_equal(self, other)
+
+    def __gt__(self, other):
+        return ivy.greater(self, other)
+
+    def __ge__(self, other):
+        return ivy.greater_equal(self, other)
+
+    def __eq__(self, other):
+        return ivy.equal(self, other)
+
+    def __ne__(self, other):
+        return ivy.not_equal(self, other)
+
+    __hash__ = None
+
+
+# Helpers #
+# --------#
+
+_SIGNATURES: Dict[Callable, inspect.Signature] = dict()
+
+
+def _bind(fn, args, kwargs):
+    try:
+        signature = _SIGNATURES[fn]
+    except KeyError:
+        signature = _SIGNATURES[fn] = inspect.signature(fn)
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return bound
+
+
+def _to_native(x):
+    return x.data if isinstance(x, ivy.Array) else x
+
+
+def _to_batched(ret):
+    ret = _to_native(ret)
+    if not ivy.is_native_array(ret):
+        raise BatchingRuleError("expected an array output")
+    return BatchedArray(ret)
+
+
+def _example_ndim(x):
+    if isinstance(x, BatchedArray):
+        return x.ndim
+    return len(getattr(x, "shape", ()))
+
+
+def _batch_size(xs):
+    for x in xs:
+        if isinstance(x, BatchedArray):
+            return x.batch_size
+
+
+def _align(x, ndim):
+    # inserts unit axes after the mapped axis of a batched array, so that the
+    # mapped axis is not broadcast against the axes of an example
+    if not isinstance(x, BatchedArray):
+        return x
+    if x.ndim == ndim:
+        return x.value
+    return _to_native(
+        ivy.reshape(x.value, (x.batch_size,) + (1,) * (ndim - x.ndim) + tuple(x.shape))
+    )
+
+
+def _broadcast_batch(x, batch_size):
+    if isinstance(x, BatchedArray):
+        return x.value
+    x = _to_native(x)
+    return _to_native(ivy.broadcast_to(x, (batch_size,) + tuple(x.shape)))
+
+
+def _shift_axis(axis):
+    # with the mapped axis first, negative axes still refer to the same axis
+    if isinstance(axis, (list, tuple)):
+        return type(axis)(_shift_axis(a) for a in axis)
+    return axis if axis < 0 else axis + 1
+
+
+def _only_first_batched(bound):
+    arguments = iter(bound.arguments.values())
+    first = next(arguments)
+    if not isinstance(first, BatchedArray) or any(
+        isinstance(v, BatchedArray) for v in arguments
+    ):
+        raise BatchingRuleError("only the first argument can be batched")
+    return first
+
+
+# Rules #
+# ------#
+
+_BATCHING_RULES: Dict[str, Callable] = dict()
+
+
+def _register(names: Sequence[str], rule: Callable):
+    for name in names:
+        _BATCHING_RULES[name] = rule
+
+
+def _elementwise_rule(fn, args, kwargs):
+    ndim = max(_example_ndim(x) for x in (*args, *kwargs.values()))
+    args = [_align(x, ndim) for x in args]
+    kwargs = {k: _align(v, ndim) for k, v in kwargs.items()}
+    return _to_batched(fn(*args, **kwargs))
+
+
+def _reduction_rule(fn, args, kwargs):
+    bound = _bind(fn, args, kwargs)
+    x = _only_first_batched(bound)
+    axis = bound.arguments["axis"]
+    if axis is None:
+        axis = tuple(range(x.ndim))
+    bound.arguments["axis"] = _shift_axis(axis)
+    bound.arguments[next(iter(bound.arguments))] = x.value
+    return _to_batched(fn(*bound.args, **bound.kwargs))
+
+
+def _vector_norm_rule(fn, args, kwargs):
+    # the norm over all of the axes has a backend dependent shape, which is left to
+    # the loop over the examples
+    if _bind(fn, args, kwargs).arguments["axis"] is None:
+        raise BatchingRuleError("vector_norm requires an axis")
+    return _reduction_rule(fn, args, kwargs)
+
+
+def _axis_rule(fn, args, kwargs):
+    bound = _bind(fn, args, kwargs)
+    x = _only_first_batched(bound)
+    for name in ("axis", "axis0", "axis1"):
+        if name in bound.arguments:
+            if bound.arguments[name] is None:
+                raise BatchingRuleError("the axis must be specified")
+            bound.arguments[name] = _shift_axis(bound.arguments[name])
+    bound.arguments[next(iter(bound.arguments))] = x.value
+    return _to_batched(fn(*bound.args, **bound.kwargs))
+
+
+def _arg_reduction_rule(fn, args, kwargs):
+    bound = _bind(fn, args, kwargs)
+    x = _only_first_batched(bound)
+    if bound.arguments["axis"] is None:
+        # the index into each flattened example
+        if bound.arguments.get("keepdims"):
+            raise BatchingRuleError("keepdims requires an axis")
+        bound.arguments["x"] = _to_native(ivy.reshape(x.value, (x.batch_size, -1)))
+        bound.arguments["axis"] = 1
+    else:
+        bound.arguments["x"] = x.value
+        bound.arguments["axis"] = _shift_axis(bound.arguments["axis"])
+    return _to_batched(fn(*bound.args, **bound.kwargs))
+
+
+def _einsum_rule(fn, args, kwargs):
+    equation, operands = args[0], args[1:]
+    if "->" not in equation:
+        raise BatchingRuleError("einsum requires an explicit output")
+    inputs, output = equation.split("->")
+    inputs = inputs.split(",")
+    # the mapped axis is given a subscript of its own in the batched operands
+    letter = next(
+        c
+        for c in "zyxwvutsrqponmlkjihgfedcbaZYXWVUTSRQPONMLKJIHGFEDCBA"
+        if c not in equation
+    )
+    inputs = [
+        letter + subscripts.strip() if isinstance(x, BatchedArray) else subscripts
+        for subscripts, x in zip(inputs, operands)
+    ]
+    equation = ",".join(inputs) + "->" + letter + output.strip()
+    operands = [x.value if isinstance(x, BatchedArray) else x for x in operands]
+    return _to_batched(fn(equation, *operands, **kwargs))
+
+
+def _matmul_rule(fn, args, kwargs):
+    bound = _bind(fn, args, kwargs)
+    if any(
+        bound.arguments.get(name)
+        for name in ("transpose_a", "transpose_b", "adjoint_a", "adjoint_b")
+    ):
+        raise BatchingRuleError("transposed matmul is not batched")
+    x1, x2 = bound.arguments["x1"], bound.arguments["x2"]
+    batched1, batched2 = isinstance(x1, BatchedArray), isinstance(x2, BatchedArray)
+    ndim1, ndim2 = _example_ndim(x1), _example_ndim(x2)
+    squeeze_axis = None
+    if ndim1 == 1 and ndim2 == 1:
+        if batched1 and batched2:
+            raise BatchingRuleError("the inner product of vectors is not batched")
+        # the batched vectors form a matrix, which contracts the unbatched vector
+        x1, x2 = (x1.value, x2) if batched1 else (x2.value, x1)
+    elif ndim1 == 1 and batched1 or ndim2 == 1 and batched2:
+        # a batched vector is expanded to a matrix, so that the mapped axis is
+        # neither contracted nor treated as a matrix axis
+        if ndim1 == 1:
+            x1, squeeze_axis = BatchedArray(_expand(x1.value, -2)), -2
+        else:
+            x2, squeeze_axis = BatchedArray(_expand(x2.value, -1)), -1
+        ndim = max(ndim1, ndim2, 2)
+        x1, x2 = _align(x1, ndim), _align(x2, ndim)
+    elif ndim1 == 1 or ndim2 == 1:
+        # an unbatched vector is broadcast against the batched matrices as is
+        x1, x2 = getattr(x1, "value", x1), getattr(x2, "value", x2)
+    else:
+        ndim = max(ndim1, ndim2)
+        x1, x2 = _align(x1, ndim), _align(x2, ndim)
+    bound.arguments["x1"], bound.arguments["x2"] = x1, x2
+    ret = _to_native(fn(*bound.args, **bound.kwargs))
+    if squeeze_axis is not None:
+        ret = ivy.squeeze(ret, axis=squeeze_axis)
+    return _to_batched(ret)
+
+
+def _expand(x, axis):
+    return _to_native(ivy.expand_dims(x, axis=axis))
+
+
+def _join_rule(fn, args, kwargs):
+    bound = _bind(fn, args, kwargs)
+    xs_name = next(iter(bound.arguments))
+    xs = bound.arguments[xs_name]
+    if bound.arguments["axis"] is None:
+        raise BatchingRuleError("the axis must be specified")
+    batch_size = _batch_size(xs)
+    bound.arguments[xs_name] = [_broadcast_batch(x, batch_size) for x in xs]
+    bound.arguments["axis"] = _shift_axis(bound.arguments["axis"])
+    return _to_batched(fn(*bound.args, **bound.kwargs))
+
+
+def _reshape_rule(fn, args, kwargs):
+    bound = _bind(fn, args, kwargs)
+    x = _only_first_batched(bound)
+    bound.arguments["x"] = x.value
+    bound.arguments["shape"] = (x.batch_size,) + tuple(bound.arguments["shape"])
+    return _to_batched(fn(*bound.args, **bound.kwargs))
+
+
+def _squeeze_rule(fn, args, kwargs):
+    bound = _bind(fn, args, kwargs)
+    x = _only_first_batched(bound)
+    axis = bound.arguments["axis"]
+    if axis is None:
+        # the mapped axis is kept, even if the batch has a single example
+        axis = tuple(i for i, d in enumerate(x.shape) if d == 1)
+    bound.arguments["x"] = x.value
+    bound.arguments["axis"] = _shift_axis(axis)
+    return _to_batched(fn(*bound.args, **bound.kwargs))
+
+
+def _permute_dims_rule(fn, args, kwargs):
+    bound = _bind(fn, args, kwargs)
+    x = _only_first_batched(bound)
+    bound.arguments["x"] = x.value
+    bound.arguments["axes"] = (0,) + tuple(
+        a % x.ndim + 1 for a in bound.arguments["axes"]
+    )
+    return _to_batched(fn(*bound.args, **bound.kwargs))
+
+
+def _gather_rule(fn, args, kwargs):
+    bound = _bind(fn, args, kwargs)
+    x = _only_first_batched(bound)
+    if bound.arguments["batch_dims"]:
+        raise BatchingRuleError("gather with batch_dims is not batched")
+    bound.arguments["params"] = x.value
+    bound.arguments["axis"] = _shift_axis(bound.arguments["axis"])
+    return _to_batched(fn(*bound.args, **bound.kwargs))
+
+
+def _conv_rule(fn, args, kwargs):
+    # the mapped axis is merged into the batch axis of the input
+    bound = _bind(fn, args, kwargs)
+    x = _only_first_batched(bound)
+    shape = tuple(x.value.shape)
+    bound.arguments["x"] = _to_native(ivy.reshape(x.value, (-1,) + shape[2:]))
+    ret = _to_native(fn(*bound.args, **bound.kwargs))
+    return _to_batched(ivy.reshape(ret, shape[:2] + tuple(ret.shape[1:])))
+
+
+def _shape_rule(fn, args, kwargs):
+    bound = _bind(fn, args, kwargs)
+    x = _only_first_batched(bound)
+    if bound.arguments.get("as_array"):
+        raise BatchingRuleError("the shape of a batched array is not an array")
+    return x.shape
+
+
+def _dtype_rule(fn, args, kwargs):
+    bound = _bind(fn, args, kwargs)
+    bound.arguments["x"] = _only_first_batched(bound).value
+    return fn(*bound.args, **bound.kwargs)
+
+
+_register(
+    [
+        "abs",
+        "acos",
+        "acosh",
+        "add",
+        "asin",
+        "asinh",
+        "astype",
+        "atan",
+        "atan2",
+        "atanh",
+        "bitwise_and",
+        "bitwise_invert",
+        "bitwise_left_shift",
+        "bitwise_or",
+        "bitwise_right_shift",
+        "bitwise_xor",
+        "ceil",
+        "clip",
+        "cos",
+        "cosh",
+        "deg2rad",
+        "divide",
+        "equal",
+        "erf",
+        "exp",
+        "expm1",
+        "floor",
+        "floor_divide",
+        "gelu",
+        "greater",
+        "greater_equal",
+        "isfinite",
+        "isinf",
+        "isnan",
+        "leaky_relu",
+        "less",
+        "less_equal",
+        "log",
+        "log10",
+        "log1p",
+        "log2",
+        "logaddexp",
+        "logical_and",
+        "logical_not",
+        "logical_or",
+        "logical_xor",
+        "maximum",
+        "minimum",
+        "multiply",
+        "negative",
+        "not_equal",
+        "positive",
+        "pow",
+        "rad2deg",
+        "reciprocal",
+        "relu",
+        "remainder",
+        "round",
+        "sigmoid",
+        "sign",
+        "sin",
+        "sinh",
+        "softplus",
+        "sqrt",
+        "square",
+        "subtract",
+        "tan",
+        "tanh",
+        "trunc",
+        "where",
+    ],
+    _elementwise_rule,
+)
+_register(
+    ["all", "any", "max", "mean", "min", "prod", "std", "sum", "var"],
+    _reduction_rule,
+)
+_register(["vector_norm"], _vector_norm_rule)
+_register(
+    [
+        "argsort",
+        "cumprod",
+        "cumsum",
+        "expand_dims",
+        "flip",
+        "log_softmax",
+        "softmax",
+        "sort",
+        "swapaxes",
+    ],
+    _axis_rule,
+)
+_register(["argmax", "argmin"], _arg_reduction_rule)
+_register(["concat", "stack"], _join_rule)
+_register(["conv1d", "conv2d", "conv3d"], _conv_rule)
+_register(["dtype"], _dtype_rule)
+_register(["einsum"], _einsum_rule)
+_register(["gather"], _gather_rule)
+_register(["matmul"], _matmul_rule)
+_register(["permute_dims"], _permute_dims_rule)
+_register(["reshape"], _reshape_rule)
+_register(["shape"], _shape_rule)
+_register(["squeeze"], _squeeze_rule)
+
+
+def apply_batching_rule(fn: Callable, name: str, args, kwargs):
+    """Call the ivy function `fn` named `name` on batched arguments, using the
+    batching rule registered for it.
+
+    Raises
+    ------
+    BatchingRuleError
+        If there is no batching rule for the function, or the rule does not support
+        the given arguments.
+    """
+    try:
+        rule = _BATCHING_RULES[name]
+    except KeyError:
+        raise BatchingRuleError("no batching rule for {}".format(name))
+    if kwargs.get("out") is not None:
+        raise BatchingRuleError("the out argument is not batched")
+    return rule(fn, args, kwargs)
+
+
+def batched_call(func: Callable, args: Sequence, mapped: Sequence[bool]) -> Optional:
+    """Call `func` once on the whole batch of its mapped arguments.
+
+    Parameters
+    ----------
+    func
+        Function to vectorize.
+    args
+        Positional arguments of `func`. The mapped arguments are native arrays with
+        the mapped axis first.
+    mapped
+        Whether each argument is mapped.
+
+    Returns
+    -------
+    ret
+        The native output, with the mapped axis first, or ``None`` if `func` could
+        not be batched, in which case it should be called on each example instead.
+        As `func` may have been partially run, it should be free of side effects.
+    """
+    if not ivy.backend_stack:
+        # ivy functions are only dispatched to the batching rules once a backend
+        # has been set
+        return None
+    args = [
+        BatchedArray(arg) if m and ivy.is_native_array(arg) else arg
+        for arg, m in zip(args, mapped)
+    ]
+    try:
+        ret = func(*args)
+    except Exception:
+        # an unbatched operation, or an error which calling func on each example
+        # will raise again
+        return None
+    if not isinstance(ret, BatchedArray):
+        return None
+    return ret.value
@@ -40,6 +40,93 @@ def _is_jsonable(x):
         return False
 
 
+def _read_h5_rows(dataset, rows):
+    # h5py only supports positive steps, so negative steps are read in reverse
+    if rows.step > 0:
+        return dataset[rows.start : rows.stop : rows.step]
+    if len(rows) == 0:
+        return dataset[0:0]
+    return dataset[rows[-1] : rows[0] + 1 : -rows.step][::-1]
+
+
+class _LazyH5Dataset:
+    """Handle to a sliced hdf5 dataset, which is only read from disk once indexed.
+    Indexing along the batch dimension only reads the requested rows."""
+
+    def __init__(self, dataset, slice_obj=slice(None), ivyh=None):
+        self._dataset = dataset
+        self._rows = range(dataset.shape[0])[slice_obj]
+        self._ivyh = ivyh
+
+    @property
+    def shape(self):
+        return (len(self._rows),) + tuple(self._dataset.shape[1:])
+
+    @property
+    def dtype(self):
+        return self._dataset.dtype
+
+    def to_array(self):
+        return ivy.default(self._ivyh, ivy).array(
+            _read_h5_rows(self._dataset, self._rows)
+        )
+
+    def __getitem__(self, query):
+        query = query if isinstance(query, tuple) else (query,)
+        if query and isinstance(query[0], (int, np.integer, slice)):
+            rows = self._rows[query[0]]
+            if isinstance(rows, range):
+                data = _read_h5_rows(self._dataset, rows)
+                rest = (slice(None),) + query[1:]
+            else:
+                data = self._dataset[rows]
+                rest = query[1:]
+            data = data[rest] if len(query) > 1 else data
+        else:
+            data = _read_h5_rows(self._dataset, self._rows)[query]
+        return ivy.default(self._ivyh, ivy).array(data)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __repr__(self):
+        return "LazyH5Dataset(name={}, shape={}, dtype={})".format(
+            self._dataset.name, self.shape, self.dtype
+        )
+
+
+def _shuffle_h5_dataset(h5_obj, key, seed_value, block_size=None):
+    # writes the permuted rows of h5_obj[key] into a new dataset one block at a
+    # time, reading the source rows of each block in increasing order as h5py
+    # requires, and then replaces the original dataset with it
+    dataset = h5_obj[key]
+    num_rows = dataset.shape[0]
+    permutation = np.random.RandomState(seed_value).permutation(num_rows)
+    if block_size is None:
+        row_bytes = reduce(mul, dataset.shape[1:], 1) * dataset.dtype.itemsize
+        block_size = max(1, 2**26 // max(row_bytes, 1))
+    tmp_key = key + "__shuffled"
+    shuffled = h5_obj.create_dataset(
+        tmp_key,
+        dataset.shape,
+        dtype=dataset.dtype,
+        maxshape=dataset.maxshape,
+        chunks=dataset.chunks,
+        compression=dataset.compression,
+        compression_opts=dataset.compression_opts,
+    )
+    for start in range(0, num_rows, block_size):
+        src = permutation[start : start + block_size]
+        order = np.argsort(src)
+        block = np.empty((len(src),) + dataset.shape[1:], dtype=dataset.dtype)
+        block[order] = dataset[src[order]]
+        shuffled[start : start + len(src)] = block
+    for attr_key, attr_value in dataset.attrs.items():
+        shuffled.attrs[attr_key] = attr_value
+    del h5_obj[key]
+    h5_obj.move(tmp_key, key)
+
+
 def _repr(x):
     try:
         return x.__repr__()
@@ -1050,7 +1137,11 @@ class ContainerBase(dict, abc.ABC):
 
     @staticmethod
     def cont_from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        lazy=False,
     ):
         """Load container object from disk, as an h5py file, at the specified hdf5
         filepath.
@@ -1067,6 +1158,11 @@ class ContainerBase(dict, abc.ABC):
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        lazy
+            Whether to defer reading the datasets. If ``True``, the leaves of the
+            returned container are handles to the hdf5 datasets, which are only read
+            from disk when accessed by key or key chain, or when the container is
+            sliced along the batch dimension. Default is ``False``.
 
         Returns
         -------
@@ -1087,12 +1183,13 @@ class ContainerBase(dict, abc.ABC):
         for key, value in items:
             if isinstance(value, h5py.Group):
                 container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
+                    value, slice_obj, alphabetical_keys, ivyh, lazy
                 )
             elif isinstance(value, h5py.Dataset):
-                container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj])
-                )
+                if lazy:
+                    container_dict[key] = _LazyH5Dataset(value, slice_obj, ivyh)
+                else:
+                    container_dict[key] = ivy.default(ivyh, ivy).array(value[slice_obj])
             else:
                 raise ivy.exceptions.IvyException(
                     "Item found inside h5_obj which was neither a Group nor a Dataset."
@@ -1184,16 +1281,22 @@ class ContainerBase(dict, abc.ABC):
         return size, batch_size
 
     @staticmethod
-    def shuffle_h5_file(h5_obj_or_filepath, seed_value=0):
+    def shuffle_h5_file(h5_obj_or_filepath, seed_value=0, block_size=None):
         """Shuffle entries in all datasets of h5 file, such that they are still aligned
         along axis 0.
 
+        The same permutation is applied to every dataset. Each dataset is rewritten
+        block by block, so at most ``block_size`` rows are held in memory at once.
+
         Parameters
         ----------
         h5_obj_or_filepath
             Filepath where the container object is saved to disk, or h5 object.
         seed_value
             random seed to use for array shuffling (Default value = 0)
+        block_size
+            Number of rows to permute at once. Default is ``None``, in which case
+            it is chosen so that each block is at most 64MB.
 
         """
         ivy.assertions.check_exists(
@@ -1208,13 +1311,11 @@ class ContainerBase(dict, abc.ABC):
         else:
             h5_obj = h5_obj_or_filepath
 
-        for key, value in h5_obj.items():
+        for key, value in list(h5_obj.items()):
             if isinstance(value, h5py.Group):
-                ivy.Container.shuffle_h5_file(value, seed_value)
+                ivy.Container.shuffle_h5_file(value, seed_value, block_size)
             elif isinstance(value, h5py.Dataset):
-                random.seed(seed_value)
-                # noinspection PyTypeChecker
-                random.shuffle(value)
+                _shuffle_h5_dataset(h5_obj, key, seed_value, block_size)
             else:
                 raise ivy.exceptions.IvyException(
                     "Item found inside h5_obj which was neither a Group nor a Dataset."
@@ -3857,6 +3958,8 @@ class ContainerBase(dict, abc.ABC):
     def __getattr__(self, item, *args, **kwargs):
         try:
             ret = dict.__getitem__(self, item)
+            if isinstance(ret, _LazyH5Dataset):
+                ret = ret.to_array()
         except KeyError:
             # noinspection PyUnresolvedReferences
             ret = ivy.Container()
@@ -3948,6 +4051,8 @@ class ContainerBase(dict, abc.ABC):
                 ret = self.cont_at_key_chain(query)
                 return ret
             ret = dict.__getitem__(self, query)
+            if isinstance(ret, _LazyH5Dataset):
+                return ret.to_array()
             return ret
         elif ivy.exists(self._queues):
             ret = self._get_queue_item(query)
@@ -297,6 +297,8 @@ class ContainerWithLayers(ContainerBase):
         /,
         *,
         mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
+        is_causal: bool = False,
+        chunk_size: Optional[int] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -330,6 +332,14 @@ class ContainerWithLayers(ContainerBase):
             The mask input array/container. The mask to apply to the query-key values.
             Default is None. The shape of mask input array leaves should be in
             *[batch_shape,num_queries,num_keys]*.
+        is_causal
+            Whether each query only attends to the keys at or before its own
+            position, with the last query aligned with the last key.
+            Default is ``False``.
+        chunk_size
+            If given, the keys and values are processed in chunks of this many keys,
+            with a running softmax, to bound the memory of the similarities.
+            Default is ``None``.
         key_chains
             The key-chains to apply or not apply the method to. Default is ``None``.
         to_apply
@@ -393,6 +403,8 @@ class ContainerWithLayers(ContainerBase):
             v,
             scale,
             mask=mask,
+            is_causal=is_causal,
+            chunk_size=chunk_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -408,6 +420,8 @@ class ContainerWithLayers(ContainerBase):
         /,
         *,
         mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
+        is_causal: bool = False,
+        chunk_size: Optional[int] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -441,6 +455,14 @@ class ContainerWithLayers(ContainerBase):
             The mask input array/container. The mask to apply to the query-key values.
             Default is None. The shape of mask input array leaves should be in
             *[batch_shape,num_queries,num_keys]*.
+        is_causal
+            Whether each query only attends to the keys at or before its own
+            position, with the last query aligned with the last key.
+            Default is ``False``.
+        chunk_size
+            If given, the keys and values are processed in chunks of this many keys,
+            with a running softmax, to bound the memory of the similarities.
+            Default is ``None``.
         key_chains
             The key-chains to apply or not apply the method to. Default is ``None``.
         to_apply
@@ -502,6 +524,8 @@ class ContainerWithLayers(ContainerBase):
             v,
             scale,
             mask=mask,
+            is_causal=is_causal,
+            chunk_size=chunk_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -524,6 +548,8 @@ class ContainerWithLayers(ContainerBase):
         to_q_v=None,
         to_kv_v=None,
         to_out_v=None,
+        is_causal: bool = False,
+        chunk_size: Optional[int] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -543,6 +569,8 @@ class ContainerWithLayers(ContainerBase):
             to_q_v=to_q_v,
             to_kv_v=to_kv_v,
             to_out_v=to_out_v,
+            is_causal=is_causal,
+            chunk_size=chunk_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -564,6 +592,8 @@ class ContainerWithLayers(ContainerBase):
         to_q_v=None,
         to_kv_v=None,
         to_out_v=None,
+        is_causal: bool = False,
+        chunk_size: Optional[int] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -582,6 +612,8 @@ class ContainerWithLayers(ContainerBase):
             to_q_v=to_q_v,
             to_kv_v=to_kv_v,
             to_out_v=to_out_v,
+            is_causal=is_causal,
+            chunk_size=chunk_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -21,6 +21,7 @@ class ContainerWithRandom(ContainerBase):
         device: Optional[Union[ivy.Device, ivy.NativeDevice, ivy.Container]] = None,
         dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype, ivy.Container]] = None,
         seed: Optional[int] = None,
+        key: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         out: Optional[ivy.Container] = None,
     ) -> ivy.Container:
         """ivy.Container static method variant of ivy.random_uniform. This method
@@ -60,6 +61,10 @@ class ContainerWithRandom(ContainerBase):
             type will be the default floating-point data type. Default ``None``
         seed
             A python integer. Used to create a random seed distribution
+        key
+            A key of the counter-based generator, as returned by ``ivy.PRNGKey``,
+            or a container of keys, one for each leaf. If given, ``seed`` is
+            ignored. Default is ``None``.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -104,6 +109,7 @@ class ContainerWithRandom(ContainerBase):
             device=device,
             dtype=dtype,
             seed=seed,
+            key=key,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -124,6 +130,7 @@ class ContainerWithRandom(ContainerBase):
         device: Optional[Union[ivy.Device, ivy.NativeDevice, ivy.Container]] = None,
         dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype, ivy.Container]] = None,
         seed: Optional[int] = None,
+        key: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         out: Optional[ivy.Container] = None,
     ) -> ivy.Container:
         """ivy.Container instance method variant of ivy.random_uniform. This method
@@ -163,6 +170,10 @@ class ContainerWithRandom(ContainerBase):
             type will be the default floating-point data type. Default ``None``
         seed
             A python integer. Used to create a random seed distribution
+        key
+            A key of the counter-based generator, as returned by ``ivy.PRNGKey``,
+            or a container of keys, one for each leaf. If given, ``seed`` is
+            ignored. Default is ``None``.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -294,6 +305,7 @@ class ContainerWithRandom(ContainerBase):
             device=device,
             dtype=dtype,
             seed=seed,
+            key=key,
             out=out,
         )
 
@@ -310,6 +322,7 @@ class ContainerWithRandom(ContainerBase):
         device: Optional[Union[ivy.Device, ivy.NativeDevice, ivy.Container]] = None,
         dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype, ivy.Container]] = None,
         seed: Optional[int] = None,
+        key: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         out: Optional[ivy.Container] = None,
     ) -> ivy.Container:
         """ivy.Container static method variant of ivy.random_normal. This method
@@ -347,6 +360,10 @@ class ContainerWithRandom(ContainerBase):
              type will be the default floating-point data type. Default ``None``
         seed
             A python integer. Used to create a random seed distribution
+        key
+            A key of the counter-based generator, as returned by ``ivy.PRNGKey``,
+            or a container of keys, one for each leaf. If given, ``seed`` is
+            ignored. Default is ``None``.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -391,6 +408,7 @@ class ContainerWithRandom(ContainerBase):
             device=device,
             dtype=dtype,
             seed=seed,
+            key=key,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -411,6 +429,7 @@ class ContainerWithRandom(ContainerBase):
         device: Optional[Union[ivy.Device, ivy.NativeDevice, ivy.Container]] = None,
         dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype, ivy.Container]] = None,
         seed: Optional[int] = None,
+        key: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         out: Optional[ivy.Container] = None,
     ) -> ivy.Container:
         """ivy.Container instance method variant of ivy.random_normal. This method
@@ -448,6 +467,10 @@ class ContainerWithRandom(ContainerBase):
             type will be the default floating-point data type. Default ``None``
         seed
             A python integer. Used to create a random seed distribution
+        key
+            A key of the counter-based generator, as returned by ``ivy.PRNGKey``,
+            or a container of keys, one for each leaf. If given, ``seed`` is
+            ignored. Default is ``None``.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -580,6 +603,7 @@ class ContainerWithRandom(ContainerBase):
             device=device,
             dtype=dtype,
             seed=seed,
+            key=key,
             out=out,
         )
 
@@ -598,6 +622,7 @@ class ContainerWithRandom(ContainerBase):
         map_sequences: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
         seed: Optional[int] = None,
+        key: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         out: Optional[ivy.Container] = None,
     ) -> ivy.Container:
         """ivy.Container static method variant of ivy.multinomial. This method
@@ -633,6 +658,10 @@ class ContainerWithRandom(ContainerBase):
             (Default value = None)
         seed
             A python integer. Used to create a random seed distribution
+        key
+            A key of the counter-based generator, as returned by ``ivy.PRNGKey``,
+            or a container of keys, one for each leaf. If given, ``seed`` is
+            ignored. Default is ``None``.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -655,6 +684,7 @@ class ContainerWithRandom(ContainerBase):
             map_sequences=map_sequences,
             device=device,
             seed=seed,
+            key=key,
             out=out,
         )
 
@@ -672,6 +702,7 @@ class ContainerWithRandom(ContainerBase):
         map_sequences: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
         seed: Optional[int] = None,
+        key: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         out: Optional[ivy.Container] = None,
     ) -> ivy.Container:
         """ivy.Container instance method variant of ivy.multinomial. This method
@@ -707,6 +738,10 @@ class ContainerWithRandom(ContainerBase):
             (Default value = None)
         seed
             A python integer. Used to create a random seed distribution
+        key
+            A key of the counter-based generator, as returned by ``ivy.PRNGKey``,
+            or a container of keys, one for each leaf. If given, ``seed`` is
+            ignored. Default is ``None``.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -728,6 +763,7 @@ class ContainerWithRandom(ContainerBase):
             map_sequences=map_sequences,
             device=device,
             seed=seed,
+            key=key,
             out=out,
         )
 
@@ -745,6 +781,7 @@ class ContainerWithRandom(ContainerBase):
         device: Optional[Union[ivy.Device, ivy.NativeDevice, ivy.Container]] = None,
         dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype, ivy.Container]] = None,
         seed: Optional[int] = None,
+        key: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         out: Optional[ivy.Container] = None,
     ) -> ivy.Container:
         """ivy.Container static method variant of ivy.randint. This method
@@ -781,6 +818,10 @@ class ContainerWithRandom(ContainerBase):
              type will be the default integer data type. Default ``None``
         seed
             A python integer. Used to create a random seed distribution
+        key
+            A key of the counter-based generator, as returned by ``ivy.PRNGKey``,
+            or a container of keys, one for each leaf. If given, ``seed`` is
+            ignored. Default is ``None``.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -829,6 +870,7 @@ class ContainerWithRandom(ContainerBase):
             prune_unapplied=prune_unapplied,
             map_sequences=map_sequences,
             seed=seed,
+            key=key,
             out=out,
         )
 
@@ -845,6 +887,7 @@ class ContainerWithRandom(ContainerBase):
         device: Optional[Union[ivy.Device, ivy.NativeDevice, ivy.Container]] = None,
         dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype, ivy.Container]] = None,
         seed: Optional[int] = None,
+        key: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         out: Optional[ivy.Container] = None,
     ) -> ivy.Container:
         """ivy.Container instance method variant of ivy.randint. This method
@@ -881,6 +924,10 @@ class ContainerWithRandom(ContainerBase):
              type will be the default integer data type. Default ``None``
         seed
             A python integer. Used to create a random seed distribution
+        key
+            A key of the counter-based generator, as returned by ``ivy.PRNGKey``,
+            or a container of keys, one for each leaf. If given, ``seed`` is
+            ignored. Default is ``None``.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -1014,6 +1061,7 @@ class ContainerWithRandom(ContainerBase):
             device=device,
             dtype=dtype,
             seed=seed,
+            key=key,
             out=out,
         )
 
@@ -1023,6 +1071,7 @@ class ContainerWithRandom(ContainerBase):
         /,
         *,
         seed: Optional[int] = None,
+        key: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -1039,6 +1088,10 @@ class ContainerWithRandom(ContainerBase):
             Input array or container. Should have a numeric data type.
         seed
             A python integer. Used to create a random seed distribution
+        key
+            A key of the counter-based generator, as returned by ``ivy.PRNGKey``,
+            or a container of keys, one for each leaf. If given, ``seed`` is
+            ignored. Default is ``None``.
         key_chains
             The key-chains to apply or not apply the method to. Default is ``None``.
         to_apply
@@ -1073,6 +1126,7 @@ class ContainerWithRandom(ContainerBase):
             "shuffle",
             x,
             seed=seed,
+            key=key,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -1085,6 +1139,7 @@ class ContainerWithRandom(ContainerBase):
         /,
         *,
         seed: Optional[int] = None,
+        key: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -1101,6 +1156,10 @@ class ContainerWithRandom(ContainerBase):
             Input container. Should have a numeric data type.
         seed
             A python integer. Used to create a random seed distribution
+        key
+            A key of the counter-based generator, as returned by ``ivy.PRNGKey``,
+            or a container of keys, one for each leaf. If given, ``seed`` is
+            ignored. Default is ``None``.
         key_chains
             The key-chains to apply or not apply the method to. Default is ``None``.
         to_apply
@@ -1134,6 +1193,7 @@ class ContainerWithRandom(ContainerBase):
         return self.static_shuffle(
             self,
             seed=seed,
+            key=key,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
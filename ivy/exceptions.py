@@ -116,6 +116,9 @@ def handle_exceptions(fn: Callable) -> Callable:
         """
         try:
             return fn(*args, **kwargs)
+        except ivy.batching.BatchingRuleError:
+            # vmap falls back to calling the function on each example
+            raise
         except (IndexError, ValueError, AttributeError) as e:
             _print_traceback_history()
             raise ivy.exceptions.IvyError(fn.__name__, str(e))
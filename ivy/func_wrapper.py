@@ -2,8 +2,9 @@ import ivy
 import functools
 import logging
 from types import FunctionType
-from typing import Callable
+from typing import Callable, List
 import inspect
+from ivy.batching import BatchedArray, apply_batching_rule
 
 # import typing
 
@@ -29,21 +30,52 @@ FN_DECORATORS = [
 # --------#
 
 
-def _get_first_array(*args, **kwargs):
-    # ToDo: make this more efficient, with function ivy.nested_nth_index_where
-    arr = None
-    if args:
-        arr_idxs = ivy.nested_argwhere(args, ivy.is_array, stop_after_n_found=1)
-        if arr_idxs:
-            arr = ivy.index_nest(args, arr_idxs[0])
+_LEAF_TYPES = (int, float, complex, str, type(None))
+
+
+def _find_first_leaf(nest, fn, include_derived=True):
+    """
+    Searches `nest` depth-first for the first leaf for which `fn` evaluates as True,
+    stopping as soon as it is found and without building any nest indices.
+
+    Parameters
+    ----------
+    nest
+        The list, tuple or dict to search.
+    fn
+        The condition function, returning True or False.
+    include_derived
+        Whether to also recurse into classes derived from list, tuple and dict.
+        Default is ``True``.
+
+    Returns
+    -------
+        The first leaf for which `fn` is True, or None if there is no such leaf.
+    """
+    if isinstance(nest, dict):
+        nest = nest.values()
+    for item in nest:
+        if include_derived:
+            is_nest = isinstance(item, (list, tuple, dict))
         else:
-            arr_idxs = ivy.nested_argwhere(kwargs, ivy.is_array, stop_after_n_found=1)
-            if arr_idxs:
-                arr = ivy.index_nest(kwargs, arr_idxs[0])
-    elif kwargs:
-        arr_idxs = ivy.nested_argwhere(kwargs, ivy.is_array, stop_after_n_found=1)
-        if arr_idxs:
-            arr = ivy.index_nest(kwargs, arr_idxs[0])
+            is_nest = type(item) in (list, tuple, dict)
+        if is_nest:
+            found = _find_first_leaf(item, fn, include_derived)
+            if found is not None:
+                return found
+        elif fn(item):
+            return item
+    return None
+
+
+def _is_array_leaf(x):
+    return not isinstance(x, _LEAF_TYPES) and ivy.is_array(x)
+
+
+def _get_first_array(*args, **kwargs):
+    arr = _find_first_leaf(args, _is_array_leaf) if args else None
+    if arr is None and kwargs:
+        arr = _find_first_leaf(kwargs, _is_array_leaf)
     return arr
 
 
@@ -51,34 +83,64 @@ def _get_first_array(*args, **kwargs):
 # ---------------#
 
 
-def handle_array_like(fn: Callable) -> Callable:
-    @functools.wraps(fn)
-    def new_fn(*args, **kwargs):
-        args = list(args)
-        num_args = len(args)
-        try:
-            type_hints = dict(inspect.signature(fn).parameters)
-        except TypeError:
-            return fn(*args, **kwargs)
-        parameters = [param.name for param in type_hints.values()]
-        annotations = [param.annotation for param in type_hints.values()]
+def _get_array_like_params(fn: Callable):
+    """
+    Finds the parameters of `fn` which are annotated as arrays, but not as sequences
+    of arrays, and which therefore accept array-like lists and tuples.
 
-        for i, (annotation, parameter, arg) in enumerate(
-            zip(annotations, parameters, args)
+    Parameters
+    ----------
+    fn
+        The function to inspect.
+
+    Returns
+    -------
+        The positional indices and the keyword names of the array-like parameters.
+    """
+    try:
+        parameters = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return (), ()
+    positions = list()
+    names = list()
+    for i, param in enumerate(parameters):
+        annotation_str = str(param.annotation)
+        if "Array" in annotation_str and all(
+            sq not in annotation_str for sq in ["Sequence", "List", "Tuple"]
         ):
-            annotation_str = str(annotation)
-            if "Array" in annotation_str and all(
-                sq not in annotation_str for sq in ["Sequence", "List", "Tuple"]
-            ):
+            if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+                positions.append(i)
+            if param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY):
+                names.append(param.name)
+    return tuple(positions), tuple(names)
+
+
+def _has_array_like_args(args, kwargs, positions, names):
+    num_args = len(args)
+    for i in positions:
+        if i < num_args and isinstance(args[i], (list, tuple)):
+            return True
+    for name in names:
+        if name in kwargs and isinstance(kwargs[name], (list, tuple)):
+            return True
+    return False
+
 
-                if i < num_args:
-                    if isinstance(arg, (list, tuple)):
-                        args[i] = ivy.array(arg)
-                elif parameters in kwargs:
-                    kwarg = kwargs[parameter]
-                    if isinstance(kwarg, (list, tuple)):
-                        kwargs[parameter] = ivy.array(kwarg)
+def handle_array_like(fn: Callable) -> Callable:
+    # the signature is only inspected once, when the function is wrapped
+    positions, names = _get_array_like_params(fn)
 
+    @functools.wraps(fn)
+    def new_fn(*args, **kwargs):
+        if positions:
+            args = list(args)
+            num_args = len(args)
+            for i in positions:
+                if i < num_args and isinstance(args[i], (list, tuple)):
+                    args[i] = ivy.array(args[i])
+        for name in names:
+            if name in kwargs and isinstance(kwargs[name], (list, tuple)):
+                kwargs[name] = ivy.array(kwargs[name])
         return fn(*args, **kwargs)
 
     new_fn.handle_array_like = True
@@ -285,7 +347,15 @@ def infer_dtype(fn: Callable) -> Callable:
             The return of the function, with `dtype` passed explicitly.
         """
         # find the first array argument, if required
-        arr = None if ivy.exists(dtype) else _get_first_array(*args, **kwargs)
+        if ivy.exists(dtype):
+            arr = None
+        elif "key" in kwargs:
+            # the key of a random function has no bearing on the dtype of its samples
+            arr = _get_first_array(
+                *args, **{k: v for k, v in kwargs.items() if k != "key"}
+            )
+        else:
+            arr = _get_first_array(*args, **kwargs)
         # infer the correct data type
         dtype = ivy.default_dtype(dtype=dtype, item=arr, as_native=True)
         # call the function with dtype provided explicitly
@@ -466,6 +536,183 @@ def handle_nestable(fn: Callable) -> Callable:
     return new_fn
 
 
+# Dispatch #
+# ---------#
+
+# flags describing the argument signature of a call, computed by `_classify_args`
+_HAS_IVY_ARRAY = 1
+_HAS_OTHER = 2
+_HAS_CONTAINER = 4
+_HAS_SEQUENCE = 8
+_HAS_DICT = 16
+_HAS_OUT = 32
+_HAS_NAN_POLICY = 64
+_HAS_ARRAY_LIKE = 128
+_HAS_BATCHED = 256
+
+# flags for which the arguments are not flat, and must be converted with nested maps
+_NESTED_FLAGS = _HAS_CONTAINER | _HAS_SEQUENCE | _HAS_DICT
+
+# decorators which can be left out of a dispatch plan, mapped to the flags for which
+# they are required. decorators not listed here are always applied.
+_DECORATOR_FLAGS = {
+    "handle_array_like": _HAS_ARRAY_LIKE,
+    "handle_nans": _HAS_NAN_POLICY,
+    "handle_nestable": _HAS_CONTAINER,
+    "handle_out_argument": _HAS_OUT,
+    "inputs_to_native_arrays": _HAS_IVY_ARRAY | _NESTED_FLAGS,
+    "inputs_to_ivy_arrays": _HAS_OTHER | _NESTED_FLAGS,
+}
+
+
+def _classify_nest(x):
+    if isinstance(x, _LEAF_TYPES):
+        return 0
+    if isinstance(x, ivy.Array):
+        return _HAS_IVY_ARRAY
+    if isinstance(x, ivy.Container):
+        return _HAS_CONTAINER
+    if isinstance(x, (list, tuple)):
+        flags = 0
+        for item in x:
+            flags |= _classify_nest(item)
+        return flags
+    if isinstance(x, dict):
+        flags = 0
+        for item in x.values():
+            flags |= _classify_nest(item)
+        return flags
+    if isinstance(x, BatchedArray):
+        return _HAS_BATCHED
+    # anything else may be a native array
+    return _HAS_OTHER
+
+
+def _classify_arg(arg):
+    if isinstance(arg, (list, tuple)):
+        return _HAS_SEQUENCE | _classify_nest(arg)
+    if isinstance(arg, dict) and not isinstance(arg, ivy.Container):
+        return _HAS_DICT | _classify_nest(arg)
+    return _classify_nest(arg)
+
+
+def _classify_args(args, kwargs):
+    """
+    Computes the argument signature of a call in a single pass over the positional
+    and keyword arguments.
+
+    Parameters
+    ----------
+    args
+        The positional arguments of the call.
+    kwargs
+        The keyword arguments of the call.
+
+    Returns
+    -------
+        Integer bit flags indicating whether the arguments contain ivy arrays,
+        containers, top-level sequences or dicts, other (possibly native) objects, and
+        a non-None ``out`` argument, or batched arrays of ``ivy.vmap``.
+    """
+    flags = 0
+    for arg in args:
+        flags |= _classify_arg(arg)
+    for key, arg in kwargs.items():
+        if key == "out":
+            if arg is not None:
+                flags |= _HAS_OUT
+            continue
+        flags |= _classify_arg(arg)
+    return flags
+
+
+# wraps the backend function at the core of each dispatch plan when set, such as by
+# ivy.Profiler to time the backend kernels, with the plans cleared when it changes
+_backend_fn_hook = None
+
+
+def _fused_dispatcher(to_wrap: Callable, decorators: List[str]) -> Callable:
+    """
+    Wraps `to_wrap` into a single dispatcher which classifies the arguments of each
+    call, and then calls `to_wrap` wrapped with only those of `decorators` which the
+    argument signature requires. The resulting decorator chains (dispatch plans) are
+    built lazily and cached by argument signature. Flat ivy array arguments are
+    converted to native arrays by the dispatcher itself, without any nested mapping.
+    Calls with the batched arrays of ``ivy.vmap`` are handed to the batching rule of
+    the function.
+
+    Parameters
+    ----------
+    to_wrap
+        The function to wrap.
+    decorators
+        The names of the decorators to apply to `to_wrap`, in wrapping order.
+
+    Returns
+    -------
+        The dispatcher, which behaves as `to_wrap` wrapped with all of `decorators`.
+    """
+    plans = dict()
+    handles_out = "handle_out_argument" in decorators
+    handles_array_like = "handle_array_like" in decorators
+    if handles_array_like:
+        array_like_positions, array_like_names = _get_array_like_params(to_wrap)
+    converts_inline = (
+        "inputs_to_native_arrays" in decorators
+        and "inputs_to_ivy_arrays" not in decorators
+    )
+
+    def _build_plan(flags):
+        fn = to_wrap if _backend_fn_hook is None else _backend_fn_hook(to_wrap)
+        for attr in decorators:
+            required_flags = _DECORATOR_FLAGS.get(attr)
+            if required_flags is None or flags & required_flags:
+                fn = getattr(ivy, attr)(fn)
+        plans[flags] = fn
+        return fn
+
+    @functools.wraps(to_wrap)
+    def new_fn(*args, **kwargs):
+        flags = _classify_args(args, kwargs)
+        if flags & _HAS_BATCHED:
+            return apply_batching_rule(new_fn, to_wrap.__name__, args, kwargs)
+        if ivy.get_nan_policy() != "nothing":
+            flags |= _HAS_NAN_POLICY
+        if (
+            handles_array_like
+            and flags & _HAS_SEQUENCE
+            and _has_array_like_args(
+                args, kwargs, array_like_positions, array_like_names
+            )
+        ):
+            flags |= _HAS_ARRAY_LIKE
+        if handles_out and not flags & _HAS_OUT:
+            kwargs.pop("out", None)
+        if (
+            converts_inline
+            and flags & _HAS_IVY_ARRAY
+            and not flags & _NESTED_FLAGS
+            and ivy.get_array_mode()
+        ):
+            # flat arguments, convert the ivy arrays to native arrays directly
+            args = [arg.data if isinstance(arg, ivy.Array) else arg for arg in args]
+            kwargs = {
+                k: v.data if isinstance(v, ivy.Array) and k != "out" else v
+                for k, v in kwargs.items()
+            }
+            flags ^= _HAS_IVY_ARRAY
+        try:
+            fn = plans[flags]
+        except KeyError:
+            fn = _build_plan(flags)
+        return fn(*args, **kwargs)
+
+    for attr in decorators:
+        setattr(new_fn, attr, True)
+    new_fn._dispatch_plans = plans
+    return new_fn
+
+
 # Functions #
 
 
@@ -533,9 +780,13 @@ def _wrap_function(
             for attr in to_replace[compositional]:
                 setattr(original, attr, True)
 
-        for attr in FN_DECORATORS:
-            if hasattr(original, attr) and not hasattr(to_wrap, attr):
-                to_wrap = getattr(ivy, attr)(to_wrap)
+        decorators = [
+            attr
+            for attr in FN_DECORATORS
+            if hasattr(original, attr) and not hasattr(to_wrap, attr)
+        ]
+        if decorators:
+            to_wrap = _fused_dispatcher(to_wrap, decorators)
     return to_wrap
 
 
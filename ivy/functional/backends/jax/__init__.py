@@ -10,8 +10,9 @@ from typing import Union
 from jaxlib.xla_extension import Buffer
 
 # make ivy.Container compatible with jax pytree traversal
-from jax.tree_util import register_pytree_node
-from jax.tree_util import tree_flatten, tree_unflatten
+# (its functions aren't imported by name, as backend attributes named like ivy
+# functions, such as tree_flatten, would replace them in the ivy namespace)
+from jax import tree_util
 
 # local
 import ivy
@@ -20,10 +21,10 @@ backend_version = {"version": jax.__version__}
 
 config.update("jax_enable_x64", True)
 
-register_pytree_node(
+tree_util.register_pytree_node(
     ivy.Container,
-    lambda c: tree_flatten(c.cont_to_dict()),
-    lambda a, c: ivy.Container(tree_unflatten(a, c)),
+    lambda c: tree_util.tree_flatten(c.cont_to_dict()),
+    lambda a, c: ivy.Container(tree_util.tree_unflatten(a, c)),
 )
 
 # noinspection PyUnresolvedReferences
@@ -124,12 +124,8 @@ class Profiler(BaseProfiler):
 
     def start(self):
         jax.profiler.start_trace(self._save_dir)
+        super(Profiler, self).start()
 
     def stop(self):
+        super(Profiler, self).stop()
         jax.profiler.stop_trace()
-
-    def __enter__(self):
-        self.start()
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.stop()
@@ -1,6 +1,7 @@
 """Collection of Jax network layers, wrapped to fit Ivy syntax and signature."""
 
 # global
+import jax
 import jax.lax as jlax
 import jax.numpy as jnp
 
@@ -403,3 +404,40 @@ def conv_general_transpose(
     if data_format == "channel_first":
         return jnp.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+def lstm_update(
+    x: JaxArray,
+    init_h: JaxArray,
+    init_c: JaxArray,
+    kernel: JaxArray,
+    recurrent_kernel: JaxArray,
+    /,
+    *,
+    bias: Optional[JaxArray] = None,
+    recurrent_bias: Optional[JaxArray] = None,
+) -> Tuple[JaxArray, JaxArray]:
+    # input kernel, with the biases of both kernels, for all timesteps at once
+    Wi_x = jnp.matmul(x, kernel)
+    if bias is not None:
+        Wi_x = Wi_x + bias
+    if recurrent_bias is not None:
+        Wi_x = Wi_x + recurrent_bias
+    dtype = jnp.result_type(Wi_x, recurrent_kernel, init_h, init_c)
+
+    def _step(state, Wi_xt):
+        ht, ct = state
+        # BS x 4*out, with the input, forget, cell and output gates
+        gates = Wi_xt + jnp.matmul(ht, recurrent_kernel)
+        it, ft, gt, ot = jnp.split(gates, 4, axis=-1)
+        ct = jax.nn.sigmoid(ft) * ct + jax.nn.sigmoid(it) * jnp.tanh(gt)
+        ht = jax.nn.sigmoid(ot) * jnp.tanh(ct)
+        return (ht, ct), ht
+
+    # scan over the time dimension, moved to the front
+    (_, ct), hts = jlax.scan(
+        _step,
+        (init_h.astype(dtype), init_c.astype(dtype)),
+        jnp.moveaxis(Wi_x.astype(dtype), -2, 0),
+    )
+    return jnp.moveaxis(hts, 0, -2), ct
@@ -12,6 +12,11 @@ from ivy.functional.ivy.random import (
     _check_bounds_and_get_shape,
     _randint_check_dtype_and_bound,
     _check_valid_scale,
+    _random_uniform_from_key,
+    _random_normal_from_key,
+    _multinomial_from_key,
+    _randint_from_key,
+    _shuffle_from_key,
 )
 from ivy.functional.backends.jax import JaxArray
 from ivy.functional.backends.jax.device import to_device
@@ -48,9 +53,12 @@ def random_uniform(
     device: jaxlib.xla_extension.Device,
     dtype: jnp.dtype,
     seed: Optional[int] = None,
+    key: Optional[JaxArray] = None,
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
     shape = _check_bounds_and_get_shape(low, high, shape)
+    if key is not None:
+        return _random_uniform_from_key(key, low, high, shape, dtype, device)
 
     if seed:
         rng_input = jax.random.PRNGKey(seed)
@@ -72,10 +80,13 @@ def random_normal(
     device: jaxlib.xla_extension.Device,
     dtype: jnp.dtype,
     seed: Optional[int] = None,
+    key: Optional[JaxArray] = None,
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
     _check_valid_scale(std)
     shape = _check_bounds_and_get_shape(mean, std, shape)
+    if key is not None:
+        return _random_normal_from_key(key, mean, std, shape, dtype, device)
 
     if seed:
         rng_input = jax.random.PRNGKey(seed)
@@ -103,8 +114,13 @@ def multinomial(
     replace: bool = True,
     device: jaxlib.xla_extension.Device,
     seed: Optional[int] = None,
+    key: Optional[JaxArray] = None,
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
+    if key is not None:
+        return _multinomial_from_key(
+            key, population_size, num_samples, batch_size, probs, replace, device
+        )
 
     RNG_, rng_input = jax.random.split(_getRNG())
     _setRNG(RNG_)
@@ -149,6 +165,7 @@ def randint(
     device: jaxlib.xla_extension.Device,
     dtype: Optional[Union[jnp.dtype, ivy.Dtype]] = None,
     seed: Optional[int] = None,
+    key: Optional[JaxArray] = None,
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
     if not dtype:
@@ -156,6 +173,8 @@ def randint(
     dtype = ivy.as_native_dtype(dtype)
     _randint_check_dtype_and_bound(low, high, dtype)
     shape = _check_bounds_and_get_shape(low, high, shape)
+    if key is not None:
+        return _randint_from_key(key, low, high, shape, dtype, device)
 
     if seed:
         rng_input = jax.random.PRNGKey(seed)
@@ -171,8 +190,15 @@ def seed(*, seed_value: int = 0) -> None:
 
 
 def shuffle(
-    x: JaxArray, /, *, seed: Optional[int] = None, out: Optional[JaxArray] = None
+    x: JaxArray,
+    /,
+    *,
+    seed: Optional[int] = None,
+    key: Optional[JaxArray] = None,
+    out: Optional[JaxArray] = None,
 ) -> JaxArray:
+    if key is not None:
+        return _shuffle_from_key(key, x)
 
     if seed:
         rng_input = jax.random.PRNGKey(seed)
@@ -1,14 +1,11 @@
 """Collection of Numpy general functions, wrapped to fit Ivy syntax and signature."""
 
 # global
-import os
-import time
 import numpy as np
 from typing import Union, Optional, Any
 
 # local
 import ivy
-from ivy.functional.ivy.device import Profiler as BaseProfiler
 
 
 def dev(x: np.ndarray, /, *, as_native: bool = False) -> Union[ivy.Device, str]:
@@ -78,25 +75,3 @@ def to_device(
                 "[ 'cpu:idx' | 'gpu:idx' ], but found {}".format(device)
             )
     return x
-
-
-class Profiler(BaseProfiler):
-    def __init__(self, save_dir: str):
-        # ToDO: add proper numpy profiler
-        super(Profiler, self).__init__(save_dir)
-        os.makedirs(save_dir, exist_ok=True)
-        self._start_time = None
-
-    def start(self):
-        self._start_time = time.perf_counter()
-
-    def stop(self):
-        time_taken = time.perf_counter() - self._start_time
-        with open(os.path.join(self._save_dir, "profile.log"), "w+") as f:
-            f.write("took {} seconds to complete".format(time_taken))
-
-    def __enter__(self):
-        self.start()
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.stop()
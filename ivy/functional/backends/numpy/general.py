@@ -10,6 +10,7 @@ from numbers import Number
 
 # local
 import ivy
+from ivy.batching import batched_call
 from ivy.functional.backends.numpy.device import _to_device
 
 
@@ -46,6 +47,33 @@ def to_list(x: np.ndarray, /) -> list:
     return x.tolist()
 
 
+def _take(params, indices, axis, out=None):
+    # np.take writes straight into out when it is a contiguous array of the same
+    # dtype, and otherwise the result is cast and copied into it
+    if out is None:
+        return np.take(params, indices, axis)
+    shape = params.shape[:axis] + np.shape(indices) + params.shape[axis + 1 :]
+    if out.dtype == params.dtype and out.flags.c_contiguous:
+        np.take(params, indices, axis, out=out.reshape(shape))
+    else:
+        np.copyto(
+            out, np.take(params, indices, axis).reshape(out.shape), casting="unsafe"
+        )
+    return out
+
+
+def _normalize_indices(indices, sizes):
+    # the indices into rows of params which are stacked along a single axis must
+    # be in bounds, as they would otherwise index into neighbouring rows
+    if np.any((indices < -sizes) | (indices >= sizes)):
+        raise ivy.exceptions.IvyException(
+            "indices are out of bounds for dimensions of size {}".format(
+                np.broadcast_to(sizes, np.shape(indices)[-1:]).tolist()
+            )
+        )
+    return np.where(indices < 0, indices + sizes, indices)
+
+
 def gather(
     params: np.ndarray,
     indices: np.ndarray,
@@ -58,55 +86,32 @@ def gather(
     axis = axis % len(params.shape)
     batch_dims = batch_dims % len(params.shape)
     ivy.assertions.check_gather_input_valid(params, indices, axis, batch_dims)
-    result = []
     if batch_dims == 0:
-        result = np.take(params, indices, axis)
-    else:
-        for b in range(batch_dims):
-            if b == 0:
-                zip_list = [(p, i) for p, i in zip(params, indices)]
-            else:
-                zip_list = [
-                    (p, i) for z in [zip(p1, i1) for p1, i1 in zip_list] for p, i in z
-                ]
-        for z in zip_list:
-            p, i = z
-            r = np.take(p, i, axis - batch_dims)
-            result.append(r)
-        result = np.array(result)
-        result = result.reshape([*params.shape[0:batch_dims], *result.shape[1:]])
-    return _to_device(result)
-
-
-def gather_nd_helper(params, indices):
-    indices_shape = indices.shape
-    params_shape = params.shape
-    if len(indices.shape) == 0:
-        num_index_dims = 1
-    else:
-        num_index_dims = indices_shape[-1]
-    result_dim_sizes_list = [
-        reduce(mul, params_shape[i + 1 :], 1) for i in range(len(params_shape) - 1)
-    ] + [1]
-    result_dim_sizes = np.array(result_dim_sizes_list)
-    implicit_indices_factor = int(result_dim_sizes[num_index_dims - 1].item())
-    flat_params = np.reshape(params, (-1,))
-    new_shape = [1] * (len(indices_shape) - 1) + [num_index_dims]
-    indices_scales = np.reshape(result_dim_sizes[0:num_index_dims], new_shape)
-    indices_for_flat_tiled = np.tile(
-        np.reshape(np.sum(indices * indices_scales, -1, keepdims=True), (-1, 1)),
-        (1, implicit_indices_factor),
+        return _to_device(_take(params, indices, axis, out=out))
+    # params is viewed as (batch, outer, axis, inner) and indices as (batch, index),
+    # and each index is offset to its own batch and outer row of the flat params
+    batch_shape = params.shape[:batch_dims]
+    outer_shape = params.shape[batch_dims:axis]
+    inner_shape = params.shape[axis + 1 :]
+    index_shape = indices.shape[batch_dims:]
+    num_batch = reduce(mul, batch_shape, 1)
+    num_outer = reduce(mul, outer_shape, 1)
+    axis_size = params.shape[axis]
+    indices = _normalize_indices(
+        np.reshape(indices, (num_batch, 1, reduce(mul, index_shape, 1))), axis_size
+    ).astype(np.int64)
+    rows = np.arange(num_batch * num_outer).reshape((num_batch, num_outer, 1))
+    offsets = rows * axis_size + indices
+    flat_params = np.reshape(
+        params, (num_batch * num_outer * axis_size, reduce(mul, inner_shape, 1))
     )
-    implicit_indices = np.tile(
-        np.expand_dims(np.arange(implicit_indices_factor), 0),
-        (indices_for_flat_tiled.shape[0], 1),
+    result = _take(flat_params, offsets, 0, out=out)
+    return _to_device(
+        np.reshape(result, batch_shape + outer_shape + index_shape + inner_shape)
     )
-    indices_for_flat = indices_for_flat_tiled + implicit_indices
-    flat_indices_for_flat = np.reshape(indices_for_flat, (-1,)).astype(np.int32)
-    flat_gather = np.take(flat_params, flat_indices_for_flat, 0)
-    new_shape = list(indices_shape[:-1]) + list(params_shape[num_index_dims:])
-    res = np.reshape(flat_gather, new_shape)
-    return res
+
+
+gather.support_native_out = True
 
 
 def gather_nd(
@@ -119,24 +124,34 @@ def gather_nd(
 ) -> np.ndarray:
     ivy.assertions.check_gather_nd_input_valid(params, indices, batch_dims)
     batch_dims = batch_dims % len(params.shape)
-    result = []
-    if batch_dims == 0:
-        result = gather_nd_helper(params, indices)
-    else:
-        for b in range(batch_dims):
-            if b == 0:
-                zip_list = [(p, i) for p, i in zip(params, indices)]
-            else:
-                zip_list = [
-                    (p, i) for z in [zip(p1, i1) for p1, i1 in zip_list] for p, i in z
-                ]
-        for z in zip_list:
-            p, i = z
-            r = gather_nd_helper(p, np.asarray(i, indices.dtype))
-            result.append(r)
-        result = np.array(result)
-        result = result.reshape([*params.shape[0:batch_dims], *result.shape[1:]])
-    return _to_device(result)
+    # params is viewed as a flat stack of the slices it is indexed into, and each
+    # index tuple is converted to the offset of its slice in its own batch
+    num_index_dims = indices.shape[-1]
+    batch_shape = params.shape[:batch_dims]
+    indexed_shape = params.shape[batch_dims : batch_dims + num_index_dims]
+    slice_shape = params.shape[batch_dims + num_index_dims :]
+    index_shape = indices.shape[batch_dims:-1]
+    num_batch = reduce(mul, batch_shape, 1)
+    num_indexed = reduce(mul, indexed_shape, 1)
+    strides = np.array(
+        [reduce(mul, indexed_shape[i + 1 :], 1) for i in range(num_index_dims)],
+        dtype=np.int64,
+    )
+    indices = _normalize_indices(
+        np.reshape(indices, (num_batch, reduce(mul, index_shape, 1), num_index_dims)),
+        np.array(indexed_shape, dtype=np.int64),
+    )
+    offsets = np.sum(indices * strides, -1, dtype=np.int64) + (
+        np.arange(num_batch).reshape((num_batch, 1)) * num_indexed
+    )
+    flat_params = np.reshape(
+        params, (num_batch * num_indexed, reduce(mul, slice_shape, 1))
+    )
+    result = _take(flat_params, offsets, 0, out=out)
+    return _to_device(np.reshape(result, batch_shape + index_shape + slice_shape))
+
+
+gather_nd.support_native_out = True
 
 
 def get_num_dims(x, /, *, as_array=False):
@@ -393,33 +408,32 @@ def vmap(
                 in_axes, message="single value in_axes should not be None"
             )
 
-        # Handling None in in_axes by broadcasting the axis_size
-        if isinstance(in_axes, (tuple, list)) and None in in_axes:
-            none_axis_index = list()
-            for index, axis in enumerate(in_axes):
-                if axis is None:
-                    none_axis_index.append(index)
-
-            for none_mapped_axis in none_axis_index:
-                args[none_mapped_axis] = np.broadcast_to(
-                    args[none_mapped_axis],
-                    (tuple(axis_size) + args[none_mapped_axis].shape),
-                )
-
         # set up the axis to be mapped to index zero.
         if isinstance(in_axes, (tuple, list)):
+            mapped = [axis is not None for axis in in_axes]
             for i in range(len(in_axes)):
                 if in_axes[i] is not None:
                     args[i] = np.moveaxis(args[i], in_axes[i], 0)
         elif isinstance(in_axes, int):
-            args[0] = np.moveaxis(args[0], in_axes, 0)
-
-        # vectorisation. To be optimized.
-        arr_results = []
-        for arrays in zip(*args):
-            single_op = func(*arrays)
-            arr_results.append(single_op)
-        res = np.stack(arr_results)
+            mapped = [True] * len(args)
+            args = [np.moveaxis(arg, in_axes, 0) for arg in args]
+
+        # vectorisation, calling func once on the whole batch
+        res = batched_call(func, args, mapped)
+
+        if res is None:
+            # func has operations without a batching rule, so it is called on each
+            # example, with the unmapped arguments broadcast by the axis_size
+            for i in range(len(args)):
+                if not mapped[i]:
+                    args[i] = np.broadcast_to(
+                        args[i], (tuple(axis_size) + np.shape(args[i]))
+                    )
+            arr_results = []
+            for arrays in zip(*args):
+                single_op = func(*arrays)
+                arr_results.append(single_op)
+            res = np.stack(arr_results)
 
         if out_axes:
             res = np.moveaxis(res, 0, out_axes)
@@ -18,6 +18,88 @@ def _add_dilations(x, dilations, axis):
     )
 
 
+# the maximum number of bytes of convolution patches to materialise at once, larger
+# batches are processed in chunks which stay within this budget
+_CONV_MEMORY_BUDGET = 2**28
+
+
+def _pad_conv_input(x, strides, filter_shape, padding):
+    # pads the spatial dimensions of a channel-last input
+    dims = len(filter_shape)
+    pads = [
+        ivy.handle_padding(x.shape[i + 1], strides[i], filter_shape[i], padding)
+        for i in range(dims)
+    ]
+    return np.pad(
+        x,
+        [(0, 0), *[(pad // 2, pad - pad // 2) for pad in pads], (0, 0)],
+        "constant",
+    )
+
+
+def _conv_patches(x, filter_shape, strides):
+    # B x O1 x .. x Od x K1 x .. x Kd x I view of a padded channel-last input, which
+    # shares the memory of x
+    dims = len(filter_shape)
+    out_shape = [
+        (x.shape[i + 1] - filter_shape[i]) // strides[i] + 1 for i in range(dims)
+    ]
+    new_shape = [x.shape[0], *out_shape, *filter_shape, x.shape[-1]]
+    new_strides = (
+        x.strides[0],
+        *[x.strides[i + 1] * strides[i] for i in range(dims)],
+        *x.strides[1:],
+    )
+    return np.lib.stride_tricks.as_strided(x, new_shape, new_strides, writeable=False)
+
+
+def _conv(x, filters, strides, feature_group_count=1, depthwise=False):
+    """
+    Convolves a padded and dilated channel-last input ``x`` with ``filters`` of shape
+    K1 x .. x Kd x I x O, or K1 x .. x Kd x I for depthwise convolutions.
+
+    The patches are contracted with the filters over the kernel and input channel
+    axes via tensordot (einsum for depthwise), and the batch is processed in chunks
+    so that at most ``_CONV_MEMORY_BUDGET`` bytes of patches are copied at once.
+    """
+    dims = filters.ndim - 1 if depthwise else filters.ndim - 2
+    filter_shape = list(filters.shape[:dims])
+    patches = _conv_patches(x, filter_shape, strides)
+    out_shape = list(patches.shape[1 : dims + 1])
+    out_dim = x.shape[-1] if depthwise else filters.shape[-1]
+    res = np.empty([x.shape[0], *out_shape, out_dim], dtype=np.result_type(x, filters))
+    patch_bytes = (
+        int(np.prod(out_shape + filter_shape)) * x.shape[-1] * x.dtype.itemsize
+    )
+    chunk_size = max(1, _CONV_MEMORY_BUDGET // max(patch_bytes, 1))
+    patch_axes = list(range(dims + 1, 2 * dims + 2))
+    filter_axes = list(range(dims + 1))
+    if depthwise:
+        out_chars = "bcdefg"[:dims]
+        kernel_chars = "hijklm"[:dims]
+        subscripts = "a{0}{1}z,{1}z->a{0}z".format(out_chars, kernel_chars)
+    in_group = filters.shape[-2]
+    out_group = out_dim // feature_group_count
+    for i in range(0, x.shape[0], chunk_size):
+        chunk = patches[i : i + chunk_size]
+        if depthwise:
+            res[i : i + chunk_size] = np.einsum(subscripts, chunk, filters)
+        elif feature_group_count == 1:
+            res[i : i + chunk_size] = np.tensordot(
+                chunk, filters, axes=(patch_axes, filter_axes)
+            )
+        else:
+            for g in range(feature_group_count):
+                res[
+                    i : i + chunk_size, ..., g * out_group : (g + 1) * out_group
+                ] = np.tensordot(
+                    chunk[..., g * in_group : (g + 1) * in_group],
+                    filters[..., g * out_group : (g + 1) * out_group],
+                    axes=(patch_axes, filter_axes),
+                )
+    return res
+
+
 def conv1d(
     x: np.ndarray,
     filters: np.ndarray,
@@ -35,20 +117,11 @@ def conv1d(
         dilations = dilations[0]
     if data_format == "NCW":
         x = np.transpose(x, (0, 2, 1))
-    x_shape = (1,) + x.shape
-    filter_shape = (1,) + filters.shape
-    x_strides = (x.strides[0],) + x.strides
-    filter_strides = (filters.strides[0],) + filters.strides
-    x = np.lib.stride_tricks.as_strided(x, shape=x_shape, strides=x_strides)
-    filters = np.lib.stride_tricks.as_strided(
-        filters, shape=filter_shape, strides=filter_strides
-    )
-    x = np.transpose(x, (1, 0, 2, 3))
-    res = conv2d(x, filters, strides, padding, data_format="NHWC", dilations=dilations)
-    res = np.transpose(res, (1, 0, 2, 3))
-    res = np.lib.stride_tricks.as_strided(
-        res, shape=res.shape[1:], strides=res.strides[1:]
-    )
+    if dilations > 1:
+        filters = _add_dilations(filters, dilations, axis=0)
+    x = _pad_conv_input(x, [strides], [filters.shape[0]], padding)
+    # B x OW x O
+    res = _conv(x, filters, [strides])
     if data_format == "NCW":
         res = np.transpose(res, (0, 2, 1))
     return res
@@ -131,52 +204,11 @@ def conv2d(
     if dilations[0] > 1:
         filters = _add_dilations(filters, dilations[0], axis=0)
 
-    filter_shape = list(filters.shape[0:2])
     if data_format == "NCHW":
         x = np.transpose(x, (0, 2, 3, 1))
-
-    x_shape = list(x.shape[1:3])
-    pad_h = ivy.handle_padding(x_shape[0], strides[0], filter_shape[0], padding)
-    pad_w = ivy.handle_padding(x_shape[1], strides[1], filter_shape[1], padding)
-    x = np.pad(
-        x,
-        [
-            (0, 0),
-            (pad_h // 2, pad_h - pad_h // 2),
-            (pad_w // 2, pad_w - pad_w // 2),
-            (0, 0),
-        ],
-        "constant",
-    )
-
-    x_shape = x.shape
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_h = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_w = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OH x OW x KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 6 + [output_dim]
-    )
-    # B x OH x OW x KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 3 + filter_shape + [input_dim, output_dim]
-    )
+    x = _pad_conv_input(x, strides, list(filters.shape[0:2]), padding)
     # B x OH x OW x O
-    res = np.sum(mult, (3, 4, 5))
+    res = _conv(x, filters, strides)
     if data_format == "NCHW":
         return np.transpose(res, (0, 3, 1, 2))
     return res
@@ -241,10 +273,7 @@ def conv2d_transpose(
     )
 
     x = np.flip(x, (1, 2))
-    res = np.flip(
-        conv2d(x, filters, 1, "VALID", data_format="NHWC", dilations=1),
-        (1, 2),
-    )
+    res = np.flip(_conv(x, filters, [1, 1]), (1, 2))
     if data_format == "NCHW":
         res = np.transpose(res, (0, 3, 1, 2))
     return res
@@ -264,37 +293,18 @@ def depthwise_conv2d(
     strides = [strides] * 2 if isinstance(strides, int) else strides
     dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
 
-    if data_format == "NHWC":
-        x = np.transpose(x, (3, 0, 1, 2))
-    else:
-        x = np.transpose(x, (1, 0, 2, 3))
-    depth = x.shape[0]
-    filters = np.transpose(filters, (2, 0, 1))
-    x = np.expand_dims(x, -1)
-    filters = np.expand_dims(filters, (-1, -2))
-    x_shape = x[0].shape
-    filter_shape = filters[0].shape
-    filter_h = filter_shape[0] + (filter_shape[0] - 1) * (dilations[0] - 1)
-    filter_w = filter_shape[1] + (filter_shape[1] - 1) * (dilations[1] - 1)
-    if padding == "VALID":
-        out_height = np.ceil(float(x_shape[1] - filter_h + 1) / float(strides[0]))
-        out_width = np.ceil(float(x_shape[2] - filter_w + 1) / float(strides[1]))
-    else:
-        out_height = np.ceil(float(x_shape[1]) / float(strides[0]))
-        out_width = np.ceil(float(x_shape[2]) / float(strides[1]))
-    if data_format == "NHWC":
-        outputs = np.empty([x_shape[0], int(out_height), int(out_width), 0], x.dtype)
-    else:
-        outputs = np.empty([x_shape[0], 0, int(out_height), int(out_width)], x.dtype)
-    for i in range(depth):
-        output = conv2d(
-            x[i], filters[i], strides, padding, data_format="NHWC", dilations=dilations
-        )
-        if data_format == "NHWC":
-            outputs = np.append(outputs, output, axis=-1)
-        else:
-            outputs = np.append(outputs, np.transpose(output, (0, 3, 1, 2)), axis=1)
-    return outputs
+    if dilations[1] > 1:
+        filters = _add_dilations(filters, dilations[1], axis=1)
+    if dilations[0] > 1:
+        filters = _add_dilations(filters, dilations[0], axis=0)
+    if data_format == "NCHW":
+        x = np.transpose(x, (0, 2, 3, 1))
+    x = _pad_conv_input(x, strides, list(filters.shape[0:2]), padding)
+    # B x OH x OW x D
+    res = _conv(x, filters, strides, depthwise=True)
+    if data_format == "NCHW":
+        return np.transpose(res, (0, 3, 1, 2))
+    return res
 
 
 def conv3d(
@@ -322,59 +332,11 @@ def conv3d(
     if dilations[2] > 1:
         filters = _add_dilations(filters, dilations[2], axis=2)
 
-    filter_shape = list(filters.shape[0:3])
-
     if data_format == "NCDHW":
         x = np.transpose(x, (0, 2, 3, 4, 1))
-
-    x_shape = list(x.shape[1:4])
-    pad_d = ivy.handle_padding(x_shape[0], strides[0], filter_shape[0], padding)
-    pad_h = ivy.handle_padding(x_shape[1], strides[1], filter_shape[1], padding)
-    pad_w = ivy.handle_padding(x_shape[2], strides[2], filter_shape[2], padding)
-
-    x = np.pad(
-        x,
-        [
-            (0, 0),
-            (pad_d // 2, pad_d - pad_d // 2),
-            (pad_h // 2, pad_h - pad_h // 2),
-            (pad_w // 2, pad_w - pad_w // 2),
-            (0, 0),
-        ],
-        "constant",
-    )
-
-    x_shape = x.shape
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_d = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_h = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_w = (x_shape[3] - filter_shape[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OD X OH x OW x KD X KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 8 + [output_dim]
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 4 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OD X OH x OW x O
-    res = np.sum(mult, (4, 5, 6, 7))
+    x = _pad_conv_input(x, strides, list(filters.shape[0:3]), padding)
+    # B x OD x OH x OW x O
+    res = _conv(x, filters, strides)
     if data_format == "NCDHW":
         return np.transpose(res, (0, 4, 1, 2, 3))
     return res
@@ -455,10 +417,7 @@ def conv3d_transpose(
         "constant",
     )
     x = np.flip(x, (1, 2, 3))
-    res = np.flip(
-        conv3d(x, filters, 1, "VALID", data_format="NDHWC", dilations=1),
-        (1, 2, 3),
-    )
+    res = np.flip(_conv(x, filters, [1, 1, 1]), (1, 2, 3))
     if data_format == "NCDHW":
         res = np.transpose(res, (0, 4, 1, 2, 3))
     return res
@@ -494,66 +453,9 @@ def conv_general_dilated(
         if x_dilations[j] > 1:
             x = _add_dilations(x, x_dilations[j], axis=j + 1)
 
-    filter_shape = list(filters.shape[0:dims])
-
-    x_shape = list(x.shape[1 : dims + 1])
-    pad_specific = [
-        ivy.handle_padding(x_shape[i], strides[i], filter_shape[i], padding)
-        for i in range(dims)
-    ]
-    pad_list = [
-        (pad_specific[i] // 2, pad_specific[i] - pad_specific[i] // 2)
-        for i in range(dims)
-    ]
-    x = np.pad(
-        x,
-        [
-            (0, 0),
-            *pad_list,
-            (0, 0),
-        ],
-        "constant",
-    )
-    x_shape = x.shape
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_shape = [
-        (x_shape[i + 1] - filter_shape[i]) // strides[i] + 1 for i in range(dims)
-    ]
-    res = []
-    new_shape = [x_shape[0], *new_shape] + filter_shape + [input_dim]
-    for i, j in zip(
-        range(0, x.shape[-1], input_dim),
-        range(0, output_dim, output_dim // feature_group_count),
-    ):
-        sliced_x = x[..., i : i + input_dim]
-        sliced_filters = filters[..., j : j + output_dim // feature_group_count]
-        normal_strides = [sliced_x.strides[i] for i in range(1, dims + 2)]
-        changed_strides = [
-            sliced_x.strides[i] * strides[i - 1] for i in range(1, dims + 1)
-        ]
-        new_strides = (x.strides[0], *changed_strides, *normal_strides)
-        # B x OH x OW x KH x KW x I
-        sub_matrices = np.lib.stride_tricks.as_strided(
-            sliced_x, new_shape, new_strides, writeable=False
-        )
-
-        # B x OH x OW x KH x KW x I x O
-        sub_matrices_w_output_dim = np.tile(
-            np.expand_dims(sub_matrices, -1),
-            [1] * (dims * 2 + 2) + [output_dim // feature_group_count],
-        )
-        # B x OH x OW x KH x KW x I x O
-        mult = sub_matrices_w_output_dim * sliced_filters.reshape(
-            [1] * (dims + 1)
-            + filter_shape
-            + [input_dim, output_dim // feature_group_count]
-        )
-
-        # B x OH x OW x O
-        res.append(np.sum(mult, tuple([i for i in range(dims + 1, dims * 2 + 2)])))
-    res = np.concatenate(res, axis=-1)
-
+    x = _pad_conv_input(x, strides, list(filters.shape[0:dims]), padding)
+    # B x O1 x .. x Od x O
+    res = _conv(x, filters, strides, feature_group_count=feature_group_count)
     res = np.add(res, bias) if bias is not None else res
     if data_format == "channel_first":
         return np.transpose(res, (0, dims + 1, *range(1, dims + 1)))
@@ -628,14 +530,10 @@ def conv_general_transpose(
     res = np.concatenate(
         [
             np.flip(
-                conv_general_dilated(
+                _conv(
                     x[..., j : j + filters.shape[-2] // feature_group_count],
                     filters[..., j : j + filters.shape[-2] // feature_group_count, :],
-                    1,
-                    "VALID",
-                    dims=dims,
-                    data_format=ivy.get_x_data_format(dims, "channel_last"),
-                    dilations=1,
+                    [1] * dims,
                 ),
                 (*range(1, dims + 1),),
             )
@@ -10,8 +10,14 @@ from ivy.functional.ivy.random import (
     _check_bounds_and_get_shape,
     _randint_check_dtype_and_bound,
     _check_valid_scale,
+    _random_uniform_from_key,
+    _random_normal_from_key,
+    _multinomial_from_key,
+    _randint_from_key,
+    _shuffle_from_key,
 )
 from ivy.func_wrapper import with_unsupported_dtypes
+from ivy.functional.backends.numpy.sorting import _searchsorted_rows
 from . import backend_version
 
 # Extra #
@@ -27,10 +33,13 @@ def random_uniform(
     device: str,
     out: Optional[np.ndarray] = None,
     seed: Optional[int] = None,
+    key: Optional[np.ndarray] = None,
 ) -> np.ndarray:
+    shape = _check_bounds_and_get_shape(low, high, shape)
+    if key is not None:
+        return _random_uniform_from_key(key, low, high, shape, dtype, device)
     if seed:
         np.random.seed(seed)
-    shape = _check_bounds_and_get_shape(low, high, shape)
     return np.asarray(np.random.uniform(low, high, shape), dtype=dtype)
 
 
@@ -42,10 +51,13 @@ def random_normal(
     device: str,
     dtype: np.dtype,
     seed: Optional[int] = None,
+    key: Optional[np.ndarray] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     _check_valid_scale(std)
     shape = _check_bounds_and_get_shape(mean, std, shape)
+    if key is not None:
+        return _random_normal_from_key(key, mean, std, shape, dtype, device)
     if seed:
         np.random.seed(seed)
     return np.asarray(np.random.normal(mean, std, shape), dtype=dtype)
@@ -62,8 +74,13 @@ def multinomial(
     replace: bool = True,
     device: str,
     seed: Optional[int] = None,
+    key: Optional[np.ndarray] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
+    if key is not None:
+        return _multinomial_from_key(
+            key, population_size, num_samples, batch_size, probs, replace, device
+        )
     if seed:
         np.random.seed(seed)
     if probs is None:
@@ -80,12 +97,34 @@ def multinomial(
     num_classes = orig_probs_shape[-1]
     probs_flat = np.reshape(probs, (-1, orig_probs_shape[-1]))
     probs_flat = probs_flat / np.sum(probs_flat, -1, keepdims=True, dtype="float64")
-    probs_stack = np.split(probs_flat, probs_flat.shape[0])
-    samples_stack = [
-        np.random.choice(num_classes, num_samples, replace, p=prob[0])
-        for prob in probs_stack
-    ]
-    samples_flat = np.stack(samples_stack)
+    if replace:
+        # inverse transform sampling of a single uniform draw for all rows
+        cdf = np.minimum(np.cumsum(probs_flat, -1), 1)
+        cdf[:, -1] = 1
+        uniform = np.random.random_sample((probs_flat.shape[0], num_samples))
+        samples_flat = _searchsorted_rows(cdf, uniform, "right")
+    else:
+        if num_samples > num_classes:
+            raise ivy.exceptions.IvyException(
+                "cannot take a larger sample than the population when replace is "
+                "False, got {} samples of {} classes".format(num_samples, num_classes)
+            )
+        if np.any(np.count_nonzero(probs_flat, -1) < num_samples):
+            raise ivy.exceptions.IvyException(
+                "fewer non-zero probabilities than samples when replace is False"
+            )
+        # the classes with the largest log probabilities perturbed by gumbel noise
+        # are a sample without replacement, in the order they would be drawn
+        with np.errstate(divide="ignore"):
+            keys = np.log(probs_flat) + np.random.gumbel(size=probs_flat.shape)
+        if num_samples < num_classes:
+            # only the largest num_samples keys need to be sorted
+            top = np.argpartition(-keys, max(num_samples - 1, 0), axis=-1)
+            top = top[:, :num_samples]
+            order = np.argsort(-np.take_along_axis(keys, top, -1), axis=-1)
+            samples_flat = np.take_along_axis(top, order, -1)
+        else:
+            samples_flat = np.argsort(-keys, axis=-1)
     return np.asarray(np.reshape(samples_flat, orig_probs_shape[:-1] + [num_samples]))
 
 
@@ -98,6 +137,7 @@ def randint(
     device: str,
     dtype: Optional[Union[np.dtype, ivy.Dtype]] = None,
     seed: Optional[int] = None,
+    key: Optional[np.ndarray] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     if not dtype:
@@ -105,6 +145,8 @@ def randint(
     dtype = ivy.as_native_dtype(dtype)
     _randint_check_dtype_and_bound(low, high, dtype)
     shape = _check_bounds_and_get_shape(low, high, shape)
+    if key is not None:
+        return _randint_from_key(key, low, high, shape, dtype, device)
     if seed:
         np.random.seed(seed)
     return np.random.randint(low, high, shape, dtype=dtype)
@@ -115,8 +157,15 @@ def seed(*, seed_value: int = 0) -> None:
 
 
 def shuffle(
-    x: np.ndarray, /, *, seed: Optional[int] = None, out: Optional[np.ndarray] = None
+    x: np.ndarray,
+    /,
+    *,
+    seed: Optional[int] = None,
+    key: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
+    if key is not None:
+        return _shuffle_from_key(key, x)
     if seed:
         np.random.seed(seed)
     return np.random.permutation(x)
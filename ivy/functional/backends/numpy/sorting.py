@@ -36,6 +36,45 @@ def sort(
     return ret
 
 
+def _searchsorted_rows(x, v, side):
+    # searches each row of the 2D v in the same row of the 2D x
+    num_rows, n = x.shape
+    m = v.shape[1]
+    if n == 0 or v.size == 0:
+        return np.zeros(v.shape, dtype=np.int64)
+    if np.can_cast(x.dtype, np.int64) and np.can_cast(v.dtype, np.int64):
+        # each row is offset past the values of the rows before it, so that a
+        # single search over the flattened rows stays within each row
+        low = min(int(x.min()), int(v.min()))
+        span = max(int(x.max()), int(v.max())) - low + 1
+        if num_rows * span < 2**62:
+            offsets = np.arange(num_rows, dtype=np.int64).reshape((-1, 1)) * span - low
+            ret = np.searchsorted(
+                (x + offsets).reshape(-1), (v + offsets).reshape(-1), side=side
+            )
+            return ret.reshape(v.shape) - np.arange(0, num_rows * n, n).reshape((-1, 1))
+    # values with no exact offsets, such as floats, are merged into each row of x
+    # with a stable sort, which puts them before (left) or after (right) equal
+    # elements of x. the index of each is then the number of x elements before it
+    if side == "left":
+        order = np.argsort(np.concatenate([v, x], axis=1), axis=-1, kind="stable")
+        from_v = order < m
+        v_index = order
+    else:
+        order = np.argsort(np.concatenate([x, v], axis=1), axis=-1, kind="stable")
+        from_v = order >= n
+        v_index = order - n
+    num_x_before = np.cumsum(~from_v, axis=-1)
+    ret = np.empty(v.shape, dtype=np.int64)
+    np.put_along_axis(
+        ret,
+        v_index[from_v].reshape(v.shape),
+        num_x_before[from_v].reshape(v.shape),
+        axis=-1,
+    )
+    return ret
+
+
 def searchsorted(
     x: np.ndarray,
     v: np.ndarray,
@@ -64,12 +103,10 @@ def searchsorted(
         if is_sorter_provided:
             x = np.take_along_axis(x, sorter, axis=-1)
         original_shape = v.shape
-        x = x.reshape(-1, x.shape[-1])
-        v = v.reshape(-1, v.shape[-1])
-        out_array = np.empty_like(v)
-        for i in range(x.shape[0]):
-            out_array[i] = np.searchsorted(x[i], v[i], side=side)
-        ret = out_array.reshape(original_shape)
+        num_rows = int(np.prod(x.shape[:-1]))
+        x = x.reshape(num_rows, x.shape[-1])
+        v = v.reshape(num_rows, v.shape[-1])
+        ret = _searchsorted_rows(x, v, side).reshape(original_shape)
     else:
         ret = np.searchsorted(x, v, side=side, sorter=sorter)
     return ret.astype(ret_dtype)
@@ -104,12 +104,8 @@ class Profiler(BaseProfiler):
 
     def start(self):
         tf.profiler.experimental.start(self._save_dir, options=self._options)
+        super(Profiler, self).start()
 
     def stop(self):
+        super(Profiler, self).stop()
         tf.profiler.experimental.stop()
-
-    def __enter__(self):
-        self.start()
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.stop()
@@ -11,6 +11,7 @@ import tensorflow as tf
 
 # local
 import ivy
+from ivy.batching import batched_call
 from ivy.functional.ivy.gradients import _is_variable
 from ivy.functional.ivy.general import _parse_ellipsis
 from ivy.func_wrapper import with_unsupported_dtypes
@@ -520,33 +521,32 @@ def vmap(
                 in_axes, message="single value in_axes should not be None"
             )
 
-        # Handling None in in_axes by broadcasting the axis_size
-        if isinstance(in_axes, (tuple, list)) and None in in_axes:
-            none_axis_index = list()
-            for index, axis in enumerate(in_axes):
-                if axis is None:
-                    none_axis_index.append(index)
-
-            for none_mapped_axis in none_axis_index:
-                args[none_mapped_axis] = tf.broadcast_to(
-                    args[none_mapped_axis],
-                    (tuple(axis_size) + args[none_mapped_axis].shape),
-                )
-
         # set up the axis to be mapped
         if isinstance(in_axes, (tuple, list)):
+            mapped = [axis is not None for axis in in_axes]
             for i in range(len(in_axes)):
-                args[i] = tf.experimental.numpy.moveaxis(args[i], in_axes[i], 0)
+                if in_axes[i] is not None:
+                    args[i] = tf.experimental.numpy.moveaxis(args[i], in_axes[i], 0)
         elif isinstance(in_axes, int):
-            args[0] = tf.experimental.numpy.moveaxis(args[0], in_axes, 0)
-
-        # vectorisation - applying map_fn if only one arg provided as reduce requires
-        # two elements to begin with.
-        arr_results = []
-        for arrays in zip(*args):
-            single_op = func(*arrays)
-            arr_results.append(single_op)
-        res = ivy.stack(arr_results)
+            mapped = [True] * len(args)
+            args = [tf.experimental.numpy.moveaxis(arg, in_axes, 0) for arg in args]
+
+        # vectorisation, calling func once on the whole batch
+        res = batched_call(func, args, mapped)
+
+        if res is None:
+            # func has operations without a batching rule, so it is called on each
+            # example, with the unmapped arguments broadcast by the axis_size
+            for i in range(len(args)):
+                if not mapped[i]:
+                    args[i] = tf.broadcast_to(
+                        args[i], (tuple(axis_size) + tuple(args[i].shape))
+                    )
+            arr_results = []
+            for arrays in zip(*args):
+                single_op = func(*arrays)
+                arr_results.append(single_op)
+            res = ivy.stack(arr_results)
 
         if out_axes:
             res = tf.experimental.numpy.moveaxis(res, 0, out_axes)
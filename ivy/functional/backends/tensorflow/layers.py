@@ -437,3 +437,41 @@ def conv_general_transpose(
     if data_format == "channel_first":
         res = tf.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+def lstm_update(
+    x: Union[tf.Tensor, tf.Variable],
+    init_h: Union[tf.Tensor, tf.Variable],
+    init_c: Union[tf.Tensor, tf.Variable],
+    kernel: Union[tf.Tensor, tf.Variable],
+    recurrent_kernel: Union[tf.Tensor, tf.Variable],
+    /,
+    *,
+    bias: Optional[Union[tf.Tensor, tf.Variable]] = None,
+    recurrent_bias: Optional[Union[tf.Tensor, tf.Variable]] = None,
+) -> Tuple[Union[tf.Tensor, tf.Variable], Union[tf.Tensor, tf.Variable]]:
+    # input kernel, with the biases of both kernels, for all timesteps at once
+    x_shape = list(x.shape)
+    Wi_x = tf.matmul(tf.reshape(x, (-1, x_shape[-1])), kernel)
+    if bias is not None:
+        Wi_x = tf.math.add(Wi_x, bias)
+    if recurrent_bias is not None:
+        Wi_x = tf.math.add(Wi_x, recurrent_bias)
+    Wi_x = tf.reshape(Wi_x, x_shape[:-1] + [-1])
+
+    def _step(state, Wi_xt):
+        ht, ct = state
+        # BS x 4*out, with the input, forget, cell and output gates
+        gates = tf.math.add(Wi_xt, tf.matmul(ht, recurrent_kernel))
+        it, ft, gt, ot = tf.split(gates, 4, axis=-1)
+        ct = tf.math.sigmoid(ft) * ct + tf.math.sigmoid(it) * tf.math.tanh(gt)
+        ht = tf.math.sigmoid(ot) * tf.math.tanh(ct)
+        return ht, ct
+
+    # scan over the time dimension, moved to the front
+    hts, cts = tf.scan(
+        _step,
+        tf.experimental.numpy.moveaxis(Wi_x, -2, 0),
+        initializer=(init_h, tf.cast(init_c, init_h.dtype)),
+    )
+    return tf.experimental.numpy.moveaxis(hts, 0, -2), cts[-1]
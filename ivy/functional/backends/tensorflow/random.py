@@ -15,6 +15,11 @@ from ivy.functional.ivy.random import (
     _check_bounds_and_get_shape,
     _randint_check_dtype_and_bound,
     _check_valid_scale,
+    _random_uniform_from_key,
+    _random_normal_from_key,
+    _multinomial_from_key,
+    _randint_from_key,
+    _shuffle_from_key,
 )
 from . import backend_version
 
@@ -31,9 +36,12 @@ def random_uniform(
     dtype: DType,
     device: str,
     seed: Optional[int] = None,
+    key: Optional[Union[tf.Tensor, tf.Variable]] = None,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Union[tf.Tensor, tf.Variable]:
     shape = _check_bounds_and_get_shape(low, high, shape)
+    if key is not None:
+        return _random_uniform_from_key(key, low, high, shape, dtype, device)
     low = tf.cast(low, dtype)
     high = tf.cast(high, dtype)
     with tf.device(device):
@@ -49,11 +57,14 @@ def random_normal(
     shape: Optional[Union[ivy.NativeShape, Sequence[int]]] = None,
     dtype: DType,
     seed: Optional[int] = None,
+    key: Optional[Union[tf.Tensor, tf.Variable]] = None,
     device: str,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Union[tf.Tensor, tf.Variable]:
     _check_valid_scale(std)
     shape = _check_bounds_and_get_shape(mean, std, shape)
+    if key is not None:
+        return _random_normal_from_key(key, mean, std, shape, dtype, device)
     mean = tf.cast(mean, dtype)
     std = tf.cast(std, dtype)
     with tf.device(device):
@@ -73,8 +84,13 @@ def multinomial(
     replace: bool = True,
     device: str,
     seed: Optional[int] = None,
+    key: Optional[Union[tf.Tensor, tf.Variable]] = None,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Union[tf.Tensor, tf.Variable]:
+    if key is not None:
+        return _multinomial_from_key(
+            key, population_size, num_samples, batch_size, probs, replace, device
+        )
     with tf.device(device):
         if probs is None:
             probs = (
@@ -132,6 +148,7 @@ def randint(
     device: str,
     dtype: Optional[Union[DType, ivy.Dtype]] = None,
     seed: Optional[int] = None,
+    key: Optional[Union[tf.Tensor, tf.Variable]] = None,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Union[tf.Tensor, tf.Variable]:
     if not dtype:
@@ -139,6 +156,8 @@ def randint(
     dtype = ivy.as_native_dtype(dtype)
     _randint_check_dtype_and_bound(low, high, dtype)
     shape = _check_bounds_and_get_shape(low, high, shape)
+    if key is not None:
+        return _randint_from_key(key, low, high, shape, dtype, device)
     low = tf.cast(low, "float32")
     high = tf.cast(high, "float32")
     with tf.device(device):
@@ -156,8 +175,11 @@ def shuffle(
     /,
     *,
     seed: Optional[int] = None,
+    key: Optional[Union[tf.Tensor, tf.Variable]] = None,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Union[tf.Tensor, tf.Variable]:
+    if key is not None:
+        return _shuffle_from_key(key, x)
     if seed:
         tf.random.set_seed(seed)
     return tf.random.shuffle(x, seed=seed)
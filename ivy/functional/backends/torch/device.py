@@ -90,13 +90,9 @@ class Profiler(BaseProfiler):
 
     def start(self):
         self._prof.__enter__()
+        super(Profiler, self).start()
 
     def stop(self):
+        super(Profiler, self).stop()
         self._prof.__exit__(None, None, None)
         self._prof.export_chrome_trace(os.path.join(self._save_dir, "trace.json"))
-
-    def __enter__(self):
-        self.start()
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.stop()
@@ -676,3 +676,55 @@ def conv_general_transpose(
     if data_format == "channel_last":
         res = res.permute(0, *range(2, dims + 2), 1)
     return res
+
+
+@with_unsupported_dtypes(
+    {
+        "1.11.0 and below": (
+            "float16",
+            "bfloat16",
+        )
+    },
+    backend_version,
+)
+def lstm_update(
+    x: torch.Tensor,
+    init_h: torch.Tensor,
+    init_c: torch.Tensor,
+    kernel: torch.Tensor,
+    recurrent_kernel: torch.Tensor,
+    /,
+    *,
+    bias: Optional[torch.Tensor] = None,
+    recurrent_bias: Optional[torch.Tensor] = None,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    # the fused lstm kernel of torch, which orders the gates in the same way, with the
+    # batch dimensions flattened into one
+    batch_shape = list(x.shape[:-2])
+    timesteps, input_channels = x.shape[-2:]
+    output_channels = init_h.shape[-1]
+    params = [kernel.t(), recurrent_kernel.t()]
+    has_biases = bias is not None or recurrent_bias is not None
+    if has_biases:
+        params += [
+            bias if bias is not None else torch.zeros_like(recurrent_bias),
+            recurrent_bias if recurrent_bias is not None else torch.zeros_like(bias),
+        ]
+    hts, _, ct = torch.lstm(
+        x.reshape(-1, timesteps, input_channels),
+        (
+            init_h.reshape(1, -1, output_channels),
+            init_c.reshape(1, -1, output_channels),
+        ),
+        params,
+        has_biases,
+        1,
+        0.0,
+        False,
+        False,
+        True,
+    )
+    return (
+        hts.reshape(batch_shape + [timesteps, output_channels]),
+        ct.reshape(batch_shape + [output_channels]),
+    )
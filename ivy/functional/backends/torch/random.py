@@ -10,6 +10,11 @@ from ivy.functional.ivy.random import (
     _check_bounds_and_get_shape,
     _randint_check_dtype_and_bound,
     _check_valid_scale,
+    _random_uniform_from_key,
+    _random_normal_from_key,
+    _multinomial_from_key,
+    _randint_from_key,
+    _shuffle_from_key,
 )
 from ivy.func_wrapper import with_unsupported_dtypes
 from . import backend_version
@@ -26,9 +31,12 @@ def random_uniform(
     dtype: torch.dtype,
     device: torch.device,
     seed=None,
+    key: Optional[torch.Tensor] = None,
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
     shape = _check_bounds_and_get_shape(low, high, shape)
+    if key is not None:
+        return _random_uniform_from_key(key, low, high, shape, dtype, device)
     rand_range = high - low
     if seed:
         torch.manual_seed(seed)
@@ -42,12 +50,16 @@ def random_normal(
     shape: Optional[Union[ivy.NativeShape, Sequence[int]]] = None,
     dtype: torch.dtype,
     seed: Optional[int] = None,
+    key: Optional[torch.Tensor] = None,
     device: torch.device,
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
     _check_valid_scale(std)
     shape = _check_bounds_and_get_shape(mean, std, shape)
     dtype = ivy.as_native_dtype(dtype)
+    if key is not None:
+        ret = _random_normal_from_key(key, mean, std, shape, dtype, device)
+        return ivy.inplace_update(out, ret) if ivy.exists(out) else ret
     if seed:
         torch.manual_seed(seed)
     if isinstance(mean, (int, float)) and isinstance(std, (int, float)):
@@ -69,8 +81,14 @@ def multinomial(
     replace: bool = True,
     device: torch.device,
     seed: Optional[int] = None,
+    key: Optional[torch.Tensor] = None,
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
+    if key is not None:
+        ret = _multinomial_from_key(
+            key, population_size, num_samples, batch_size, probs, replace, device
+        )
+        return ivy.inplace_update(out, ret) if ivy.exists(out) else ret
     if probs is None:
         probs = (
             torch.ones(
@@ -98,6 +116,7 @@ def randint(
     device: torch.device,
     dtype: Optional[Union[torch.dtype, ivy.Dtype]] = None,
     seed: Optional[int] = None,
+    key: Optional[torch.Tensor] = None,
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
     if not dtype:
@@ -105,6 +124,8 @@ def randint(
     dtype = ivy.as_native_dtype(dtype)
     _randint_check_dtype_and_bound(low, high, dtype)
     shape = _check_bounds_and_get_shape(low, high, shape)
+    if key is not None:
+        return _randint_from_key(key, low, high, shape, dtype, device)
     rand_range = high - low
     if seed:
         torch.manual_seed(seed)
@@ -122,8 +143,12 @@ def shuffle(
     /,
     *,
     seed: Optional[int] = None,
+    key: Optional[torch.Tensor] = None,
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
+    if key is not None:
+        ret = _shuffle_from_key(key, x)
+        return ivy.inplace_update(out, ret) if ivy.exists(out) else ret
     batch_size = x.shape[0]
     if seed:
         torch.manual_seed(seed)
@@ -109,7 +109,8 @@ def prod(
     if axis is None:
         return torch.prod(input=x, dtype=dtype)
     if isinstance(axis, tuple) or isinstance(axis, list):
-        for i in axis:
+        # the last axes first, so that the other axes keep their positions
+        for i in sorted([a % x.dim() for a in axis], reverse=True):
             x = torch.prod(x, i, keepdim=keepdims, dtype=dtype)
         return x
     return torch.prod(x, axis, keepdim=keepdims, dtype=dtype)
@@ -227,6 +227,24 @@ def _is_csc(
     return False
 
 
+def _expand_compressed_indices(compressed_indices, num_segments):
+    # segment (row for CSR, column for CSC) of every stored value
+    counts = compressed_indices[1:] - compressed_indices[:-1]
+    return ivy.repeat(ivy.arange(num_segments, dtype="int64"), counts)
+
+
+def _compress_coordinates(major, minor, values, shape):
+    # sorts the coordinates by (major, minor) and compresses the major indices
+    order = ivy.argsort(major * shape[1] + minor)
+    major = ivy.gather(major, order, axis=0)
+    compressed = ivy.searchsorted(major, ivy.arange(shape[0] + 1, dtype="int64"))
+    return (
+        compressed,
+        ivy.gather(minor, order, axis=0),
+        ivy.gather(values, order, axis=0),
+    )
+
+
 class SparseArray:
     def __init__(
         self,
@@ -503,40 +521,142 @@ class SparseArray:
     # Instance Methods #
     # ---------------- #
 
-    def to_dense_array(self, *, native=False):
-        all_coordinates = []
+    def _coordinates(self):
+        # nnz x ndim coordinates of the stored values
+        if self._coo_indices is not None:
+            return ivy.permute_dims(self._coo_indices, (1, 0))
+        elif self._csr_crow_indices is not None and self._csr_col_indices is not None:
+            rows = _expand_compressed_indices(
+                self._csr_crow_indices, self._dense_shape[0]
+            )
+            return ivy.stack([rows, self._csr_col_indices], axis=-1)
+        cols = _expand_compressed_indices(self._csc_ccol_indices, self._dense_shape[1])
+        return ivy.stack([self._csc_row_indices, cols], axis=-1)
 
+    def _with_values(self, values):
+        # sparse array sharing the indices and format of self
         if self._coo_indices is not None:
-            # COO sparse array
-            for i in range(self._values.shape[0]):
-                coordinate = ivy.gather(self._coo_indices, ivy.array([[i]]))
-                coordinate = ivy.reshape(coordinate, (self._coo_indices.shape[0],))
-                all_coordinates.append(coordinate.to_list())
+            return SparseArray(
+                coo_indices=self._coo_indices,
+                values=values,
+                dense_shape=self._dense_shape,
+            )
         elif self._csr_crow_indices is not None and self._csr_col_indices is not None:
-            # CSR sparse array
-            total_rows = self._dense_shape[0]
-            all_cols = self._csr_col_indices.to_list()
-            all_rows = self._csr_crow_indices.to_list()
-            for row in range(total_rows):
-                cols = all_cols[all_rows[row] : all_rows[row + 1]]
-                for col in cols:
-                    all_coordinates.append([row, col])
-        else:
-            # CSC sparse array
-            total_cols = self._dense_shape[1]
-            all_rows = self._csc_row_indices.to_list()
-            all_cols = self._csc_ccol_indices.to_list()
-            for col in range(total_cols):
-                rows = all_rows[all_cols[col] : all_cols[col + 1]]
-                for row in rows:
-                    all_coordinates.append([row, col])
-
-        # make dense array
-        ret = ivy.scatter_nd(
-            ivy.array(all_coordinates), self._values, ivy.array(self._dense_shape)
+            return SparseArray(
+                csr_crow_indices=self._csr_crow_indices,
+                csr_col_indices=self._csr_col_indices,
+                values=values,
+                dense_shape=self._dense_shape,
+            )
+        return SparseArray(
+            csc_ccol_indices=self._csc_ccol_indices,
+            csc_row_indices=self._csc_row_indices,
+            values=values,
+            dense_shape=self._dense_shape,
         )
+
+    def to_dense_array(self, *, native=False):
+        if self._values.shape[0] == 0:
+            ret = ivy.zeros(self._dense_shape, dtype=self._values.dtype)
+        else:
+            ret = ivy.scatter_nd(
+                self._coordinates(), self._values, ivy.array(self._dense_shape)
+            )
         return ret.to_native() if native else ret
 
+    def to_coo(self):
+        if self._coo_indices is not None:
+            return self
+        return SparseArray(
+            coo_indices=ivy.permute_dims(self._coordinates(), (1, 0)),
+            values=self._values,
+            dense_shape=self._dense_shape,
+        )
+
+    def to_csr(self):
+        if self._csr_crow_indices is not None and self._csr_col_indices is not None:
+            return self
+        ivy.assertions.check_equal(
+            len(self._dense_shape),
+            2,
+            message="only 2D arrays can be converted to CSR sparse arrays",
+        )
+        coordinates = self._coordinates()
+        crow_indices, col_indices, values = _compress_coordinates(
+            coordinates[:, 0], coordinates[:, 1], self._values, self._dense_shape
+        )
+        return SparseArray(
+            csr_crow_indices=crow_indices,
+            csr_col_indices=col_indices,
+            values=values,
+            dense_shape=self._dense_shape,
+        )
+
+    def to_csc(self):
+        if self._csc_ccol_indices is not None and self._csc_row_indices is not None:
+            return self
+        ivy.assertions.check_equal(
+            len(self._dense_shape),
+            2,
+            message="only 2D arrays can be converted to CSC sparse arrays",
+        )
+        coordinates = self._coordinates()
+        ccol_indices, row_indices, values = _compress_coordinates(
+            coordinates[:, 1],
+            coordinates[:, 0],
+            self._values,
+            (self._dense_shape[1], self._dense_shape[0]),
+        )
+        return SparseArray(
+            csc_ccol_indices=ccol_indices,
+            csc_row_indices=row_indices,
+            values=values,
+            dense_shape=self._dense_shape,
+        )
+
+    def scale(self, factor):
+        return self._with_values(ivy.multiply(self._values, factor))
+
+    def sum(self, *, axis=None):
+        if axis is None or len(self._dense_shape) == 1:
+            return ivy.sum(self._values)
+        ndim = len(self._dense_shape)
+        axis = axis % ndim
+        out_shape = [d for i, d in enumerate(self._dense_shape) if i != axis]
+        if self._values.shape[0] == 0:
+            return ivy.zeros(out_shape, dtype=self._values.dtype)
+        coordinates = self._coordinates()
+        coordinates = ivy.concat(
+            [coordinates[:, :axis], coordinates[:, axis + 1 :]], axis=-1
+        )
+        return ivy.scatter_nd(coordinates, self._values, out_shape)
+
+    def matmul(self, x):
+        ivy.assertions.check_equal(
+            len(self._dense_shape),
+            2,
+            message="only 2D sparse arrays can be multiplied with dense arrays",
+        )
+        ivy.assertions.check_equal(
+            ivy.shape(x)[0],
+            self._dense_shape[1],
+            message="inner dimensions of the sparse and dense arrays do not match",
+        )
+        out_shape = [self._dense_shape[0], *ivy.shape(x)[1:]]
+        if self._values.shape[0] == 0:
+            return ivy.zeros(
+                out_shape, dtype=ivy.promote_types(self._values.dtype, x.dtype)
+            )
+        coordinates = self._coordinates()
+        values = ivy.reshape(self._values, (-1,) + (1,) * (len(ivy.shape(x)) - 1))
+        # each stored value scales the row of x matching its column, and these
+        # contributions are summed into the row of the output matching its row
+        updates = ivy.multiply(values, ivy.gather(x, coordinates[:, 1], axis=0))
+        return ivy.scatter_nd(coordinates[:, :1], updates, out_shape)
+
+    def __matmul__(self, other):
+        return self.matmul(other)
+
 
 class NativeSparseArray:
     pass
@@ -7,11 +7,22 @@ from ivy.functional.frontends.numpy import dtype
 
 
 class DeviceArray:
+    __slots__ = ("_ivy_array", "_dtype", "__weakref__")
+
     def __init__(self, array):
         self._ivy_array = (
             ivy.array(array) if not isinstance(array, ivy.Array) else array
         )
-        self._dtype = dtype(self._ivy_array.dtype)
+        self._dtype = None
+
+    @classmethod
+    def _from_ivy_array(cls, array):
+        # wraps an existing ivy array without validating it, used for the return
+        # values of the frontend functions
+        ret = object.__new__(cls)
+        ret._ivy_array = array
+        ret._dtype = None
+        return ret
 
     def __repr__(self):
         return (
@@ -27,6 +38,9 @@ class DeviceArray:
 
     @property
     def dtype(self):
+        # the numpy frontend dtype is only created when it is first requested
+        if self._dtype is None:
+            self._dtype = dtype(self._ivy_array.dtype)
         return self._dtype
 
     @property
@@ -23,7 +23,7 @@ def _from_ivy_array_to_jax_frontend_array(x, nested=False, include_derived=None)
             x, _from_ivy_array_to_jax_frontend_array, include_derived, shallow=False
         )
     elif isinstance(x, ivy.Array):
-        return jax_frontend.DeviceArray(x)
+        return jax_frontend.DeviceArray._from_ivy_array(x)
     return x
 
 
@@ -171,21 +171,19 @@ def _numpy_frontend_to_ivy(x: Any) -> Any:
 
 
 def _ivy_to_numpy(x: Any) -> Any:
-    if isinstance(x, ivy.Array) or ivy.is_native_array(x):
-        a = ndarray(0)  # TODO Find better initialisation workaround
-        a.ivy_array = x
-        a.dtype = ivy.dtype(x)
-        return a
+    if isinstance(x, ivy.Array):
+        return ndarray._from_ivy_array(x)
+    elif ivy.is_native_array(x):
+        return ndarray._from_ivy_array(ivy.Array._from_native(x))
     else:
         return x
 
 
 def _ivy_to_numpy_order_F(x: Any) -> Any:
-    if isinstance(x, ivy.Array) or ivy.is_native_array(x):
-        a = ndarray(0, order="F")  # TODO Find better initialisation workaround
-        a.ivy_array = x
-        a.dtype = ivy.dtype(x)
-        return a
+    if isinstance(x, ivy.Array):
+        return ndarray._from_ivy_array(x, order="F")
+    elif ivy.is_native_array(x):
+        return ndarray._from_ivy_array(ivy.Array._from_native(x), order="F")
     else:
         return x
 
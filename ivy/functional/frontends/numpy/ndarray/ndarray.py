@@ -6,6 +6,8 @@ import ivy.functional.frontends.numpy as np_frontend
 
 
 class ndarray:
+    __slots__ = ("_ivy_array", "_dtype", "_f_contiguous", "__weakref__")
+
     def __init__(self, shape, dtype="float32", order=None):
         if isinstance(dtype, np_frontend.dtype):
             dtype = dtype._ivy_dtype
@@ -22,6 +24,16 @@ class ndarray:
         else:
             self._f_contiguous = False
 
+    @classmethod
+    def _from_ivy_array(cls, array, order=None):
+        # wraps an existing ivy array without allocating, used for the return values
+        # of the frontend functions
+        ret = object.__new__(cls)
+        ret._ivy_array = array
+        ret._dtype = np_frontend.dtype(array.dtype)
+        ret._f_contiguous = order == "F"
+        return ret
+
     def __repr__(self):
         return str(self._ivy_array.__repr__()).replace(
             "ivy.array", "ivy.frontends.numpy.ndarray"
@@ -7,6 +7,27 @@ import ivy
 import ivy.functional.frontends.torch as torch_frontend
 
 
+# the default float dtype of the frontend functions running in each thread, which is
+# only non-empty within the outermost frontend function call
+_frontend_dtype_scope = ivy.ThreadLocalStack()
+_default_int_dtype = ivy.IntDtype("int64")
+
+
+def _enter_frontend_dtype_scope():
+    # the resolved dtypes are pushed directly, so that nested frontend calls don't
+    # validate and push them again
+    float_dtype = torch_frontend.get_default_dtype()
+    _frontend_dtype_scope.append(float_dtype)
+    ivy.default_int_dtype_stack.append(_default_int_dtype)
+    ivy.default_float_dtype_stack.append(float_dtype)
+
+
+def _exit_frontend_dtype_scope():
+    ivy.default_float_dtype_stack.pop()
+    ivy.default_int_dtype_stack.pop()
+    _frontend_dtype_scope.pop()
+
+
 def _from_torch_frontend_tensor_to_ivy_array(x):
     if hasattr(x, "ivy_array"):
         return x.ivy_array
@@ -18,10 +39,10 @@ def _from_ivy_array_to_torch_frontend_tensor(x, nested=False, include_derived=No
         return ivy.nested_map(
             x, _from_ivy_array_to_torch_frontend_tensor, include_derived, shallow=False
         )
-    elif isinstance(x, ivy.Array) or ivy.is_native_array(x):
-        a = torch_frontend.Tensor(0)  # TODO: Find better initialisation workaround
-        a.ivy_array = x
-        return a
+    elif isinstance(x, ivy.Array):
+        return torch_frontend.Tensor._from_ivy_array(x)
+    elif ivy.is_native_array(x):
+        return torch_frontend.Tensor._from_ivy_array(ivy.Array._from_native(x))
     return x
 
 
@@ -72,16 +93,16 @@ def outputs_to_frontend_arrays(fn: Callable) -> Callable:
         Calls the function, and then converts all `ivy.Array` instances returned
         by the function into `Tensor` instances.
         """
-        # call unmodified function
-        # ToDo: Remove this default dtype setting
-        #  once frontend specific backend setting is added
-        ivy.set_default_int_dtype("int64")
-        ivy.set_default_float_dtype(torch_frontend.get_default_dtype())
-        try:
+        # call unmodified function, with the torch default dtypes set by the
+        # outermost frontend function of the thread
+        if _frontend_dtype_scope:
             ret = fn(*args, **kwargs)
-        finally:
-            ivy.unset_default_int_dtype()
-            ivy.unset_default_float_dtype()
+        else:
+            _enter_frontend_dtype_scope()
+            try:
+                ret = fn(*args, **kwargs)
+            finally:
+                _exit_frontend_dtype_scope()
         # convert all arrays in the return to `torch_frontend.Tensor` instances
         return _from_ivy_array_to_torch_frontend_tensor(
             ret, nested=True, include_derived={tuple: True}
@@ -6,11 +6,21 @@ import weakref
 
 
 class Tensor:
+    __slots__ = ("_ivy_array", "__weakref__")
+
     def __init__(self, array, device=None):
         self._ivy_array = ivy.asarray(
             array, dtype=torch_frontend.float32, device=device
         )
 
+    @classmethod
+    def _from_ivy_array(cls, array):
+        # wraps an existing ivy array without allocating or casting, used for the
+        # return values of the frontend functions
+        ret = object.__new__(cls)
+        ret._ivy_array = array
+        return ret
+
     def __repr__(self):
         return str(self._ivy_array.__repr__()).replace(
             "ivy.array", "ivy.frontends.torch.Tensor"
@@ -779,10 +779,10 @@ def result_type(
 # Extra #
 # ------#
 
-default_dtype_stack = list()
-default_float_dtype_stack = list()
-default_int_dtype_stack = list()
-default_uint_dtype_stack = list()
+default_dtype_stack = ivy.ThreadLocalStack()
+default_float_dtype_stack = ivy.ThreadLocalStack()
+default_int_dtype_stack = ivy.ThreadLocalStack()
+default_uint_dtype_stack = ivy.ThreadLocalStack()
 
 
 class DefaultDtype:
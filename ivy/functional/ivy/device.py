@@ -3,11 +3,17 @@
 # global
 import os
 import gc
-import abc
+import json
 import math
+import time
 import psutil
 import pynvml
-from typing import Optional, Tuple
+import functools
+import itertools
+import threading
+import collections
+from types import FunctionType
+from typing import Optional, Tuple, Dict
 
 # noinspection PyUnresolvedReferences
 try:
@@ -18,7 +24,9 @@ from typing import Union, Callable, Iterable, Any
 
 # local
 import ivy
+from ivy import func_wrapper
 from ivy.func_wrapper import (
+    FN_DECORATORS,
     handle_out_argument,
     to_native_arrays_and_back,
     handle_nestable,
@@ -26,7 +34,7 @@ from ivy.func_wrapper import (
 )
 from ivy.exceptions import handle_exceptions
 
-default_device_stack = list()
+default_device_stack = ivy.ThreadLocalStack()
 dev_handles = dict()
 split_factors = dict()
 max_chunk_sizes = dict()
@@ -1169,33 +1177,362 @@ def function_unsupported_devices(fn: Callable, recurse=True) -> Tuple:
 # Profiler #
 
 
-class Profiler(abc.ABC):
-    """The profiler class is used to profile the execution of some code.
+class _FnStats:
+    __slots__ = (
+        "calls",
+        "total_time",
+        "self_time",
+        "kernel_time",
+        "total_kernel_time",
+        "bytes",
+        "signatures",
+    )
 
-    Parameters
-    ----------
-    save_dir
-        The directory to save the profile data to.
+    def __init__(self):
+        self.calls = 0
+        self.total_time = 0.0
+        self.self_time = 0.0
+        self.kernel_time = 0.0
+        self.total_kernel_time = 0.0
+        self.bytes = 0
+        self.signatures = collections.Counter()
+
+
+# the profiled functions are those with array handling wrappers, which excludes the
+# helpers called by the wrappers themselves, such as ivy.exists or ivy.nested_map
+_PROFILED_DECORATORS = [d for d in FN_DECORATORS if d != "handle_exceptions"]
+
+
+def _is_profiled_fn(fn):
+    return any(getattr(fn, attr, False) for attr in _PROFILED_DECORATORS)
+
+
+def _clear_dispatch_plans(fns):
+    # the dispatch plans are rebuilt with or without the backend function hook
+    for fn in fns:
+        plans = getattr(fn, "_dispatch_plans", None)
+        if plans is not None:
+            plans.clear()
+
+
+# the helpers below inspect arrays without calling ivy functions, which would
+# themselves be profiled
+
+
+def _array_signature(x):
+    if isinstance(x, ivy.Array):
+        x = x.data
+    elif isinstance(x, ivy.Container):
+        return None
+    shape = getattr(x, "shape", None)
+    dtype = getattr(x, "dtype", None)
+    if shape is None or dtype is None:
+        return None
+    return "{}{}".format(getattr(dtype, "name", dtype), list(shape))
+
+
+def _nbytes(x):
+    if isinstance(x, ivy.Array):
+        x = x.data
+    elif isinstance(x, ivy.Container):
+        return 0
+    nbytes = getattr(x, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    shape = getattr(x, "shape", None)
+    dtype = getattr(x, "dtype", None)
+    if shape is None or dtype is None:
+        return 0
+    try:
+        return math.prod(shape) * (
+            getattr(dtype, "itemsize", None) or getattr(dtype, "size", 0)
+        )
+    except TypeError:
+        return 0
 
-    """
 
-    def __init__(self, save_dir: str):
+class Profiler:
+    def __init__(self, save_dir: Optional[str] = None, *, max_events: int = 100000):
+        """
+        Profiles the ivy functions called between :meth:`start` and :meth:`stop`,
+        on any backend.
+
+        Each ivy function records its number of calls, its total time, its self time
+        excluding the nested ivy functions, the time spent in the backend function
+        (kernel time) as opposed to the ivy wrappers (overhead time), the kernel time
+        including that of its nested ivy functions (total kernel time), the dtypes
+        and shapes of its array inputs, and the bytes of its returned arrays. The
+        statistics are aggregated as the functions are called, while only the most
+        recent calls are kept for the chrome trace. The functions of the ivy
+        namespace are only replaced with their profiled versions while the profiler
+        is running, such that there is no cost otherwise. The backend should not be
+        changed while the profiler is running.
+
+        Compositional functions have no backend function of their own, so their
+        kernel time is zero, and the kernel time of the ivy functions they are
+        composed of is in their total kernel time. Backend functions called
+        directly, such as ``ivy.current_backend().add`` or the backend calls which
+        ``ivy.einops_rearrange`` replays, aren't timed separately, and count as the
+        overhead time of the calling ivy function.
+
+        Parameters
+        ----------
+        save_dir
+            The directory to save the profile to when the profiler is stopped, as a
+            chrome trace ``ivy_trace.json`` and a table ``ivy_profile.log``. Default
+            is ``None``, in which case nothing is saved.
+        max_events
+            The maximum number of the most recent calls kept for the chrome trace.
+            Default is ``100000``.
+
+        Examples
+        --------
+        >>> x = ivy.ones((4, 4))
+        >>> with ivy.Profiler() as profiler:
+        ...     y = ivy.matmul(x, x)
+        >>> print(profiler.stats["matmul"]["calls"])
+        1
+        """
         self._save_dir = save_dir
+        self._stats = dict()
+        self._events = collections.deque(maxlen=max_events)
+        self._local = threading.local()
+        self._wrapped = dict()
+        self._start_time = None
+        self._running = False
+
+    # Properties #
+    # -----------#
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        The statistics of each profiled ivy function, with the times in seconds and
+        the input signatures from most to least common.
+        """
+        return {
+            name: {
+                "calls": stats.calls,
+                "total_time": stats.total_time,
+                "self_time": stats.self_time,
+                "kernel_time": stats.kernel_time,
+                "overhead_time": stats.self_time - stats.kernel_time,
+                "total_kernel_time": stats.total_kernel_time,
+                "bytes": stats.bytes,
+                "signatures": [
+                    (", ".join(signature), count)
+                    for signature, count in stats.signatures.most_common()
+                ],
+            }
+            for name, stats in self._stats.items()
+        }
+
+    # Public #
+    # -------#
 
-    @abc.abstractmethod
     def start(self):
         """Start the profiler. This should be called before the code to be profiled."""
-        raise ivy.exceptions.IvyNotImplementedException
+        ivy.assertions.check_true(
+            func_wrapper._backend_fn_hook is None,
+            message="another profiler is already running",
+        )
+        if self._start_time is None:
+            self._start_time = time.perf_counter()
+        namespace = ivy.__dict__
+        for name, fn in list(namespace.items()):
+            if isinstance(fn, FunctionType) and _is_profiled_fn(fn):
+                wrapped = self._profile_fn(name, fn)
+                self._wrapped[name] = (fn, wrapped)
+                namespace[name] = wrapped
+        self._running = True
+        func_wrapper._backend_fn_hook = self._profile_backend_fn
+        _clear_dispatch_plans([fn for fn, _ in self._wrapped.values()])
 
-    @abc.abstractmethod
     def stop(self):
         """Stop the profiler. This should be called after the code to be profiled."""
-        raise ivy.exceptions.IvyNotImplementedException
+        self._running = False
+        func_wrapper._backend_fn_hook = None
+        namespace = ivy.__dict__
+        for name, (fn, wrapped) in self._wrapped.items():
+            if namespace.get(name) is wrapped:
+                namespace[name] = fn
+        _clear_dispatch_plans([fn for fn, _ in self._wrapped.values()])
+        self._wrapped = dict()
+        if self._save_dir is not None:
+            os.makedirs(self._save_dir, exist_ok=True)
+            self.export_chrome_trace(os.path.join(self._save_dir, "ivy_trace.json"))
+            with open(os.path.join(self._save_dir, "ivy_profile.log"), "w") as f:
+                f.write(self.table())
+
+    def table(self, *, sort_by: str = "total_time", limit: Optional[int] = None) -> str:
+        """
+        Format the statistics of the profiled ivy functions as a table.
+
+        Parameters
+        ----------
+        sort_by
+            The statistic to sort the functions by, in descending order. One of
+            ``calls``, ``total_time``, ``self_time``, ``kernel_time``,
+            ``overhead_time``, ``total_kernel_time`` or ``bytes``. Default is
+            ``total_time``.
+        limit
+            The maximum number of functions to include. Default is ``None``, which
+            includes all of them.
+
+        Returns
+        -------
+        ret
+            The table, with the times in milliseconds and the most common input
+            signature of each function.
+        """
+        ivy.assertions.check_elem_in_list(
+            sort_by,
+            [
+                "calls",
+                "total_time",
+                "self_time",
+                "kernel_time",
+                "overhead_time",
+                "total_kernel_time",
+                "bytes",
+            ],
+        )
+        stats = sorted(
+            self.stats.items(), key=lambda item: item[1][sort_by], reverse=True
+        )
+        row = "{:<32}{:>10}{:>14}{:>14}{:>14}{:>14}{:>20}{:>14}  {}"
+        lines = [
+            row.format(
+                "function",
+                "calls",
+                "total (ms)",
+                "self (ms)",
+                "kernel (ms)",
+                "overhead (ms)",
+                "total kernel (ms)",
+                "bytes",
+                "most common inputs",
+            )
+        ]
+        for name, fn_stats in stats[:limit]:
+            lines.append(
+                row.format(
+                    name,
+                    fn_stats["calls"],
+                    "{:.3f}".format(fn_stats["total_time"] * 1e3),
+                    "{:.3f}".format(fn_stats["self_time"] * 1e3),
+                    "{:.3f}".format(fn_stats["kernel_time"] * 1e3),
+                    "{:.3f}".format(fn_stats["overhead_time"] * 1e3),
+                    "{:.3f}".format(fn_stats["total_kernel_time"] * 1e3),
+                    fn_stats["bytes"],
+                    fn_stats["signatures"][0][0],
+                )
+            )
+        return "\n".join(lines) + "\n"
+
+    def export_chrome_trace(self, path: str):
+        """
+        Save the most recent calls of the profiled ivy functions as a chrome trace,
+        which can be viewed with ``chrome://tracing`` or Perfetto.
+
+        Parameters
+        ----------
+        path
+            The path of the json file to save the trace to.
+        """
+        pid = os.getpid()
+        events = [
+            {
+                "name": name,
+                "cat": "ivy",
+                "ph": "X",
+                "ts": (start - self._start_time) * 1e6,
+                "dur": elapsed * 1e6,
+                "pid": pid,
+                "tid": tid,
+                "args": {"inputs": list(signature)},
+            }
+            for name, start, elapsed, tid, signature in self._events
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
 
-    @abc.abstractmethod
     def __enter__(self):
-        raise ivy.exceptions.IvyNotImplementedException
+        self.start()
+        return self
 
-    @abc.abstractmethod
     def __exit__(self, exc_type, exc_val, exc_tb):
-        raise ivy.exceptions.IvyNotImplementedException
+        self.stop()
+
+    # Private #
+    # --------#
+
+    def _stack(self):
+        # the frames of the profiled functions being called in this thread, each
+        # with the time of its nested profiled functions, of its backend function, and
+        # of the backend functions of its nested profiled functions
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = list()
+            return self._local.stack
+
+    def _profile_fn(self, name, fn):
+        @functools.wraps(fn)
+        def new_fn(*args, **kwargs):
+            stack = self._stack()
+            frame = [0.0, 0.0, 0.0]
+            stack.append(frame)
+            ret = None
+            start = time.perf_counter()
+            try:
+                ret = fn(*args, **kwargs)
+                return ret
+            finally:
+                elapsed = time.perf_counter() - start
+                stack.pop()
+                self._record(name, frame, start, elapsed, args, kwargs, ret)
+                if stack:
+                    # including the time of the bookkeeping above
+                    stack[-1][0] += time.perf_counter() - start
+                    stack[-1][2] += frame[1] + frame[2]
+
+        return new_fn
+
+    def _profile_backend_fn(self, fn):
+        @functools.wraps(fn)
+        def new_fn(*args, **kwargs):
+            stack = self._stack()
+            if not self._running or not stack:
+                return fn(*args, **kwargs)
+            frame = stack[-1]
+            nested_time = frame[0]
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                # without the profiled functions called by the backend function
+                frame[1] += time.perf_counter() - start - (frame[0] - nested_time)
+
+        return new_fn
+
+    def _record(self, name, frame, start, elapsed, args, kwargs, ret):
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = _FnStats()
+        stats.calls += 1
+        stats.total_time += elapsed
+        stats.self_time += elapsed - frame[0]
+        stats.kernel_time += frame[1]
+        stats.total_kernel_time += frame[1] + frame[2]
+        rets = ret if isinstance(ret, (tuple, list)) else (ret,)
+        stats.bytes += sum([_nbytes(r) for r in rets])
+        signature = tuple(
+            [
+                s
+                for s in map(_array_signature, itertools.chain(args, kwargs.values()))
+                if s is not None
+            ]
+        )
+        stats.signatures[signature] += 1
+        self._events.append((name, start, elapsed, threading.get_ident(), signature))
@@ -1,13 +1,15 @@
 """Collection of general Ivy functions."""
 
 # global
+import functools
 import gc
 import inspect
 import math
+import sys
+from collections import OrderedDict
 from functools import wraps
 from numbers import Number
 from typing import Callable, Any, Union, List, Tuple, Dict, Iterable, Optional, Sequence
-import einops
 import numpy as np
 
 # local
@@ -30,16 +32,16 @@ FN_CACHE = dict()
 INF = float("inf")
 TMP_DIR = "/tmp"
 
-queue_timeout_stack = list()
-array_mode_stack = list()
-shape_array_mode_stack = list()
-nestable_mode_stack = list()
-exception_trace_mode_stack = list()
+queue_timeout_stack = ivy.ThreadLocalStack()
+array_mode_stack = ivy.ThreadLocalStack()
+shape_array_mode_stack = ivy.ThreadLocalStack()
+nestable_mode_stack = ivy.ThreadLocalStack()
+exception_trace_mode_stack = ivy.ThreadLocalStack()
 trace_mode_dict = dict()
 trace_mode_dict["frontend"] = "ivy/functional/frontends"
 trace_mode_dict["ivy"] = "ivy/"
 trace_mode_dict["full"] = ""
-show_func_wrapper_trace_mode_stack = list()
+show_func_wrapper_trace_mode_stack = ivy.ThreadLocalStack()
 
 
 def _parse_ellipsis(so, ndims):
@@ -1535,20 +1537,158 @@ def match_kwargs(
     return split_kwargs
 
 
-@handle_exceptions
-def cache_fn(func: Callable) -> Callable:
+def _sorted_dict_items(x):
+    # dict items in a deterministic order, also for keys which can't be compared
+    try:
+        return sorted(x.items())
+    except TypeError:
+        return sorted(x.items(), key=lambda kv: (type(kv[0]).__qualname__, repr(kv[0])))
+
+
+def _cache_key(x, refs):
+    # hashable key for the argument x. Arrays and unhashable objects are keyed by
+    # identity, and are added to refs so that their ids are not reused while the
+    # entry is cached. Hashable values are keyed together with their type, so that
+    # equal values of different types such as 1, 1.0 and True get separate entries
+    if ivy.is_array(x):
+        refs.append(x)
+        return "array", id(x)
+    if isinstance(x, (list, tuple)):
+        return type(x).__name__, tuple(_cache_key(v, refs) for v in x)
+    if isinstance(x, dict):
+        return "dict", tuple(
+            (_cache_key(k, refs), _cache_key(v, refs)) for k, v in _sorted_dict_items(x)
+        )
+    try:
+        hash(x)
+        return type(x), x
+    except TypeError:
+        refs.append(x)
+        return "id", id(x)
+
+
+def _array_cache_key(x, refs):
+    # keys arrays by shape and dtype instead of identity
+    if ivy.is_array(x):
+        return "array", tuple(x.shape), str(x.dtype)
+    if isinstance(x, (list, tuple)):
+        return type(x).__name__, tuple(_array_cache_key(v, refs) for v in x)
+    if isinstance(x, dict):
+        return "dict", tuple(
+            (_cache_key(k, refs), _array_cache_key(v, refs))
+            for k, v in _sorted_dict_items(x)
+        )
+    return _cache_key(x, refs)
+
+
+def _nbytes(x):
+    # approximate memory footprint of a cached output
+    if isinstance(x, ivy.Array):
+        x = x.data
+    if ivy.is_native_array(x):
+        return math.prod(x.shape) * ivy.dtype_bits(ivy.dtype(x)) // 8
+    if isinstance(x, (list, tuple)):
+        return sum(_nbytes(v) for v in x)
+    if isinstance(x, dict):
+        return sum(_nbytes(v) for v in x.values())
+    return sys.getsizeof(x)
+
+
+class _FnCache:
+    """LRU cache of the outputs of a single function, bounded by the number of
+    entries and/or the total number of bytes of the outputs."""
+
+    def __init__(self, func, max_size=None, max_bytes=None, array_key="identity"):
+        ivy.assertions.check_elem_in_list(array_key, ["identity", "shape_dtype"])
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.key_fn = _cache_key if array_key == "identity" else _array_cache_key
+        try:
+            self.signature = inspect.signature(func)
+        except (TypeError, ValueError):
+            self.signature = None
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, args, kwargs):
+        refs = list()
+        if self.signature is not None:
+            try:
+                bound = self.signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                return self.key_fn(tuple(bound.arguments.items()), refs), refs
+            except TypeError:
+                pass
+        return self.key_fn((args, kwargs), refs), refs
+
+    def add(self, key, ret, refs):
+        nbytes = _nbytes(ret) if self.max_bytes is not None else 0
+        self.entries[key] = (ret, refs, nbytes)
+        self.nbytes += nbytes
+        while self.entries and (
+            (self.max_size is not None and len(self.entries) > self.max_size)
+            or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+        ):
+            self.nbytes -= self.entries.popitem(last=False)[1][2]
+            self.evictions += 1
+
+    def info(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.entries),
+            "nbytes": self.nbytes,
+            "max_size": self.max_size,
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self):
+        self.entries.clear()
+        self.nbytes = 0
+
+
+@handle_exceptions
+def cache_fn(
+    func: Optional[Callable] = None,
+    /,
+    *,
+    max_size: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    array_key: str = "identity",
+) -> Callable:
     """Decorator to wrap a function, such that computed outputs are cached
     to avoid recalculating them later.
 
+    The cache of each function is a least recently used cache, shared by all
+    wrappers of the same function. Arguments are bound to the signature of the
+    function with the defaults applied, so positional, keyword and default
+    arguments all map to the same entry.
+
     Parameters
     ----------
     func
-        The function to wrap, whose output should be cached for later.
+        The function to wrap, whose output should be cached for later. If ``None``,
+        a decorator with the given cache settings is returned.
+    max_size
+        Maximum number of cached outputs, the least recently used outputs are
+        evicted beyond this. ``None`` for no limit. Default is ``None``.
+    max_bytes
+        Maximum total number of bytes of the cached outputs, the least recently used
+        outputs are evicted beyond this. ``None`` for no limit. Default is ``None``.
+    array_key
+        How array arguments are keyed, either by ``"identity"``, or by
+        ``"shape_dtype"`` for functions whose output only depends on the shapes and
+        dtypes of their array arguments. Default is ``"identity"``.
 
     Returns
     -------
     ret
-        The newly cache wrapped function.
+        The newly cache wrapped function, which has ``cache_info`` and
+        ``cache_clear`` methods.
 
     Examples
     --------
@@ -1568,6 +1708,8 @@ def cache_fn(func: Callable) -> Callable:
     >>> print(cached_sum(5, 3)) # Compute the output
     8
 
+    >>> print(cached_sum.cache_info()["hits"])
+    1
 
     With keyword arguments:
 
@@ -1579,38 +1721,81 @@ def cache_fn(func: Callable) -> Callable:
     >>> print(cached_line_eq(3, slp=2, itc=5)) # Returns the cached value
     11
 
-
-    Note: providing keyword arguments by position, or using the default
-    keyword argument values will prevent the cache from being used.
-
-    >>> print(cached_line_eq(5, slp=2)) # Output is re-computed
+    >>> print(cached_line_eq(5, slp=2)) # Compute the output
     10
 
-    >>> print(cached_line_eq(5)) # Output is re-computed
+    >>> print(cached_line_eq(5)) # Returns the cached value, as slp=2 is the default
     10
 
+    With cache settings:
+
+    >>> @ivy.cache_fn(max_size=1)
+    ... def square(x): return x * x
+    >>> print(square(2), square(3), square(2)) # 2 is evicted when caching 3
+    4 9 4
+
+    >>> print(square.cache_info()["evictions"])
+    2
+
     """
+    if func is None:
+        return functools.partial(
+            cache_fn, max_size=max_size, max_bytes=max_bytes, array_key=array_key
+        )
     global FN_CACHE
     if func not in FN_CACHE:
-        FN_CACHE[func] = dict()
+        FN_CACHE[func] = _FnCache(func, max_size, max_bytes, array_key)
+    cache = FN_CACHE[func]
 
     @wraps(func)
     def cached_fn(*args, **kwargs):
-        key = "".join(
-            [str(i) + ", " for i in args]
-            + [" kw, "]
-            + [str(i) + ", " for i in sorted(kwargs.items())]
-        )
-        cache = FN_CACHE[func]
-        if key in cache:
-            return cache[key]
+        key, refs = cache.key(args, kwargs)
+        if key in cache.entries:
+            cache.hits += 1
+            cache.entries.move_to_end(key)
+            return cache.entries[key][0]
+        cache.misses += 1
         ret = func(*args, **kwargs)
-        cache[key] = ret
+        cache.add(key, ret, refs)
         return ret
 
+    cached_fn.cache_info = cache.info
+    cached_fn.cache_clear = cache.clear
     return cached_fn
 
 
+@handle_exceptions
+def clear_fn_cache(func: Optional[Callable] = None, /) -> None:
+    """Clear the outputs cached by :func:`ivy.cache_fn`.
+
+    Parameters
+    ----------
+    func
+        The function whose cached outputs should be cleared, either the original
+        function or its cache wrapped version. Default is ``None``, which clears the
+        caches of all functions.
+
+    Examples
+    --------
+    >>> def my_sum(val1:float, val2:float)->float: return val1 + val2
+    >>> cached_sum = ivy.cache_fn(my_sum)
+    >>> print(cached_sum(3, 5))
+    8
+
+    >>> ivy.clear_fn_cache(cached_sum)
+    >>> print(cached_sum.cache_info()["size"])
+    0
+
+    """
+    if func is None:
+        for cache in FN_CACHE.values():
+            cache.clear()
+        return
+    func = getattr(func, "__wrapped__", func)
+    if func in FN_CACHE:
+        FN_CACHE[func].clear()
+
+
 @handle_exceptions
 def current_backend_str() -> Union[str, None]:
     """Return framework string
@@ -1627,6 +1812,230 @@ def current_backend_str() -> Union[str, None]:
     return fw.current_backend_str()
 
 
+# einops patterns compiled for an input shape, as plans of backend calls
+_EINOPS_PLAN_CACHE = dict()
+_EINOPS_PLAN_CACHE_SIZE = 1024
+
+
+def _parse_einops_expression(expression, anonymous):
+    # returns the groups of axis names, where each parenthesized composition of axes
+    # is a single group, and anonymous axes are given unique names. An ellipsis
+    # outside of parentheses is the group "...", as it stands for separate axes,
+    # while one in parentheses is the axis "..." of its composition
+    groups = []
+    group = None
+    for token in expression.replace("(", " ( ").replace(")", " ) ").split():
+        if token == "(":
+            if group is not None:
+                raise ivy.exceptions.IvyException(
+                    "nested parentheses are not allowed in the einops pattern"
+                )
+            group = []
+            continue
+        elif token == ")":
+            if group is None:
+                raise ivy.exceptions.IvyException(
+                    "unbalanced parentheses in the einops pattern"
+                )
+            groups.append(group)
+            group = None
+            continue
+        axes = [] if group is None else group
+        if token.isdecimal():
+            # unit axes are composed of no axes, other anonymous axes have fixed sizes
+            if int(token) != 1:
+                name = "{}{}".format(token, "'" * (len(anonymous) + 1))
+                anonymous[name] = int(token)
+                axes.append(name)
+        elif token == "..." and group is None:
+            groups.append(token)
+            continue
+        elif token == "..." or token.isidentifier():
+            axes.append(token)
+        else:
+            raise ivy.exceptions.IvyException(
+                "invalid axis name {} in the einops pattern".format(token)
+            )
+        if group is None:
+            groups.append(axes)
+    if group is not None:
+        raise ivy.exceptions.IvyException(
+            "unbalanced parentheses in the einops pattern"
+        )
+    return groups
+
+
+def _einops_axis_names(groups):
+    # the axis names of the groups, in order
+    return [a for group in groups for a in ([group] if group == "..." else group)]
+
+
+def _expand_einops_ellipsis(groups, ellipsis_axes):
+    # replaces the ellipsis with the axes which it stands for, as separate groups
+    # for a bare ellipsis, and composed with the other axes of its parentheses
+    expanded = []
+    for group in groups:
+        if group == "...":
+            expanded += [[a] for a in ellipsis_axes]
+        else:
+            expanded.append(
+                [
+                    a
+                    for axis in group
+                    for a in (ellipsis_axes if axis == "..." else [axis])
+                ]
+            )
+    return expanded
+
+
+def _compile_einops_pattern(kind, pattern, shape, axes_lengths):
+    if pattern.count("->") != 1:
+        raise ivy.exceptions.IvyException(
+            "the einops pattern must have a single '->', but found {}".format(pattern)
+        )
+    anonymous = dict()
+    left, right = pattern.split("->")
+    left = _parse_einops_expression(left, anonymous)
+    right = _parse_einops_expression(right, anonymous)
+    left_names = _einops_axis_names(left)
+    right_names = _einops_axis_names(right)
+    for names in (left_names, right_names):
+        if names.count("...") > 1 or len(set(names)) != len(names):
+            raise ivy.exceptions.IvyException(
+                "axes are repeated in the einops pattern {}".format(pattern)
+            )
+    if "..." in right_names and "..." not in left_names:
+        raise ivy.exceptions.IvyException(
+            "the ellipsis is on the right of the einops pattern, but not the left"
+        )
+
+    # expand the ellipsis
+    if "..." in left_names:
+        if "..." not in left:
+            raise ivy.exceptions.IvyException(
+                "the ellipsis can't be in parentheses on the left of the einops pattern"
+            )
+        num_ellipsis_dims = len(shape) - len(left) + 1
+        if num_ellipsis_dims < 0:
+            raise ivy.exceptions.IvyException(
+                "the input has {} dimensions, but the einops pattern {} needs at "
+                "least {}".format(len(shape), pattern, len(left) - 1)
+            )
+        ellipsis_axes = ["...{}".format(i) for i in range(num_ellipsis_dims)]
+        left = _expand_einops_ellipsis(left, ellipsis_axes)
+        right = _expand_einops_ellipsis(right, ellipsis_axes)
+        left_names = [a for group in left for a in group]
+        right_names = [a for group in right for a in group]
+    elif len(left) != len(shape):
+        raise ivy.exceptions.IvyException(
+            "the input has {} dimensions, but the einops pattern {} has {}".format(
+                len(shape), pattern, len(left)
+            )
+        )
+
+    # infer the lengths of the axes of the input
+    lengths = dict(anonymous)
+    lengths.update(axes_lengths)
+    for group, dim in zip(left, shape):
+        unknown = [a for a in group if a not in lengths]
+        known = math.prod([lengths[a] for a in group if a in lengths])
+        if len(unknown) > 1:
+            raise ivy.exceptions.IvyException(
+                "the lengths of the axes {} can't be inferred".format(unknown)
+            )
+        elif unknown and known and dim % known == 0:
+            lengths[unknown[0]] = dim // known
+        elif unknown or known != dim:
+            raise ivy.exceptions.IvyException(
+                "the shape {} doesn't match the einops pattern {}".format(
+                    shape, pattern
+                )
+            )
+
+    left_set = set(left_names)
+    right_set = set(right_names)
+    if kind == "rearrange" and left_set != right_set:
+        raise ivy.exceptions.IvyException(
+            "the axes {} must be on both sides of the einops pattern".format(
+                sorted(left_set ^ right_set)
+            )
+        )
+    elif kind == "reduce" and not right_set <= left_set:
+        raise ivy.exceptions.IvyException(
+            "the axes {} aren't on the left of the einops pattern".format(
+                sorted(right_set - left_set)
+            )
+        )
+    elif kind == "repeat":
+        if not left_set <= right_set:
+            raise ivy.exceptions.IvyException(
+                "the axes {} aren't on the right of the einops pattern".format(
+                    sorted(left_set - right_set)
+                )
+            )
+        missing = [a for a in right_names if a not in lengths]
+        if missing:
+            raise ivy.exceptions.IvyException(
+                "the lengths of the new axes {} must be specified".format(missing)
+            )
+
+    # the plan reshapes the input into its elementary axes, reduces the axes which
+    # aren't on the right, permutes the axes, broadcasts to the new axes, and then
+    # reshapes into the compositions on the right
+    plan = []
+    elementary_shape = tuple([lengths[a] for a in left_names])
+    if elementary_shape != tuple(shape):
+        plan.append(("reshape", elementary_shape))
+    reduced = tuple([i for i, a in enumerate(left_names) if a not in right_set])
+    if reduced:
+        plan.append(("reduce", reduced))
+    kept = [a for a in left_names if a in right_set]
+    permutation = tuple([kept.index(a) for a in right_names if a in left_set])
+    if permutation != tuple(range(len(permutation))):
+        plan.append(("permute_dims", permutation))
+    if len(kept) != len(right_names):
+        plan.append(
+            (
+                "reshape",
+                tuple([lengths[a] if a in left_set else 1 for a in right_names]),
+            )
+        )
+        plan.append(("broadcast_to", tuple([lengths[a] for a in right_names])))
+    final_shape = tuple([math.prod([lengths[a] for a in group]) for group in right])
+    if final_shape != tuple([lengths[a] for a in right_names]):
+        plan.append(("reshape", final_shape))
+    return tuple(plan)
+
+
+def _einops(kind, x, pattern, reduction, axes_lengths):
+    key = (kind, pattern, tuple(x.shape), tuple(axes_lengths.items()))
+    try:
+        plan = _EINOPS_PLAN_CACHE[key]
+    except KeyError:
+        plan = _compile_einops_pattern(kind, pattern, tuple(x.shape), axes_lengths)
+        if len(_EINOPS_PLAN_CACHE) >= _EINOPS_PLAN_CACHE_SIZE:
+            _EINOPS_PLAN_CACHE.pop(next(iter(_EINOPS_PLAN_CACHE), None), None)
+        _EINOPS_PLAN_CACHE[key] = plan
+    if kind == "reduce" and not callable(reduction):
+        ivy.assertions.check_elem_in_list(
+            reduction, ["min", "max", "sum", "mean", "prod"]
+        )
+    # the plan is replayed with the backend functions, on native arrays
+    backend = current_backend(x)
+    dtype = x.dtype
+    for op, arg in plan:
+        if op == "reduce":
+            if callable(reduction):
+                x = reduction(x, arg)
+            else:
+                x = getattr(backend, reduction)(x, axis=arg)
+        else:
+            x = getattr(backend, op)(x, arg)
+    if x.dtype != dtype:
+        x = backend.astype(x, dtype)
+    return x
+
+
 @inputs_to_native_arrays
 @handle_nestable
 @handle_exceptions
@@ -1659,8 +2068,7 @@ def einops_rearrange(
         New array with einops.rearrange having been applied.
 
     """
-    ret = einops.rearrange(x, pattern, **axes_lengths)
-    ret = ivy.array(ret, dtype=x.dtype)
+    ret = ivy.to_ivy(_einops("rearrange", x, pattern, None, axes_lengths))
     if ivy.exists(out):
         return ivy.inplace_update(out, ret)
     return ret
@@ -1723,8 +2131,7 @@ def einops_reduce(
         b: ivy.array([-1.4, 6.21])
     }
     """
-    ret = einops.reduce(x, pattern, reduction, **axes_lengths)
-    ret = ivy.array(ret, dtype=x.dtype)
+    ret = ivy.to_ivy(_einops("reduce", x, pattern, reduction, axes_lengths))
     if ivy.exists(out):
         return ivy.inplace_update(out, ret)
     return ret
@@ -1791,8 +2198,7 @@ def einops_repeat(
     }
 
     """
-    ret = einops.repeat(x, pattern, **axes_lengths)
-    ret = ivy.array(ret, dtype=x.dtype)
+    ret = ivy.to_ivy(_einops("repeat", x, pattern, None, axes_lengths))
     if ivy.exists(out):
         return ivy.inplace_update(out, ret)
     return ret
@@ -3258,6 +3664,12 @@ def vmap(
     This docstring is a summarised version of the `docstring
     <https://jax.readthedocs.io/en/latest/_autosummary/jax.vmap.html#jax-vmap>`_ for vmap from JAX documentation. # noqa
 
+    The JAX and PyTorch backends use their native vmap. The NumPy and TensorFlow
+    backends call `func` once on the whole batch, using the batching rules of
+    ``ivy.batching`` for the ivy functions it calls, and fall back to calling `func`
+    on each example when it uses a function without a batching rule, or data
+    dependent control flow. `func` should therefore be free of side effects.
+
     Examples
     --------
     With :func:`ivy.matmul` and :class:`ivy.Array` input:
@@ -3268,5 +3680,4 @@ def vmap(
     >>> print(z.shape)
     (3, 5, 2)
     """
-    # TODO: optimize in the numpy and tensorflow backends and extend functionality
     return current_backend().vmap(func, in_axes, out_axes)
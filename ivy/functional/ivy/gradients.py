@@ -276,7 +276,7 @@ def _variable_data(x):
 # Extra #
 # ------#
 
-with_grads_stack = list()
+with_grads_stack = ivy.ThreadLocalStack()
 
 
 class GradientTracking:
@@ -343,7 +343,7 @@ def with_grads(*, with_grads: bool = None) -> bool:
         return with_grads
     global with_grads_stack
     if not with_grads_stack:
-        with_grads_stack = [True]
+        return True
     return with_grads_stack[-1]
 
 
@@ -1,13 +1,12 @@
 """Collection of Ivy neural network layers in functional form."""
 
 # global
-from typing import Optional, Tuple, Union, List, Callable
+from typing import Optional, Tuple, Union, List, Callable, Sequence
 
 # local
 import ivy
 from ivy.backend_handler import current_backend
 from ivy.func_wrapper import (
-    inputs_to_ivy_arrays,
     to_native_arrays_and_back,
     handle_out_argument,
     handle_nestable,
@@ -227,6 +226,8 @@ def scaled_dot_product_attention(
     /,
     *,
     mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+    is_causal: bool = False,
+    chunk_size: Optional[int] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """Applies scaled dot product attention to inputs x using optional mask.
@@ -251,6 +252,17 @@ def scaled_dot_product_attention(
     mask
         The mask input array. The mask to apply to the query-key values. Default is
         None. The shape of mask input should be in *[batch_shape,num_queries,num_keys]*.
+    is_causal
+        Whether each query only attends to the keys at or before its own position,
+        with the last query aligned with the last key. The causal mask is combined
+        with ``mask``, if given. Default is ``False``.
+    chunk_size
+        If given, the keys and values are processed in chunks of this many keys, with
+        a running maximum and sum for the softmax, such that only
+        *[batch_shape,num_queries,chunk_size]* similarities are held in memory at a
+        time, rather than *[batch_shape,num_queries,num_keys]*. The result matches
+        that of the unchunked computation, up to floating point error. Default is
+        ``None``, which does not chunk the keys.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -402,9 +414,19 @@ def scaled_dot_product_attention(
                     [4.3, 5.3]]])
     }
     """
+    if ivy.exists(chunk_size):
+        return _chunked_scaled_dot_product_attention(
+            q, k, v, scale, mask, is_causal, chunk_size, out
+        )
+
     # BS x Q x K
     sim = ivy.einsum("... q f, ... k f -> ... q k", q, k) * scale
 
+    if is_causal:
+        num_keys = k.shape[-2]
+        causal_mask = _causal_mask(q.shape[-2], num_keys, 0, num_keys, ivy.dev(q))
+        mask = ivy.logical_and(mask, causal_mask) if ivy.exists(mask) else causal_mask
+
     if ivy.exists(mask):
 
         # BS x Q x K
@@ -421,6 +443,70 @@ def scaled_dot_product_attention(
     return ivy.einsum("... q k, ... k f -> ... q f", attn, v, out=out)
 
 
+def _causal_mask(num_queries, num_keys, start, stop, device):
+    # Q x (stop - start), for the keys from start to stop, with the last query
+    # aligned with the last key
+    query_positions = ivy.arange(
+        num_keys - num_queries, num_keys, dtype="int64", device=device
+    )
+    key_positions = ivy.arange(start, stop, dtype="int64", device=device)
+    return ivy.less_equal(
+        ivy.expand_dims(key_positions, axis=0), ivy.expand_dims(query_positions, axis=1)
+    )
+
+
+def _chunked_scaled_dot_product_attention(
+    q, k, v, scale, mask, is_causal, chunk_size, out
+):
+    num_queries, num_keys = q.shape[-2], k.shape[-2]
+    k_t = ivy.swapaxes(k, -1, -2)
+    # the running maximum and sum of the exponentials of the similarities, and the
+    # running output, normalised by the running sum only at the end
+    max_sim, sum_exp, ret = None, None, None
+    for start in range(0, num_keys, chunk_size):
+        stop = min(start + chunk_size, num_keys)
+
+        # BS x Q x C
+        sim = ivy.matmul(q, k_t[..., start:stop]) * scale
+        chunk_mask = mask
+        if ivy.exists(mask) and len(mask.shape) > 0 and mask.shape[-1] != 1:
+            # a mask of size 1 along the keys is broadcast to every chunk as it is
+            chunk_mask = mask[..., start:stop]
+        if is_causal:
+            causal_mask = _causal_mask(num_queries, num_keys, start, stop, ivy.dev(q))
+            chunk_mask = (
+                ivy.logical_and(chunk_mask, causal_mask)
+                if ivy.exists(chunk_mask)
+                else causal_mask
+            )
+        if ivy.exists(chunk_mask):
+            # a scalar fill value, broadcast by where
+            fill = ivy.array(
+                -ivy.finfo(ivy.dtype(sim)).max, dtype=ivy.dtype(sim), device=ivy.dev(q)
+            )
+            sim = ivy.where(ivy.logical_not(chunk_mask), fill, sim)
+
+        # BS x Q x 1
+        chunk_max_sim = ivy.max(sim, axis=-1, keepdims=True)
+        if max_sim is None:
+            max_sim = chunk_max_sim
+            exp_sim = ivy.exp(sim - max_sim)
+            sum_exp = ivy.sum(exp_sim, axis=-1, keepdims=True)
+            ret = ivy.matmul(exp_sim, v[..., start:stop, :])
+            continue
+        new_max_sim = ivy.maximum(max_sim, chunk_max_sim)
+        correction = ivy.exp(max_sim - new_max_sim)
+        max_sim = new_max_sim
+        exp_sim = ivy.exp(sim - max_sim)
+        sum_exp = sum_exp * correction + ivy.sum(exp_sim, axis=-1, keepdims=True)
+
+        # BS x Q x F
+        ret = ret * correction + ivy.matmul(exp_sim, v[..., start:stop, :])
+
+    # BS x Q x F
+    return ivy.divide(ret, sum_exp, out=out)
+
+
 @handle_exceptions
 @handle_array_like
 def multi_head_attention(
@@ -437,6 +523,10 @@ def multi_head_attention(
     to_q_v=None,
     to_kv_v=None,
     to_out_v=None,
+    is_causal: bool = False,
+    chunk_size: Optional[int] = None,
+    kv_cache=None,
+    new_lengths: Optional[Sequence[int]] = None,
     out: Optional[ivy.Array] = None,
 ) -> Union[ivy.Array, ivy.NativeArray]:
     """Applies multi-head attention to inputs x.
@@ -469,6 +559,23 @@ def multi_head_attention(
         The variables for function to_kv_fn. Default is ``None``.
     to_out_v
         The variables for function to_out_fn. Default is ``None``.
+    is_causal
+        Whether each query only attends to the keys at or before its own position,
+        with the last query aligned with the last key. Default is ``False``.
+    chunk_size
+        If given, the scaled dot-product attention processes the keys in chunks of
+        this many keys, to bound its memory. See
+        :func:`ivy.scaled_dot_product_attention`. Default is ``None``.
+    kv_cache
+        A cache of the keys and values of the previous tokens, for incremental
+        decoding. If given, the keys and values of the context, which are the new
+        tokens, are appended to the cache, and the queries attend to all of the
+        cached tokens of their sequence up to their own position. See
+        :class:`ivy.KVCache`. Default is ``None``.
+    new_lengths
+        The number of valid new tokens of each sequence, when ``kv_cache`` is given
+        and the new tokens are padded. Default is ``None``, in which case all of the
+        new tokens are valid.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -633,12 +740,23 @@ def multi_head_attention(
         (q, k, v),
     )
 
+    # BS x H x L x F,  BS x H x L x F,  BS x 1 x Q x L
+    if ivy.exists(kv_cache):
+        k, v, cache_mask = kv_cache.update(k, v, new_lengths=new_lengths)
+
     # BS x H x Q x K
     if ivy.exists(mask):
         mask = ivy.einops_repeat(mask, "... q k -> ... h q k", h=num_heads)
 
+    if ivy.exists(kv_cache):
+        # the cache mask is already causal, and aligned with each sequence
+        mask = ivy.logical_and(mask, cache_mask) if ivy.exists(mask) else cache_mask
+        is_causal = False
+
     # BS x H x Q x F
-    sdpa = ivy.scaled_dot_product_attention(q, k, v, scale, mask=mask)
+    sdpa = ivy.scaled_dot_product_attention(
+        q, k, v, scale, mask=mask, is_causal=is_causal, chunk_size=chunk_size
+    )
 
     # BS x Q x (HxF)
     sdpa = ivy.einops_rearrange(sdpa, "... h q f -> ... q (h f)")
@@ -1557,7 +1675,42 @@ def conv(
 # LSTM #
 
 
-@inputs_to_ivy_arrays
+def _lstm_scan(Wi_x, init_h, init_c, recurrent_kernel):
+    # the lstm steps, on native arrays with the backend functions, as the function
+    # wrappers would otherwise dominate the small matmul of each step
+    backend = current_backend(Wi_x)
+    timesteps = Wi_x.shape[-2]
+    out_channels = init_h.shape[-1]
+    i, g, o = out_channels, 2 * out_channels, 3 * out_channels
+    inplace = backend.inplace_arrays_supported()
+    if inplace:
+        hts = backend.empty(
+            tuple(Wi_x.shape[:-1]) + (out_channels,),
+            dtype=Wi_x.dtype,
+            device=backend.dev(Wi_x),
+        )
+    else:
+        hts = list()
+    ht = init_h
+    ct = init_c
+    for t in range(timesteps):
+        # BS x 4*out, with the input, forget, cell and output gates
+        gates = backend.add(backend.matmul(ht, recurrent_kernel), Wi_x[..., t, :])
+        gt = backend.tanh(gates[..., g:o])
+        gates = backend.sigmoid(gates)
+        ct = backend.add(
+            backend.multiply(gates[..., i:g], ct), backend.multiply(gates[..., :i], gt)
+        )
+        ht = backend.multiply(gates[..., o:], backend.tanh(ct))
+        if inplace:
+            hts[..., t, :] = ht
+        else:
+            hts.append(ht)
+    if not inplace:
+        hts = backend.stack(hts, axis=-2)
+    return hts, ct
+
+
 @handle_nestable
 @handle_exceptions
 @handle_array_like
@@ -1574,6 +1727,11 @@ def lstm_update(
 ) -> Tuple[ivy.Array, ivy.Array]:
     """Perform long-short term memory update by unrolling time dimension of input array.
 
+    The input projections of all of the timesteps are computed with a single matmul,
+    after which each step only computes the fused matmul of the recurrent kernel for
+    the four gates. The backends with a native recurrent scan, such as
+    ``jax.lax.scan``, ``tf.scan`` or the fused lstm of torch, use it instead.
+
     Parameters
     ----------
     x
@@ -1605,51 +1763,25 @@ def lstm_update(
     input_channels = x_shape[-1]
     x_flat = ivy.reshape(x, (-1, input_channels))
 
-    # input kernel
-    Wi = kernel
-    Wi_x = ivy.reshape(
-        ivy.matmul(x_flat, Wi) + (bias if bias is not None else 0),
-        batch_shape + [timesteps, -1],
-    )
-    Wii_x, Wif_x, Wig_x, Wio_x = ivy.split(Wi_x, num_or_size_splits=4, axis=-1)
-
-    # recurrent kernel
-    Wh = recurrent_kernel
-
-    # lstm states
-    ht = init_h
-    ct = init_c
-
-    # lstm outputs
-    hts_list = list()
+    # input kernel, with the biases of both kernels, for all timesteps at once
+    Wi_x = ivy.matmul(x_flat, kernel)
+    if bias is not None:
+        Wi_x = Wi_x + bias
+    if recurrent_bias is not None:
+        Wi_x = Wi_x + recurrent_bias
+    Wi_x = ivy.reshape(Wi_x, batch_shape + [timesteps, -1])
 
     # unrolled time dimension with lstm steps
-    for Wii_xt, Wif_xt, Wig_xt, Wio_xt in zip(
-        ivy.unstack(Wii_x, axis=-2),
-        ivy.unstack(Wif_x, axis=-2),
-        ivy.unstack(Wig_x, axis=-2),
-        ivy.unstack(Wio_x, axis=-2),
-    ):
-        htm1 = ht
-        ctm1 = ct
-
-        Wh_htm1 = ivy.matmul(htm1, Wh) + (
-            recurrent_bias if recurrent_bias is not None else 0
-        )
-        Whi_htm1, Whf_htm1, Whg_htm1, Who_htm1 = ivy.split(
-            Wh_htm1, num_or_size_splits=4, axis=-1
-        )
-
-        it = ivy.sigmoid(Wii_xt + Whi_htm1)
-        ft = ivy.sigmoid(Wif_xt + Whf_htm1)
-        gt = ivy.tanh(Wig_xt + Whg_htm1)
-        ot = ivy.sigmoid(Wio_xt + Who_htm1)
-        ct = ft * ctm1 + it * gt
-        ht = ot * ivy.tanh(ct)
+    hts, ct = _lstm_scan(
+        ivy.to_native(Wi_x),
+        ivy.to_native(init_h),
+        ivy.to_native(init_c),
+        ivy.to_native(recurrent_kernel),
+    )
+    return ivy.to_ivy(hts), ivy.to_ivy(ct)
 
-        hts_list.append(ivy.expand_dims(ht, axis=-2))
 
-    return ivy.concat(hts_list, axis=-2), ct
+lstm_update.mixed_function = True
 
 
 # Helpers #
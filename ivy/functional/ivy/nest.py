@@ -942,6 +942,213 @@ def map(
     return rets
 
 
+# Tree Flattening #
+# ----------------#
+
+# a tree spec is None for a leaf, and otherwise a tuple (kind, type, keys, children),
+# where keys are the keys of a dict or the fields of a namedtuple
+_TUPLE, _NAMEDTUPLE, _LIST, _DICT = range(4)
+
+# treedefs of recently flattened structures, each with its compiled unflatten fns
+_TREEDEF_CACHE = dict()
+_TREEDEF_CACHE_SIZE = 1024
+
+
+def _derived_flags(include_derived):
+    if include_derived is True:
+        return True, True, True
+    elif not include_derived:
+        return False, False, False
+    return (
+        include_derived.get(tuple, False),
+        include_derived.get(list, False),
+        include_derived.get(dict, False),
+    )
+
+
+def _flatten_spec(x, leaves, derived):
+    # types are matched exactly, unless the derived classes are also traversed
+    type_x = type(x)
+    if type_x is tuple or (derived[0] and isinstance(x, tuple)):
+        children = tuple([_flatten_spec(i, leaves, derived) for i in x])
+        if hasattr(x, "_fields"):
+            return _NAMEDTUPLE, type_x, x._fields, children
+        return _TUPLE, type_x, None, children
+    elif type_x is list or (derived[1] and isinstance(x, list)):
+        return (
+            _LIST,
+            type_x,
+            None,
+            tuple([_flatten_spec(i, leaves, derived) for i in x]),
+        )
+    elif type_x is dict or (derived[2] and isinstance(x, dict)):
+        return (
+            _DICT,
+            type_x,
+            tuple(x.keys()),
+            tuple([_flatten_spec(v, leaves, derived) for v in x.values()]),
+        )
+    leaves.append(x)
+    return None
+
+
+def _compile_unflatten(spec, to_mutable):
+    # returns a function which rebuilds the nest from an iterator over its leaves
+    if spec is None:
+        return next
+    kind, type_x, keys, children = spec
+    child_fns = [_compile_unflatten(c, to_mutable) for c in children]
+    if kind == _DICT:
+        return lambda it: type_x(**{k: fn(it) for k, fn in zip(keys, child_fns)})
+    elif kind == _LIST:
+        return lambda it: type_x([fn(it) for fn in child_fns])
+    elif to_mutable:
+        return lambda it: [fn(it) for fn in child_fns]
+    elif kind == _NAMEDTUPLE:
+        return lambda it: type_x(**{k: fn(it) for k, fn in zip(keys, child_fns)})
+    return lambda it: type_x([fn(it) for fn in child_fns])
+
+
+def _update_nest_inplace(x, ret, spec):
+    # the lists and dicts of x take the values of ret, as with nested_map(shallow=True)
+    if spec is None:
+        return
+    kind, _, keys, children = spec
+    if kind == _DICT:
+        for k, c in zip(keys, children):
+            _update_nest_inplace(x[k], ret[k], c)
+        x.update(**ret)
+        return
+    for i, c in enumerate(children):
+        _update_nest_inplace(x[i], ret[i], c)
+    if kind == _LIST:
+        x[:] = ret[:]
+
+
+class TreeDef:
+    __slots__ = ("_spec", "_hash", "num_leaves", "_mutable", "_unflatten_fns")
+
+    def __init__(self, spec, num_leaves):
+        """
+        Structure of a nest, as returned by ``ivy.tree_flatten``.
+
+        Treedefs are hashable, and flattening nests of the same structure returns the
+        same treedef, which compiles the reconstruction of the nest once.
+
+        Parameters
+        ----------
+        spec
+            The nested tuple describing the structure.
+        num_leaves
+            The number of leaves of the structure.
+        """
+        self._spec = spec
+        self._hash = hash(spec)
+        self.num_leaves = num_leaves
+        self._mutable = _spec_is_mutable(spec)
+        self._unflatten_fns = dict()
+
+    def _unflatten(self, leaves, to_mutable=False):
+        if to_mutable not in self._unflatten_fns:
+            self._unflatten_fns[to_mutable] = _compile_unflatten(self._spec, to_mutable)
+        return self._unflatten_fns[to_mutable](iter(leaves))
+
+    def __eq__(self, other):
+        return self is other or (
+            isinstance(other, TreeDef) and self._spec == other._spec
+        )
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return "TreeDef(num_leaves={})".format(self.num_leaves)
+
+
+def _spec_is_mutable(spec):
+    if spec is None:
+        return False
+    return spec[0] in (_LIST, _DICT) or any(_spec_is_mutable(c) for c in spec[3])
+
+
+def _tree_flatten(x, include_derived=None):
+    leaves = list()
+    spec = _flatten_spec(x, leaves, _derived_flags(include_derived))
+    try:
+        treedef = _TREEDEF_CACHE[spec]
+    except KeyError:
+        treedef = TreeDef(spec, len(leaves))
+        if len(_TREEDEF_CACHE) >= _TREEDEF_CACHE_SIZE:
+            _TREEDEF_CACHE.pop(next(iter(_TREEDEF_CACHE), None), None)
+        _TREEDEF_CACHE[spec] = treedef
+    return leaves, treedef
+
+
+@handle_exceptions
+def tree_flatten(
+    x: Any,
+    /,
+    *,
+    include_derived: Optional[Union[Dict[type, bool], bool]] = None,
+) -> Tuple[List, TreeDef]:
+    """Flattens a nest into the list of its leaves, and a hashable description of its
+    structure, with which ``ivy.tree_unflatten`` rebuilds the nest. Dicts, lists and
+    tuples are traversed, and everything else is a leaf.
+
+    Parameters
+    ----------
+    x
+        The nest to flatten.
+    include_derived
+        Whether to also traverse classes derived from tuple, list and dict.
+        Default is ``False``.
+
+    Returns
+    -------
+    ret
+        The leaves of x in depth-first order, and the treedef of x.
+
+    Examples
+    --------
+    >>> x = {"a": ivy.array([1.]), "b": (ivy.array([2.]), 3)}
+    >>> leaves, treedef = ivy.tree_flatten(x)
+    >>> print(leaves)
+    [ivy.array([1.]), ivy.array([2.]), 3]
+    >>> print(treedef)
+    TreeDef(num_leaves=3)
+    """
+    return _tree_flatten(x, include_derived)
+
+
+@handle_exceptions
+def tree_unflatten(treedef: TreeDef, leaves: Iterable, /) -> Any:
+    """Rebuilds a nest from its treedef and its leaves, inverting
+    ``ivy.tree_flatten``.
+
+    Parameters
+    ----------
+    treedef
+        The structure of the nest, as returned by ``ivy.tree_flatten``.
+    leaves
+        The leaves of the nest, in depth-first order.
+
+    Returns
+    -------
+    ret
+        The nest with the structure of treedef, and the given leaves.
+
+    Examples
+    --------
+    >>> x = {"a": ivy.array([1.]), "b": (ivy.array([2.]), 3)}
+    >>> leaves, treedef = ivy.tree_flatten(x)
+    >>> print(ivy.tree_unflatten(treedef, [1, 2, 3]))
+    {'a': 1, 'b': (2, 3)}
+    """
+    leaves = list(leaves)
+    ivy.assertions.check_equal(len(leaves), treedef.num_leaves)
+    return treedef._unflatten(leaves)
+
+
 @handle_exceptions
 def nested_map(
     x: Union[ivy.Array, ivy.NativeArray, Iterable],
@@ -998,6 +1205,19 @@ def nested_map(
         nested.
 
     """
+    if not (
+        ivy.exists(max_depth)
+        or ivy.exists(extra_nest_types)
+        or ivy.exists(_tuple_check_fn)
+        or ivy.exists(_list_check_fn)
+        or ivy.exists(_dict_check_fn)
+    ):
+        # map the leaves of the flattened nest, and rebuild it from its treedef
+        leaves, treedef = _tree_flatten(x, include_derived)
+        ret = treedef._unflatten([fn(leaf) for leaf in leaves], to_mutable)
+        if shallow and treedef._mutable:
+            _update_nest_inplace(x, ret, treedef._spec)
+        return ret
     extra_nest_types = ivy.default(extra_nest_types, ())
     if include_derived is True:
         include_derived = {tuple: True, list: True, dict: True}
@@ -1,6 +1,7 @@
 """Collection of random Ivy functions."""
 
 # global
+import math
 from typing import Optional, Union
 
 # local
@@ -80,6 +81,132 @@ def _check_valid_scale(std):
     )
 
 
+# Counter-based generator #
+# ------------------------ #
+
+# keys are int64 arrays of two 32-bit words, so that the generator only needs
+# integer arithmetic which all backends support, and gives the same streams on each
+_MASK_32 = 0xFFFFFFFF
+_THREEFRY_ROTATIONS = ((13, 15, 26, 6), (17, 29, 16, 24))
+_THREEFRY_PARITY = 0x1BD11BDA
+# number of random bits which are exactly representable in [0, 1) for each dtype
+_UNIFORM_BITS = {"float16": 11, "bfloat16": 8, "float32": 24, "float64": 53}
+
+
+def _rotate_left_32(x, r):
+    return ((x << r) | (x >> (32 - r))) & _MASK_32
+
+
+def _threefry2x32(key, x0, x1):
+    # the 20 round threefry-2x32 block cipher of the counters x0 and x1,
+    # as used by jax.random
+    k0, k1 = ivy.unstack(ivy.astype(key, "int64"), axis=-1)
+    ks = (k0, k1, k0 ^ k1 ^ _THREEFRY_PARITY)
+    x0 = (x0 + ks[0]) & _MASK_32
+    x1 = (x1 + ks[1]) & _MASK_32
+    for i in range(5):
+        for r in _THREEFRY_ROTATIONS[i % 2]:
+            x0 = (x0 + x1) & _MASK_32
+            x1 = _rotate_left_32(x1, r) ^ x0
+        x0 = (x0 + ks[(i + 1) % 3]) & _MASK_32
+        x1 = (x1 + ks[(i + 2) % 3] + i + 1) & _MASK_32
+    return x0, x1
+
+
+def _random_bits(key, num):
+    # num 32-bit words, the encrypted counters 0, ..., num - 1
+    half = -(-num // 2)
+    counters = ivy.arange(2 * half, dtype="int64", device=ivy.dev(key))
+    x0, x1 = _threefry2x32(key, counters[:half], counters[half:])
+    return ivy.concat([x0, x1])[:num]
+
+
+def _uniform_from_key(key, shape, dtype="float64"):
+    # uniform samples in [0, 1) of a float dtype, from as many random bits as the
+    # dtype represents exactly
+    shape = (shape,) if isinstance(shape, int) else tuple(shape)
+    num = math.prod(shape)
+    bits = _UNIFORM_BITS[ivy.as_ivy_dtype(dtype)]
+    if bits > 32:
+        words = _random_bits(key, 2 * num)
+        ints = ((words[:num] >> (64 - bits)) << 32) | words[num:]
+    else:
+        ints = _random_bits(key, num) >> (32 - bits)
+    return ivy.reshape(ivy.astype(ints, dtype) * 2.0**-bits, shape)
+
+
+def _random_uniform_from_key(key, low, high, shape, dtype, device):
+    float_dtype = dtype if ivy.is_float_dtype(dtype) else "float64"
+    uniform = _uniform_from_key(key, shape, float_dtype)
+    ret = ivy.astype(low + (high - low) * uniform, dtype)
+    return ivy.to_native(ivy.to_device(ret, device))
+
+
+def _random_normal_from_key(key, mean, std, shape, dtype, device):
+    # box-muller transform of pairs of uniform samples, using both outputs
+    shape = (shape,) if isinstance(shape, int) else tuple(shape)
+    num = math.prod(shape)
+    half = -(-num // 2)
+    uniform = _uniform_from_key(key, (2 * half,))
+    radius = ivy.sqrt(-2 * ivy.log1p(-uniform[:half]))
+    theta = 2 * math.pi * uniform[half:]
+    normal = ivy.concat([radius * ivy.cos(theta), radius * ivy.sin(theta)])[:num]
+    ret = ivy.astype(ivy.reshape(normal, shape) * std + mean, dtype)
+    return ivy.to_native(ivy.to_device(ret, device))
+
+
+def _randint_from_key(key, low, high, shape, dtype, device):
+    uniform = _uniform_from_key(key, shape)
+    ret = ivy.astype(low + ivy.floor(uniform * (high - low)), dtype)
+    return ivy.to_native(ivy.to_device(ret, device))
+
+
+def _multinomial_from_key(
+    key, population_size, num_samples, batch_size, probs, replace, device
+):
+    if probs is None:
+        probs = ivy.ones((batch_size, population_size)) / population_size
+    orig_probs_shape = list(ivy.shape(probs))
+    num_classes = orig_probs_shape[-1]
+    probs_flat = ivy.astype(ivy.reshape(probs, (-1, num_classes)), "float64")
+    probs_flat = probs_flat / ivy.sum(probs_flat, axis=-1, keepdims=True)
+    num_rows = probs_flat.shape[0]
+    if replace:
+        # inverse transform sampling of a uniform draw for each sample
+        cdf = ivy.cumsum(probs_flat, axis=-1)
+        uniform = _uniform_from_key(key, (num_rows, num_samples))
+        samples_flat = ivy.searchsorted(cdf, uniform, side="right")
+        samples_flat = ivy.minimum(samples_flat, num_classes - 1)
+    else:
+        if num_samples > num_classes:
+            raise ivy.exceptions.IvyException(
+                "cannot take a larger sample than the population when replace is "
+                "False, got {} samples of {} classes".format(num_samples, num_classes)
+            )
+        if ivy.any(ivy.sum(probs_flat > 0, axis=-1) < num_samples):
+            raise ivy.exceptions.IvyException(
+                "fewer non-zero probabilities than samples when replace is False"
+            )
+        # the classes with the largest probabilities divided by exponential noise
+        # are a sample without replacement, as with gumbel noise added to the logits.
+        # the uniform samples are shifted by half a step, so the noise is never zero
+        uniform = _uniform_from_key(key, (num_rows, num_classes))
+        noise = -ivy.log(uniform + 2.0**-54)
+        order = ivy.argsort(probs_flat / noise, axis=-1, descending=True, stable=True)
+        samples_flat = order[:, :num_samples]
+    ret = ivy.reshape(samples_flat, orig_probs_shape[:-1] + [num_samples])
+    return ivy.to_native(ivy.to_device(ivy.astype(ret, "int64"), device))
+
+
+def _shuffle_from_key(key, x):
+    # a random permutation, by sorting 63-bit random keys of the first axis
+    num = ivy.shape(x)[0]
+    words = _random_bits(key, 2 * num)
+    sort_keys = ((words[:num] >> 1) << 32) | words[num:]
+    permutation = ivy.argsort(sort_keys, stable=True)
+    return ivy.to_native(ivy.gather(x, permutation, axis=0))
+
+
 # Extra #
 # ------#
 
@@ -98,6 +225,7 @@ def random_uniform(
     device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
     dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
     seed: Optional[int] = None,
+    key: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """Draws samples from a uniform distribution. Samples are uniformly distributed over
@@ -126,6 +254,10 @@ def random_uniform(
         type will be the default floating-point data type. Default ``None``
     seed
         A python integer. Used to create a random seed distribution
+    key
+        A key of the counter-based generator, as returned by ``ivy.PRNGKey``. If
+        given, ``seed`` is ignored, and the samples only depend on the key, and are
+        the same for all backends. Default is ``None``.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -193,7 +325,14 @@ def random_uniform(
     ivy.array([5. , 7.3])
     """
     return ivy.current_backend().random_uniform(
-        low=low, high=high, shape=shape, device=device, dtype=dtype, out=out, seed=seed
+        low=low,
+        high=high,
+        shape=shape,
+        device=device,
+        dtype=dtype,
+        seed=seed,
+        key=key,
+        out=out,
     )
 
 
@@ -210,6 +349,7 @@ def random_normal(
     shape: Optional[Union[ivy.Shape, ivy.NativeShape]] = None,
     dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
     seed: Optional[int] = None,
+    key: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
@@ -233,6 +373,10 @@ def random_normal(
         type will be the default floating-point data type. Default ``None``
     seed
         A python integer. Used to create a random seed distribution
+    key
+        A key of the counter-based generator, as returned by ``ivy.PRNGKey``. If
+        given, ``seed`` is ignored, and the samples only depend on the key, and are
+        the same for all backends. Default is ``None``.
     device
         device on which to create the array 'cuda:0', 'cuda:1', 'cpu' etc.
         (Default value = None).
@@ -303,7 +447,14 @@ def random_normal(
     ivy.array([12.4, 11. ])
     """
     return ivy.current_backend().random_normal(
-        mean=mean, std=std, shape=shape, dtype=dtype, seed=seed, device=device, out=out
+        mean=mean,
+        std=std,
+        shape=shape,
+        dtype=dtype,
+        seed=seed,
+        key=key,
+        device=device,
+        out=out,
     )
 
 
@@ -322,6 +473,7 @@ def multinomial(
     replace: bool = True,
     device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
     seed: Optional[int] = None,
+    key: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """
@@ -347,6 +499,10 @@ def multinomial(
         (Default value = None)
     seed
         A python integer. Used to create a random seed distribution
+    key
+        A key of the counter-based generator, as returned by ``ivy.PRNGKey``. If
+        given, ``seed`` is ignored, and the samples only depend on the key, and are
+        the same for all backends. Default is ``None``.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -411,6 +567,7 @@ def multinomial(
         replace=replace,
         device=device,
         seed=seed,
+        key=key,
         out=out,
     )
 
@@ -429,6 +586,7 @@ def randint(
     device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
     dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
     seed: Optional[int] = None,
+    key: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """Returns an array filled with random integers generated uniformly between
@@ -453,6 +611,10 @@ def randint(
         type will be the default integer data type. Default ``None``
     seed
         A python integer. Used to create a random seed distribution
+    key
+        A key of the counter-based generator, as returned by ``ivy.PRNGKey``. If
+        given, ``seed`` is ignored, and the samples only depend on the key, and are
+        the same for all backends. Default is ``None``.
     out
         optional output array, for writing the result to. It must have a shape
         that the inputs broadcast to.
@@ -488,7 +650,14 @@ def randint(
 
     """
     return ivy.current_backend().randint(
-        low, high, shape=shape, device=device, dtype=dtype, seed=seed, out=out
+        low,
+        high,
+        shape=shape,
+        device=device,
+        dtype=dtype,
+        seed=seed,
+        key=key,
+        out=out,
     )
 
 
@@ -520,6 +689,7 @@ def shuffle(
     /,
     *,
     seed: Optional[int] = None,
+    key: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """Shuffles the given array along axis 0.
@@ -530,6 +700,10 @@ def shuffle(
         Input array. Should have a numeric data type.
     seed
         A python integer. Used to create a random seed distribution
+    key
+        A key of the counter-based generator, as returned by ``ivy.PRNGKey``. If
+        given, ``seed`` is ignored, and the samples only depend on the key, and are
+        the same for all backends. Default is ``None``.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -590,4 +764,116 @@ def shuffle(
         b: ivy.array([3, 0, 9])
     }
     """
-    return ivy.current_backend(x).shuffle(x, seed=seed, out=out)
+    return ivy.current_backend(x).shuffle(x, seed=seed, key=key, out=out)
+
+
+@handle_exceptions
+def PRNGKey(
+    seed: int,
+    /,
+    *,
+    device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+) -> ivy.Array:
+    """Creates a key of the counter-based random number generator, which can be
+    passed as ``key`` to the random functions instead of a seed.
+
+    The samples drawn with a key only depend on the key, and not on any global state,
+    so they are the same for all backends, and can be drawn from several threads or
+    processes at once. New keys are derived from a key with ``ivy.split_key`` and
+    ``ivy.fold_in``, a key should not be used for more than one random function call.
+
+    Parameters
+    ----------
+    seed
+        A python integer, of which the lowest 64 bits are used.
+    device
+        device on which to create the key 'cuda:0', 'cuda:1', 'cpu' etc.
+        (Default value = None).
+
+    Returns
+    -------
+    ret
+        The key, an int64 array of two 32-bit words, which are the same as those of
+        ``jax.random.PRNGKey(seed)``.
+
+    Examples
+    --------
+    >>> key = ivy.PRNGKey(42)
+    >>> print(key)
+    ivy.array([ 0, 42])
+
+    >>> ivy.random_uniform(shape=3, key=key)
+    ivy.array([0.57414436, 0.85663748, 0.05946118])
+    """
+    return ivy.array(
+        [(seed >> 32) & _MASK_32, seed & _MASK_32], dtype="int64", device=device
+    )
+
+
+@handle_exceptions
+def split_key(
+    key: Union[ivy.Array, ivy.NativeArray],
+    /,
+    *,
+    num: int = 2,
+) -> ivy.Array:
+    """Splits a key of the counter-based random number generator into new keys,
+    which give independent streams of random numbers.
+
+    Parameters
+    ----------
+    key
+        The key to split, as returned by ``ivy.PRNGKey``.
+    num
+        Number of keys to create. Default is ``2``.
+
+    Returns
+    -------
+    ret
+        The new keys, stacked along the first axis of an array of shape ``(num, 2)``,
+        the same as those of ``jax.random.split``.
+
+    Examples
+    --------
+    >>> key, subkey = ivy.split_key(ivy.PRNGKey(0))
+    >>> print(key)
+    ivy.array([4146024105,  967050713])
+
+    >>> keys = ivy.split_key(ivy.PRNGKey(0), num=3)
+    >>> print(keys.shape)
+    ivy.Shape(3, 2)
+    """
+    return ivy.reshape(_random_bits(key, 2 * num), (num, 2))
+
+
+@handle_exceptions
+def fold_in(
+    key: Union[ivy.Array, ivy.NativeArray],
+    data: int,
+    /,
+) -> ivy.Array:
+    """Derives a new key of the counter-based random number generator from a key
+    and an integer, such as the index of a worker or of a step.
+
+    Parameters
+    ----------
+    key
+        The key to derive the new key from, as returned by ``ivy.PRNGKey``.
+    data
+        A python integer, of which the lowest 32 bits are used. Different values give
+        independent keys.
+
+    Returns
+    -------
+    ret
+        The new key, the same as that of ``jax.random.fold_in``.
+
+    Examples
+    --------
+    >>> key = ivy.PRNGKey(0)
+    >>> worker_keys = [ivy.fold_in(key, i) for i in range(4)]
+    >>> ivy.random_normal(shape=2, key=worker_keys[1])
+    ivy.array([ 1.62003279, -0.15379111])
+    """
+    counters = ivy.array([0, data & _MASK_32], dtype="int64", device=ivy.dev(key))
+    return ivy.concat(_threefry2x32(key, counters[:1], counters[1:]))
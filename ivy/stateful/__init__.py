@@ -2,8 +2,12 @@ from . import activations
 from .activations import *
 from . import converters
 from .converters import *
+from . import flat_parameters
+from .flat_parameters import *
 from . import initializers
 from .initializers import *
+from . import kv_cache
+from .kv_cache import *
 from . import layers
 from .layers import *
 from . import module
@@ -0,0 +1,214 @@
+"""Packed storage of module parameters, in one flat buffer per dtype and device."""
+
+# global
+from typing import Optional, Union
+
+# local
+import ivy
+from ivy.container import Container
+from ivy.functional.ivy.gradients import _is_variable
+
+
+def _flatten(x):
+    return ivy.reshape(x, (-1,))
+
+
+class FlatParameters:
+    def __init__(self, v: Container, /):
+        """
+        Pack nested parameters into one contiguous buffer per dtype and device.
+
+        The parameters are then accessed through views into the buffers, returned by
+        ``unpack``, and operations over all of the parameters, such as an optimizer
+        step or a gradient norm, are applied to a handful of buffers rather than to
+        every leaf. On backends without array views, such as jax and tensorflow,
+        ``unpack`` returns slices of the buffers instead.
+
+        Parameters
+        ----------
+        v
+            Nested variables to pack, such as ``module.v``.
+        """
+        # each leaf is stored as (key_chain, group, start, stop, shape), with groups
+        # named after the dtype and device of their buffer
+        self._specs = list()
+        group_leaves, group_sizes = dict(), dict()
+        for kc, x in v.cont_to_iterator():
+            group = "{}_{}".format(ivy.dtype(x), ivy.dev(x)).replace(":", "")
+            group_leaves.setdefault(group, list()).append(x)
+            start = group_sizes.get(group, 0)
+            group_sizes[group] = start + x.size
+            self._specs.append((kc, group, start, start + x.size, tuple(x.shape)))
+        buffers, segment_ids = dict(), dict()
+        for group, xs in group_leaves.items():
+            buffer = ivy.concat([_flatten(ivy.stop_gradient(x)) for x in xs])
+            buffers[group] = ivy.variable(buffer) if _is_variable(xs[0]) else buffer
+            # index of the parameter which each element of the buffer belongs to
+            segment_ids[group] = ivy.concat(
+                [
+                    ivy.full((x.size,), i, dtype="int64", device=ivy.dev(x))
+                    for i, x in enumerate(xs)
+                ]
+            )
+        self._buffers = Container(buffers)
+        self._segment_ids = Container(segment_ids)
+        self._num_params = Container(
+            {group: len(xs) for group, xs in group_leaves.items()}
+        )
+
+    # Public #
+    # -------#
+
+    @property
+    def buffers(self) -> Container:
+        """The flat buffers, with one leaf per dtype and device."""
+        return self._buffers
+
+    def pack(self, x: Container, /) -> Container:
+        """
+        Pack nested arrays with the structure of the parameters, such as their
+        gradients, into flat arrays with the layout of the buffers.
+
+        Parameters
+        ----------
+        x
+            Nested arrays, with the same key chains and shapes as the parameters.
+
+        Returns
+        -------
+        ret
+            Container with one flat array per buffer.
+        """
+        group_leaves = dict()
+        for kc, group, _, _, _ in self._specs:
+            group_leaves.setdefault(group, list()).append(
+                _flatten(x.cont_at_key_chain(kc))
+            )
+        return Container(
+            {group: ivy.concat(leaves) for group, leaves in group_leaves.items()}
+        )
+
+    def unpack(self, buffers: Optional[Container] = None, /) -> Container:
+        """
+        Nested parameters, as views into flat buffers.
+
+        Parameters
+        ----------
+        buffers
+            Flat arrays with the layout of the buffers. Default is ``None``, which
+            unpacks the buffers themselves.
+
+        Returns
+        -------
+        ret
+            Container with the structure of the packed parameters.
+        """
+        buffers = ivy.default(buffers, self._buffers)
+        ret = Container()
+        for kc, group, start, stop, shape in self._specs:
+            ret.cont_set_at_key_chain(
+                kc, ivy.reshape(buffers[group][start:stop], shape), inplace=True
+            )
+        return ret
+
+    def set_buffers(self, buffers: Container, /):
+        """
+        Set the values of the buffers, in-place where the backend supports it, so
+        that previously unpacked views see the new values.
+
+        Parameters
+        ----------
+        buffers
+            Flat arrays with the layout of the buffers.
+        """
+        if ivy.inplace_variables_supported():
+            for group, buffer in buffers.items():
+                ivy.inplace_update(self._buffers[group], buffer)
+        else:
+            self._buffers = buffers
+
+    def param_norms(self, x: Optional[Container] = None, /) -> Container:
+        """
+        Norm of each packed parameter, broadcast to each of its elements.
+
+        This is a single reduction per buffer, and is used by the layer-wise
+        optimizers such as LARS and LAMB.
+
+        Parameters
+        ----------
+        x
+            Flat arrays with the layout of the buffers. Default is ``None``, which
+            takes the norms of the buffers themselves.
+
+        Returns
+        -------
+        ret
+            Flat arrays with the layout of the buffers, holding the norms.
+        """
+        x = ivy.default(x, self._buffers)
+        return Container(
+            {
+                group: ivy.sqrt(
+                    ivy.scatter_flat(
+                        self._segment_ids[group],
+                        ivy.square(buffer),
+                        size=self._num_params[group],
+                        reduction="sum",
+                    )
+                )[self._segment_ids[group]]
+                for group, buffer in x.items()
+            }
+        )
+
+    def vector_norm(
+        self, x: Optional[Container] = None, /, *, ord: Union[int, float] = 2
+    ) -> ivy.Array:
+        """
+        Norm over all of the packed parameters, as a single vector.
+
+        Parameters
+        ----------
+        x
+            Flat arrays with the layout of the buffers. Default is ``None``, which
+            takes the norm of the buffers themselves.
+        ord
+            Order of the norm. Default is ``2``.
+
+        Returns
+        -------
+        ret
+            The norm.
+        """
+        x = ivy.default(x, self._buffers)
+        norms = ivy.stack(
+            [
+                ivy.astype(ivy.vector_norm(buffer, ord=ord), ivy.default_float_dtype())
+                for buffer in x.values()
+            ]
+        )
+        return ivy.vector_norm(norms, ord=ord)
+
+    def clip_vector_norm(
+        self, x: Container, max_norm: float, /, *, ord: Union[int, float] = 2
+    ) -> Container:
+        """
+        Scale flat arrays such that their norm over all of the packed parameters is
+        no larger than ``max_norm``, such as to clip gradients by their global norm.
+
+        Parameters
+        ----------
+        x
+            Flat arrays with the layout of the buffers.
+        max_norm
+            The maximum value of the norm.
+        ord
+            Order of the norm. Default is ``2``.
+
+        Returns
+        -------
+        ret
+            The clipped flat arrays.
+        """
+        norm = self.vector_norm(x, ord=ord)
+        ratio = ivy.minimum(ivy.stable_divide(max_norm, norm), 1.0)
+        return x.cont_map(lambda buffer, _: buffer * ivy.astype(ratio, buffer.dtype))
@@ -0,0 +1,194 @@
+"""Preallocated key and value cache, for incremental decoding with attention."""
+
+# global
+from typing import Optional, Sequence, Tuple, Union
+
+# local
+import ivy
+
+
+def _write_tokens(buffer, new, start, /):
+    # writes the new tokens into the buffer from position start, in-place for the
+    # backends which support in-place updates, and otherwise by concatenating them
+    # with the untouched parts of the buffer
+    stop = start + new.shape[2]
+    if ivy.inplace_arrays_supported():
+        buffer[:, :, start:stop] = new
+        return buffer
+    return ivy.concat([buffer[:, :, :start], new, buffer[:, :, stop:]], axis=2)
+
+
+class KVCache:
+    def __init__(
+        self,
+        batch_size: int,
+        max_length: int,
+        num_heads: int,
+        head_dim: int,
+        /,
+        *,
+        dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
+        device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+    ):
+        """
+        Cache of the attention keys and values of previous tokens, for incremental
+        decoding with ``ivy.multi_head_attention``.
+
+        The keys and values are stored in buffers preallocated for ``max_length``
+        tokens, and the keys and values of new tokens are written into the buffers,
+        in-place for the backends which support in-place updates, such that previous
+        tokens are never projected again. Each sequence
+        in the batch has its own length, so that sequences of different lengths can
+        be decoded together.
+
+        Parameters
+        ----------
+        batch_size
+            The number of sequences in the batch.
+        max_length
+            The maximum number of tokens cached for each sequence.
+        num_heads
+            The number of attention heads.
+        head_dim
+            The dimension of each of the heads.
+        dtype
+            The data type of the buffers. Default is ``None``, which uses the default
+            float dtype.
+        device
+            The device of the buffers. Default is ``None``, which uses the default
+            device.
+        """
+        self._max_length = max_length
+        # BS x H x L x F
+        shape = (batch_size, num_heads, max_length, head_dim)
+        self._keys = ivy.zeros(shape, dtype=dtype, device=device)
+        self._values = ivy.zeros(shape, dtype=dtype, device=device)
+        self._lengths = [0] * batch_size
+
+    # Properties #
+    # -----------#
+
+    @property
+    def max_length(self) -> int:
+        """The maximum number of tokens cached for each sequence."""
+        return self._max_length
+
+    @property
+    def lengths(self) -> Tuple[int, ...]:
+        """The number of tokens cached for each sequence."""
+        return tuple(self._lengths)
+
+    @property
+    def keys(self) -> ivy.Array:
+        """The cached keys, up to the longest sequence. *[batch,heads,length,feat]*"""
+        return self._keys[:, :, : max(self._lengths)]
+
+    @property
+    def values(self) -> ivy.Array:
+        """The cached values, up to the longest sequence. *[batch,heads,length,feat]*"""
+        return self._values[:, :, : max(self._lengths)]
+
+    # Public #
+    # -------#
+
+    def update(
+        self,
+        k: ivy.Array,
+        v: ivy.Array,
+        /,
+        *,
+        new_lengths: Optional[Sequence[int]] = None,
+    ) -> Tuple[ivy.Array, ivy.Array, ivy.Array]:
+        """
+        Append the keys and values of new tokens to the cache, and return all of the
+        cached keys and values, with the mask for attending to them from the new
+        tokens.
+
+        Parameters
+        ----------
+        k
+            The keys of the new tokens. *[batch,heads,new_tokens,feat]*
+        v
+            The values of the new tokens. *[batch,heads,new_tokens,feat]*
+        new_lengths
+            The number of valid new tokens of each sequence, for inputs padded to the
+            same number of new tokens. Default is ``None``, in which case all of the
+            new tokens are valid.
+
+        Returns
+        -------
+        ret
+            The cached keys and values, including the new ones, up to the longest
+            sequence *[batch,heads,length,feat]*, and the mask for the new tokens
+            *[batch,1,new_tokens,length]*, with which each new token attends to the
+            previous tokens of its sequence and to itself.
+        """
+        num_new = k.shape[-2]
+        new_lengths = ivy.default(new_lengths, [num_new] * len(self._lengths))
+        old_lengths = self._lengths
+        lengths = [old + new for old, new in zip(old_lengths, new_lengths)]
+        ivy.assertions.check_true(
+            max(lengths) <= self._max_length,
+            message="the cache is full, with a maximum length of {}".format(
+                self._max_length
+            ),
+        )
+        k, v = ivy.to_native(k), ivy.to_native(v)
+        if len(set(old_lengths)) == 1 and len(set(new_lengths)) == 1:
+            # all of the sequences are appended to at the same position, without the
+            # padding beyond the valid new tokens
+            start, num = old_lengths[0], new_lengths[0]
+            self._keys = _write_tokens(self._keys, k[:, :, :num], start)
+            self._values = _write_tokens(self._values, v[:, :, :num], start)
+        elif ivy.inplace_arrays_supported():
+            for i, (start, num) in enumerate(zip(old_lengths, new_lengths)):
+                self._keys[i, :, start : start + num] = k[i, :, :num]
+                self._values[i, :, start : start + num] = v[i, :, :num]
+        else:
+            self._keys, self._values = [
+                ivy.concat(
+                    [
+                        _write_tokens(buffer[i : i + 1], new[i : i + 1, :, :num], start)
+                        for i, (start, num) in enumerate(zip(old_lengths, new_lengths))
+                    ],
+                    axis=0,
+                )
+                for buffer, new in ((self._keys, k), (self._values, v))
+            ]
+        self._lengths = lengths
+
+        # BS x 1 x Q x L
+        device = ivy.dev(self._keys)
+        key_positions = ivy.arange(max(lengths), dtype="int64", device=device)
+        query_positions = ivy.expand_dims(
+            ivy.array(old_lengths, dtype="int64", device=device), axis=-1
+        ) + ivy.arange(num_new, dtype="int64", device=device)
+        mask = ivy.logical_and(
+            ivy.less_equal(key_positions, ivy.expand_dims(query_positions, axis=-1)),
+            ivy.less(
+                key_positions,
+                ivy.reshape(
+                    ivy.array(lengths, dtype="int64", device=device), (-1, 1, 1)
+                ),
+            ),
+        )
+        return self.keys, self.values, ivy.expand_dims(mask, axis=1)
+
+    def trim(self, lengths: Union[int, Sequence[int]], /):
+        """
+        Trim the cached sequences to at most ``lengths`` tokens, such as to discard
+        rejected draft tokens. The buffers are not reallocated.
+
+        Parameters
+        ----------
+        lengths
+            The maximum number of tokens to keep, either for all of the sequences or
+            for each of them.
+        """
+        if isinstance(lengths, int):
+            lengths = [lengths] * len(self._lengths)
+        self._lengths = [min(old, new) for old, new in zip(self._lengths, lengths)]
+
+    def reset(self):
+        """Empty the cache, without reallocating the buffers."""
+        self._lengths = [0] * len(self._lengths)
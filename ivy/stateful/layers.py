@@ -202,6 +202,7 @@ class MultiHeadAttention(Module):
         with_to_q_fn=True,
         with_to_kv_fn=True,
         with_to_out_fn=True,
+        chunk_size=None,
         device=None,
         v=None,
         build_mode="on_init",
@@ -237,6 +238,10 @@ class MultiHeadAttention(Module):
             Whether to include fully connected mapping from output scaled dot-product
             attention to final output.
             Default is ``True``.
+        chunk_size
+            If given, the attention processes the keys in chunks of this many keys,
+            with a running softmax, such that its memory grows linearly rather than
+            quadratically with the sequence length. Default is ``None``.
         device
             device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. Default is cpu.
@@ -255,6 +260,7 @@ class MultiHeadAttention(Module):
         """
         v_exists = ivy.exists(v)
         self._query_dim = query_dim
+        self._head_dim = head_dim
         self._inner_dim = head_dim * num_heads
         self._dropout_rate = dropout_rate
         self._context_dim = ivy.default(context_dim, query_dim)
@@ -263,6 +269,7 @@ class MultiHeadAttention(Module):
         self._with_to_q_fn = with_to_q_fn
         self._with_to_kv_fn = with_to_kv_fn
         self._with_to_out_fn = with_to_out_fn
+        self._chunk_size = chunk_size
         ivy.Module.__init__(
             self,
             device=device,
@@ -316,7 +323,41 @@ class MultiHeadAttention(Module):
         else:
             return {}
 
-    def _forward(self, inputs, context=None, mask=None):
+    def init_kv_cache(self, batch_size, max_length, /):
+        """
+        Create a key and value cache for incremental decoding with this layer.
+
+        Parameters
+        ----------
+        batch_size
+            The number of sequences in the batch.
+        max_length
+            The maximum number of tokens cached for each sequence.
+
+        Returns
+        -------
+        ret
+            An empty cache, to pass to the forward pass as ``kv_cache``.
+        """
+        return ivy.KVCache(
+            batch_size,
+            max_length,
+            self._num_heads,
+            self._head_dim,
+            dtype=self._dtype,
+            device=self._dev,
+        )
+
+    def _forward(
+        self,
+        inputs,
+        context=None,
+        mask=None,
+        *,
+        is_causal=False,
+        kv_cache=None,
+        new_lengths=None,
+    ):
         """
         Perform forward pass of the MultiHeadAttention layer.
 
@@ -329,6 +370,16 @@ class MultiHeadAttention(Module):
             *[batch_shape,num_values,cont_feats]*.
         mask
             (Default value = None)
+        is_causal
+            Whether each query only attends to the keys at or before its own
+            position. Default is ``False``.
+        kv_cache
+            A cache of the keys and values of the previous tokens, created by
+            ``init_kv_cache``, to which those of the new tokens are appended.
+            Default is ``None``.
+        new_lengths
+            The number of valid new tokens of each sequence, for padded inputs
+            with a ``kv_cache``. Default is ``None``.
 
         Returns
         -------
@@ -351,6 +402,10 @@ class MultiHeadAttention(Module):
             to_q_v=self.v.to_q if self._with_to_q_fn else None,
             to_kv_v=self.v.to_kv if self._with_to_kv_fn else None,
             to_out_v=self.v.to_out if self._with_to_out_fn else None,
+            is_causal=is_causal,
+            chunk_size=self._chunk_size,
+            kv_cache=kv_cache,
+            new_lengths=new_lengths,
         )
 
 
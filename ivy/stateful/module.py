@@ -39,6 +39,7 @@ except ImportError:
 
 import re
 import inspect
+import operator
 from collections import OrderedDict
 from typing import Optional, Dict, List
 
@@ -49,6 +50,17 @@ from ivy.func_wrapper import _get_first_array
 from ivy.functional.ivy.gradients import _is_variable
 
 
+def _native_leaves(v, leaves, /):
+    # the native arrays of the leaves of container v, found by a plain walk of its
+    # dicts, which is much cheaper than mapping a function over the container
+    for x in dict.values(v):
+        if isinstance(x, dict):
+            _native_leaves(x, leaves)
+        else:
+            leaves.append(x.data if isinstance(x, ivy.Array) else x)
+    return leaves
+
+
 # Base #
 # -----#
 class Module(abc.ABC):
@@ -142,15 +154,11 @@ class Module(abc.ABC):
         self._submod_depth = None
         self._submods_to_track = None
         self._track_submod_call_order = False
-        self.submod_rets = ivy.Container(
-            alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
-        )
+        self._reset_submod_tracking()
         self.expected_submod_rets = None
         self.submod_dict = dict()
-        self.submod_call_order = ivy.Container(
-            alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
-        )
         self._sub_mods = set()
+        self._native_v_cache = None
         self._dtype = dtype
         self._args = args
         self._kwargs = kwargs
@@ -847,6 +855,44 @@ class Module(abc.ABC):
         idx_key = submod_dict[name_key][id_str]
         return " " * self.mod_depth() + "_".join([name_key, idx_key])
 
+    def _reset_submod_tracking(self):
+        """Replace the tracked submodule returns and call order with empty
+        containers."""
+        self.submod_rets = ivy.Container(
+            alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
+        )
+        self.submod_call_order = ivy.Container(
+            alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
+        )
+
+    def _to_native_v(self, v, /):
+        """
+        Convert the variables to native arrays, reusing the converted container of
+        the previous call while the variables hold the same native arrays.
+
+        Parameters
+        ----------
+        v
+            The container of variables to convert.
+
+        Returns
+        -------
+        ret
+            The container of native arrays.
+        """
+        natives = _native_leaves(v, [])
+        cache = self._native_v_cache
+        if (
+            cache is not None
+            and cache[0] is v
+            and len(cache[1]) == len(natives)
+            and all(map(operator.is_, cache[1], natives))
+        ):
+            return cache[2]
+        native_v = ivy.to_native(v)
+        self._native_v_cache = (v, natives, native_v)
+        return native_v
+
     def _add_submod_ret(self, ret, /):
         """
         Add returns in the submodule return of the top module.
@@ -1025,12 +1071,18 @@ class Module(abc.ABC):
         ret
         """
         with_grads = ivy.with_grads(with_grads=with_grads)
-        self.submod_rets = ivy.Container(
-            alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
-        )
-        self.submod_call_order = ivy.Container(
-            alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
-        )
+        if not (
+            track_submod_rets
+            or track_submod_call_order
+            or ivy.exists(expected_submod_rets)
+        ):
+            # nothing is tracked, so the forward pass skips the tracking structures,
+            # only clearing those left behind by a previous tracked call
+            if self.submod_rets or self.submod_call_order:
+                self._reset_submod_tracking()
+            v = self._to_native_v(v) if isinstance(v, Container) else ivy.to_native(v)
+            return self._call(*args, v=v, with_grads=with_grads, **kwargs)
+        self._reset_submod_tracking()
         self._set_submod_flags(
             track_submod_rets,
             submod_depth,
@@ -1045,6 +1097,21 @@ class Module(abc.ABC):
         self._unset_submod_flags()
         return ret
 
+    def flatten_v(self):
+        """
+        Pack the variables into one flat buffer per dtype and device, and replace
+        them with views into the buffers.
+
+        Returns
+        -------
+        ret
+            The packed variables, which can be passed to ``Optimizer.step`` in place
+            of the variables, so that the update is applied to whole buffers.
+        """
+        flat = ivy.FlatParameters(self.v)
+        self.v = flat.unpack()
+        return flat
+
     def save_weights(self, weights_path, /):
         """
         Save the weights on the Module.
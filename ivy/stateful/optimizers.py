@@ -7,6 +7,7 @@ from typing import Union, Optional, Callable
 
 # local
 import ivy
+from ivy.stateful.flat_parameters import FlatParameters
 
 
 # Base #
@@ -113,6 +114,29 @@ class Optimizer(abc.ABC):
             return v.cont_set_at_keys(self._step(v.cont_at_key_chains(grads), grads))
         return self._step(v, grads)
 
+    def _flat_step(self, flat: FlatParameters, v: ivy.Container, grads: ivy.Container):
+        """
+        Update the flat buffers of packed parameters. This calls the custom child step
+        function implementation, which applies unchanged to the buffers when the
+        update is elementwise. Override this method when the update depends on the
+        norm of each parameter, which is then given by ``flat.param_norms``.
+
+        Parameters
+        ----------
+        flat
+            The packed parameters.
+        v
+            Flat buffers of the variables to update.
+        grads
+            Flat buffers of the gradients, with the same layout.
+
+        Returns
+        -------
+        ret
+            The updated flat buffers, following update step.
+        """
+        return self._step(v, grads)
+
     # Public #
     # -------#
 
@@ -141,12 +165,15 @@ class Optimizer(abc.ABC):
         Parameters
         ----------
         v
-            Nested variables to update.
+            Nested variables to update, or the ``FlatParameters`` they are packed
+            in, in which case the update is applied to the flat buffers directly.
+            Packed variables are always updated in-place, and are not supported by
+            optimizers constructed with ``inplace=False``.
         grads
             Nested gradients to update.
         ignore_missing
             Whether to ignore keys missing from the gradients which exist in
-            the variables.
+            the variables. This is not supported for packed variables.
             Default is ``False``.
 
         Returns
@@ -155,8 +182,21 @@ class Optimizer(abc.ABC):
             The updated variables, following update step.
 
         """
+        if isinstance(v, FlatParameters):
+            if ignore_missing:
+                raise ivy.exceptions.IvyException(
+                    "ignore_missing is not supported for packed variables"
+                )
+            if not self._inplace:
+                raise ivy.exceptions.IvyException(
+                    "packed variables are always updated in-place, so they are not "
+                    "supported by optimizers with inplace=False"
+                )
         self._count += 1
         self._initialized = True
+        if isinstance(v, FlatParameters):
+            v.set_buffers(self._flat_step(v, v.buffers, v.pack(grads)))
+            return v.unpack()
         return self._step_fn(v, grads, ignore_missing)
 
 
@@ -300,6 +340,17 @@ class LARS(Optimizer):
             stop_gradients=self._stop_gradients,
         )
 
+    def _flat_step(self, flat: FlatParameters, v: ivy.Container, grads: ivy.Container):
+        # lars_update, with the norms taken per parameter rather than per buffer
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+        w_norm = flat.param_norms(v)
+        lr = ivy.stable_divide(w_norm * lr, flat.param_norms(grads))
+        if self._decay_lambda > 0:
+            lr /= w_norm * self._decay_lambda
+        return ivy.gradient_descent_update(
+            v, grads, lr, stop_gradients=self._stop_gradients
+        )
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -525,6 +576,35 @@ class LAMB(Optimizer):
         )
         return new_v
 
+    def _flat_step(self, flat: FlatParameters, v: ivy.Container, grads: ivy.Container):
+        # lamb_update, with the norms taken per parameter rather than per buffer
+        if self._first_pass:
+            self._mw = grads
+            self._vw = grads**2
+            self._first_pass = False
+
+        eff_grads, self._mw, self._vw = ivy.adam_step(
+            grads,
+            self._mw,
+            self._vw,
+            self._count,
+            beta1=self._beta1,
+            beta2=self._beta2,
+            epsilon=self._epsilon,
+        )
+        if self._decay_lambda > 0:
+            r2 = flat.param_norms(eff_grads + self._decay_lambda * v)
+        else:
+            r2 = flat.param_norms(eff_grads)
+        r = ivy.minimum(
+            ivy.stable_divide(flat.param_norms(v), r2),
+            ivy.array(self._max_trust_ratio),
+        )
+        lr = r * (self._lr if isinstance(self._lr, float) else self._lr())
+        return ivy.optimizer_update(
+            v, eff_grads, lr, stop_gradients=self._stop_gradients
+        )
+
     def set_state(self, state: ivy.Container):
         """Set state of the optimizer.
 
@@ -0,0 +1,15 @@
+from . import cases
+from .cases import BenchmarkCase, CASES
+from . import runner
+from .runner import run_benchmarks, save_results, load_results, compare_results
+
+__all__ = [
+    "cases",
+    "runner",
+    "BenchmarkCase",
+    "CASES",
+    "run_benchmarks",
+    "save_results",
+    "load_results",
+    "compare_results",
+]
@@ -0,0 +1,104 @@
+"""Command line interface for running and comparing ivy benchmarks.
+
+Run the benchmarks and store the results::
+
+    python -m ivy_benchmarks run --backends numpy torch --output results.json
+
+Compare two runs, exiting with a non-zero code if any case regressed::
+
+    python -m ivy_benchmarks compare baseline.json results.json --threshold 0.1
+"""
+
+# global
+import argparse
+import sys
+
+# local
+from ivy_benchmarks.cases import CASES
+from ivy_benchmarks.runner import (
+    BACKENDS,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+
+
+def _format_time(seconds):
+    return "-" if seconds is None else "{:.2f}us".format(seconds * 1e6)
+
+
+def _run(args):
+    results = run_benchmarks(
+        backends=args.backends,
+        cases=args.cases,
+        number=args.number,
+        repeat=args.repeat,
+        seed=args.seed,
+    )
+    for r in results["results"]:
+        overhead, throughput = r["overhead_ratio"], r["throughput"]
+        print(
+            "{:<12}{:<32}ivy {:>14}  raw {:>14}  overhead {:>8}  "
+            "throughput {:>12}  peak {}B".format(
+                r["backend"],
+                r["case"],
+                _format_time(r["ivy_time"]),
+                _format_time(r["raw_time"]),
+                "-" if overhead is None else "{:.2f}x".format(overhead),
+                "-" if throughput is None else "{:.3e}/s".format(throughput),
+                r["ivy_peak_memory"],
+            )
+        )
+    for backend in results["meta"]["skipped_backends"]:
+        print("skipped {}, as it is not installed".format(backend))
+    if args.output:
+        save_results(results, args.output)
+    return 0
+
+
+def _compare(args):
+    comparison = compare_results(
+        load_results(args.baseline),
+        load_results(args.current),
+        threshold=args.threshold,
+    )
+    for c in comparison:
+        print(
+            "{:<12}{:<32}{:>14} -> {:>14}  {:+.1%}{}".format(
+                c["backend"],
+                c["case"],
+                _format_time(c["baseline_time"]),
+                _format_time(c["current_time"]),
+                c["change"],
+                "  REGRESSION" if c["regression"] else "",
+            )
+        )
+    return int(any(c["regression"] for c in comparison))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="ivy_benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--backends", nargs="+", default=list(BACKENDS))
+    run_parser.add_argument("--cases", nargs="+", choices=list(CASES), default=None)
+    run_parser.add_argument("--number", type=int, default=100)
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--output", help="json file to store the results in")
+    run_parser.set_defaults(fn=_run)
+
+    compare_parser = subparsers.add_parser("compare", help="compare two runs")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    compare_parser.set_defaults(fn=_compare)
+
+    args = parser.parse_args(argv)
+    return args.fn(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
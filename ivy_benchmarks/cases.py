@@ -0,0 +1,478 @@
+"""Benchmark cases for the ivy functional API."""
+
+# global
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+# local
+import ivy
+
+
+class BenchmarkCase:
+    """A representative operation to time, both through ivy and the raw backend.
+
+    Parameters
+    ----------
+    name
+        Unique name of the case.
+    category
+        Group the case belongs to, such as ``"elementwise"`` or ``"matmul"``.
+    setup
+        Function called with the seed, once the backend is set. It returns a tuple
+        ``(ivy_fn, raw_fn, num_elements)``, where ``ivy_fn`` calls the ivy API on
+        ivy arrays, ``raw_fn`` calls the backend implementation directly on native
+        arrays (or is ``None`` if there is no meaningful raw equivalent), and
+        ``num_elements`` is the number of input elements processed per call.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        category: str,
+        setup: Callable[[int], Tuple[Callable, Optional[Callable], int]],
+    ):
+        self.name = name
+        self.category = category
+        self.setup = setup
+
+    def __repr__(self):
+        return "BenchmarkCase(name={}, category={})".format(self.name, self.category)
+
+
+def _random(shape, seed):
+    return ivy.random_uniform(shape=shape, dtype="float32", seed=seed)
+
+
+def _elementwise_add(seed):
+    x, y = _random((1000, 1000), seed), _random((1000, 1000), seed + 1)
+    backend, x_native, y_native = ivy.current_backend(), x.data, y.data
+    return (
+        lambda: ivy.add(x, y),
+        lambda: backend.add(x_native, y_native),
+        2 * x.size,
+    )
+
+
+def _elementwise_add_small(seed):
+    # dominated by the wrapper, rather than the computation
+    x, y = _random((4,), seed), _random((4,), seed + 1)
+    backend, x_native, y_native = ivy.current_backend(), x.data, y.data
+    return (
+        lambda: ivy.add(x, y),
+        lambda: backend.add(x_native, y_native),
+        2 * x.size,
+    )
+
+
+def _small_ops_chain(seed, num_ops=20):
+    # a pipeline of many small ops, dominated by the wrapping of their outputs
+    x, y = _random((4,), seed), _random((4,), seed + 1)
+    backend, x_native, y_native = ivy.current_backend(), x.data, y.data
+
+    def ivy_fn():
+        ret = x
+        for _ in range(num_ops):
+            ret = ivy.multiply(ivy.add(ret, y), y)
+        return ret
+
+    def raw_fn():
+        ret = x_native
+        for _ in range(num_ops):
+            ret = backend.multiply(backend.add(ret, y_native), y_native)
+        return ret
+
+    return ivy_fn, raw_fn, 2 * num_ops * x.size
+
+
+def _elementwise_add_threaded(seed, num_threads=4):
+    # the same work as _elementwise_add, repeated on each of num_threads threads,
+    # so that its throughput relative to "add" shows how the ivy path scales
+    x, y = _random((1000, 1000), seed), _random((1000, 1000), seed + 1)
+    backend, x_native, y_native = ivy.current_backend(), x.data, y.data
+    executor = ThreadPoolExecutor(max_workers=num_threads)
+
+    def _run_threaded(fn):
+        return [f.result() for f in [executor.submit(fn) for _ in range(num_threads)]]
+
+    return (
+        lambda: _run_threaded(lambda: ivy.add(x, y)),
+        lambda: _run_threaded(lambda: backend.add(x_native, y_native)),
+        num_threads * 2 * x.size,
+    )
+
+
+def _reduction_sum(seed):
+    x = _random((1000, 1000), seed)
+    backend, x_native = ivy.current_backend(), x.data
+    return (
+        lambda: ivy.sum(x, axis=-1),
+        lambda: backend.sum(x_native, axis=-1),
+        x.size,
+    )
+
+
+def _reduction_mean(seed):
+    x = _random((1000, 1000), seed)
+    backend, x_native = ivy.current_backend(), x.data
+    return (
+        lambda: ivy.mean(x, axis=0),
+        lambda: backend.mean(x_native, axis=0),
+        x.size,
+    )
+
+
+def _matmul(seed):
+    x, y = _random((256, 256), seed), _random((256, 256), seed + 1)
+    backend, x_native, y_native = ivy.current_backend(), x.data, y.data
+    return (
+        lambda: ivy.matmul(x, y),
+        lambda: backend.matmul(x_native, y_native),
+        x.size + y.size,
+    )
+
+
+def _batched_indices(shape, high, seed):
+    return ivy.randint(0, high, shape=shape, dtype="int64", seed=seed)
+
+
+def _gather(seed):
+    # an embedding lookup per batch element, with batch_dims=1
+    params = _random((64, 1000, 32), seed)
+    indices = _batched_indices((64, 512), 1000, seed + 1)
+    backend, params_native, indices_native = (
+        ivy.current_backend(),
+        params.data,
+        indices.data,
+    )
+    return (
+        lambda: ivy.gather(params, indices, axis=1, batch_dims=1),
+        lambda: backend.gather(params_native, indices_native, axis=1, batch_dims=1),
+        indices.size,
+    )
+
+
+def _gather_nd(seed):
+    params = _random((64, 1000, 32), seed)
+    indices = _batched_indices((64, 512, 1), 1000, seed + 1)
+    backend, params_native, indices_native = (
+        ivy.current_backend(),
+        params.data,
+        indices.data,
+    )
+    return (
+        lambda: ivy.gather_nd(params, indices, batch_dims=1),
+        lambda: backend.gather_nd(params_native, indices_native, batch_dims=1),
+        indices.size,
+    )
+
+
+def _einops_rearrange(seed):
+    # splitting the heads of the attention queries, as in multi_head_attention
+    x = _random((8, 64, 256), seed)
+    backend, x_native = ivy.current_backend(), x.data
+    return (
+        lambda: ivy.einops_rearrange(x, "... n (h f) -> ... h n f", h=8),
+        lambda: backend.permute_dims(
+            backend.reshape(x_native, (8, 64, 8, 32)), (0, 2, 1, 3)
+        ),
+        x.size,
+    )
+
+
+def _searchsorted(seed):
+    # bucketing of 10000 rows of values, each into its own sorted boundaries
+    x = ivy.sort(_random((10000, 32), seed), axis=-1)
+    v = _random((10000, 8), seed + 1)
+    backend, x_native, v_native = ivy.current_backend(), x.data, v.data
+    return (
+        lambda: ivy.searchsorted(x, v),
+        lambda: backend.searchsorted(x_native, v_native),
+        v.size,
+    )
+
+
+def _multinomial(seed):
+    probs = ivy.softmax(_random((10000, 64), seed), axis=-1)
+    backend, probs_native = ivy.current_backend(), probs.data
+    return (
+        lambda: ivy.multinomial(64, 4, batch_size=10000, probs=probs),
+        lambda: backend.multinomial(
+            64, 4, batch_size=10000, probs=probs_native, device="cpu"
+        ),
+        probs.size,
+    )
+
+
+def _random_uniform_key(seed):
+    # the counter-based generator, against the stateful generator of the backend
+    key = ivy.PRNGKey(seed)
+    backend = ivy.current_backend()
+    return (
+        lambda: ivy.random_uniform(shape=(1000, 1000), key=key),
+        lambda: backend.random_uniform(
+            shape=(1000, 1000),
+            dtype=ivy.default_float_dtype(as_native=True),
+            device="cpu",
+        ),
+        1000 * 1000,
+    )
+
+
+def _conv2d(seed):
+    x, filters = _random((8, 32, 32, 16), seed), _random((3, 3, 16, 32), seed + 1)
+    backend, x_native, filters_native = ivy.current_backend(), x.data, filters.data
+    return (
+        lambda: ivy.conv2d(x, filters, 1, "SAME"),
+        lambda: backend.conv2d(x_native, filters_native, 1, "SAME"),
+        x.size,
+    )
+
+
+def _attention(seed):
+    q = _random((4, 128, 64), seed)
+    k = _random((4, 128, 64), seed + 1)
+    v = _random((4, 128, 64), seed + 2)
+    scale = 64**-0.5
+    # scaled_dot_product_attention is compositional, so the raw path composes the
+    # same backend calls on native arrays
+    backend = ivy.current_backend()
+    q_native, k_native, v_native = q.data, k.data, v.data
+
+    def raw_fn():
+        sim = backend.multiply(
+            backend.matmul(q_native, backend.swapaxes(k_native, -1, -2)), scale
+        )
+        return backend.matmul(backend.softmax(sim, axis=-1), v_native)
+
+    return (
+        lambda: ivy.scaled_dot_product_attention(q, k, v, scale),
+        raw_fn,
+        q.size + k.size + v.size,
+    )
+
+
+def _attention_long_chunked(seed, num_tokens=4096, chunk_size=512):
+    # long-sequence causal inference, with the keys processed in chunks, against
+    # the dense similarity matrix of the raw path
+    q = _random((1, num_tokens, 64), seed)
+    k = _random((1, num_tokens, 64), seed + 1)
+    v = _random((1, num_tokens, 64), seed + 2)
+    scale = 64**-0.5
+    backend = ivy.current_backend()
+    q_native, k_native, v_native = q.data, k.data, v.data
+    mask_native = ivy.tril(ivy.ones((num_tokens, num_tokens), dtype="bool")).data
+    fill_native = ivy.array(-ivy.finfo("float32").max, dtype="float32").data
+
+    def raw_fn():
+        sim = backend.multiply(
+            backend.matmul(q_native, backend.swapaxes(k_native, -1, -2)), scale
+        )
+        sim = backend.where(mask_native, sim, fill_native)
+        return backend.matmul(backend.softmax(sim, axis=-1), v_native)
+
+    return (
+        lambda: ivy.scaled_dot_product_attention(
+            q, k, v, scale, is_causal=True, chunk_size=chunk_size
+        ),
+        raw_fn,
+        q.size + k.size + v.size,
+    )
+
+
+def _mha_decode_kv_cache(seed, context_length=1024):
+    # a single decoding step against a cached context, which is trimmed back after
+    # each step, so that the context length stays fixed
+    model = ivy.MultiHeadAttention(256, num_heads=4, head_dim=64)
+    x = _random((1, context_length + 1, 256), seed)
+    cache = model.init_kv_cache(1, context_length + 1)
+    model(x[:, :context_length], kv_cache=cache)
+    token = x[:, context_length:]
+
+    def ivy_fn():
+        ret = model(token, kv_cache=cache)
+        cache.trim(context_length)
+        return ret
+
+    return ivy_fn, None, token.size
+
+
+def _vmap(seed):
+    # a dense layer mapped over 1000 examples, against a loop over the examples
+    x, w, b = (
+        _random((1000, 64), seed),
+        _random((64, 64), seed + 1),
+        _random((64,), seed + 2),
+    )
+    vmapped_fn = ivy.vmap(
+        lambda x, w, b: ivy.relu(ivy.matmul(x, w) + b), (0, None, None)
+    )
+    backend = ivy.current_backend()
+    x_native, w_native, b_native = x.data, w.data, b.data
+
+    def raw_fn():
+        return backend.stack(
+            [
+                backend.relu(backend.add(backend.matmul(x_i, w_native), b_native))
+                for x_i in x_native
+            ]
+        )
+
+    return lambda: vmapped_fn(x, w, b), raw_fn, x.size
+
+
+def _sequential_linear(seed):
+    # a small model, for which the module call overhead matters
+    model = ivy.Sequential(*[ivy.Linear(64, 64) for _ in range(4)])
+    x = _random((8, 64), seed)
+    backend, x_native = ivy.current_backend(), x.data
+    weights = [(v.w.data, v.b.data) for v in model.v.submodules.values()]
+
+    def raw_fn():
+        y = x_native
+        for w, b in weights:
+            y = backend.add(backend.matmul(y, backend.permute_dims(w, (1, 0))), b)
+        return y
+
+    return lambda: model(x), raw_fn, x.size
+
+
+def _lstm_long_sequence(seed, timesteps=2000):
+    # a two layer lstm over a long sequence, dominated by the per-step overhead
+    model = ivy.LSTM(32, 64, num_layers=2)
+    x = _random((8, timesteps, 32), seed)
+    return lambda: model(x), None, x.size
+
+
+def _torch_frontend_mlp(seed):
+    # a small model through the torch frontend, dominated by the frontend wrappers
+    import ivy.functional.frontends.torch as torch_frontend
+
+    linear, relu = (
+        torch_frontend.nn.functional.linear,
+        torch_frontend.nn.functional.relu,
+    )
+    x = _random((8, 64), seed)
+    weights = [
+        (_random((64, 64), seed + 2 * i + 1), _random((64,), seed + 2 * i + 2))
+        for i in range(4)
+    ]
+    backend, x_native = ivy.current_backend(), x.data
+    native_weights = [(w.data, b.data) for w, b in weights]
+
+    def ivy_fn():
+        y = x
+        for w, b in weights:
+            y = relu(linear(y, w, b))
+        return y
+
+    def raw_fn():
+        y = x_native
+        for w, b in native_weights:
+            y = backend.matmul(y, backend.permute_dims(w, (1, 0)))
+            y = backend.relu(backend.add(y, b))
+        return y
+
+    return ivy_fn, raw_fn, x.size
+
+
+def _container_map(seed):
+    leaves = {"l{}".format(i): _random((100,), seed + i) for i in range(32)}
+    cont = ivy.Container(leaves)
+    backend = ivy.current_backend()
+    native_leaves = {k: v.data for k, v in leaves.items()}
+    return (
+        lambda: cont.cont_map(lambda x, _: ivy.multiply(x, 2.0)),
+        lambda: {k: backend.multiply(v, 2.0) for k, v in native_leaves.items()},
+        32 * 100,
+    )
+
+
+def _container_binary(seed):
+    cont_x = ivy.Container({"l{}".format(i): _random((100,), seed) for i in range(32)})
+    cont_y = ivy.Container(
+        {"l{}".format(i): _random((100,), seed + 1) for i in range(32)}
+    )
+    return lambda: ivy.add(cont_x, cont_y), None, 2 * 32 * 100
+
+
+def _sgd_step(seed):
+    variables = ivy.Container(
+        {"w{}".format(i): _random((256, 256), seed + i) for i in range(4)}
+    )
+    grads = variables.cont_map(lambda x, _: ivy.multiply(x, 0.1))
+    optimizer = ivy.SGD(lr=1e-3, inplace=False)
+    backend = ivy.current_backend()
+    native_variables = {k: v.data for k, v in variables.items()}
+    native_grads = {k: v.data for k, v in grads.items()}
+    return (
+        lambda: optimizer.step(variables, grads),
+        lambda: {
+            k: backend.subtract(v, backend.multiply(native_grads[k], 1e-3))
+            for k, v in native_variables.items()
+        },
+        4 * 256 * 256,
+    )
+
+
+def _adam_step(seed):
+    variables = ivy.Container(
+        {"w{}".format(i): _random((256, 256), seed + i) for i in range(4)}
+    )
+    grads = variables.cont_map(lambda x, _: ivy.multiply(x, 0.1))
+    optimizer = ivy.Adam(lr=1e-3, inplace=False)
+    return lambda: optimizer.step(variables, grads), None, 4 * 256 * 256
+
+
+def _adam_step_flat(seed):
+    # _adam_step, with the variables packed into a single buffer
+    variables = ivy.Container(
+        {"w{}".format(i): _random((256, 256), seed + i) for i in range(4)}
+    )
+    grads = variables.cont_map(lambda x, _: ivy.multiply(x, 0.1))
+    flat = ivy.FlatParameters(variables)
+    optimizer = ivy.Adam(lr=1e-3, inplace=False)
+    return lambda: optimizer.step(flat, grads), None, 4 * 256 * 256
+
+
+def _backend_switch(seed):
+    backend = ivy.current_backend_str()
+
+    def ivy_fn():
+        ivy.set_backend(backend)
+        ivy.unset_backend()
+
+    return ivy_fn, None, 0
+
+
+CASES: Dict[str, BenchmarkCase] = {
+    case.name: case
+    for case in [
+        BenchmarkCase("add", "elementwise", _elementwise_add),
+        BenchmarkCase("add_small", "elementwise", _elementwise_add_small),
+        BenchmarkCase("small_ops_chain", "elementwise", _small_ops_chain),
+        BenchmarkCase("add_threaded", "elementwise", _elementwise_add_threaded),
+        BenchmarkCase("sum", "reduction", _reduction_sum),
+        BenchmarkCase("mean", "reduction", _reduction_mean),
+        BenchmarkCase("matmul", "matmul", _matmul),
+        BenchmarkCase("gather", "indexing", _gather),
+        BenchmarkCase("gather_nd", "indexing", _gather_nd),
+        BenchmarkCase("einops_rearrange", "manipulation", _einops_rearrange),
+        BenchmarkCase("searchsorted", "sorting", _searchsorted),
+        BenchmarkCase("multinomial", "random", _multinomial),
+        BenchmarkCase("random_uniform_key", "random", _random_uniform_key),
+        BenchmarkCase("conv2d", "conv", _conv2d),
+        BenchmarkCase("scaled_dot_product_attention", "attention", _attention),
+        BenchmarkCase("attention_long_chunked", "attention", _attention_long_chunked),
+        BenchmarkCase("mha_decode_kv_cache", "attention", _mha_decode_kv_cache),
+        BenchmarkCase("vmap", "transform", _vmap),
+        BenchmarkCase("sequential_linear", "module", _sequential_linear),
+        BenchmarkCase("lstm_long_sequence", "module", _lstm_long_sequence),
+        BenchmarkCase("torch_frontend_mlp", "frontend", _torch_frontend_mlp),
+        BenchmarkCase("container_map", "container", _container_map),
+        BenchmarkCase("container_add", "container", _container_binary),
+        BenchmarkCase("sgd_step", "optimizer", _sgd_step),
+        BenchmarkCase("adam_step", "optimizer", _adam_step),
+        BenchmarkCase("adam_step_flat", "optimizer", _adam_step_flat),
+        BenchmarkCase("set_and_unset_backend", "backend", _backend_switch),
+    ]
+}
@@ -0,0 +1,204 @@
+"""Runs the benchmark cases and stores the results as json."""
+
+# global
+import gc
+import importlib.util
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Sequence
+
+# local
+import ivy
+from ivy_benchmarks.cases import CASES
+
+BACKENDS = ("numpy", "jax", "tensorflow", "torch")
+
+
+def _block_until_ready(x):
+    # jax dispatches asynchronously, so results must be waited for before timing
+    if isinstance(x, ivy.Container):
+        x.cont_map(lambda leaf, _: _block_until_ready(leaf))
+    elif isinstance(x, dict):
+        for v in x.values():
+            _block_until_ready(v)
+    elif isinstance(x, list):
+        for v in x:
+            _block_until_ready(v)
+    elif isinstance(x, ivy.Array):
+        _block_until_ready(x.data)
+    elif hasattr(x, "block_until_ready"):
+        x.block_until_ready()
+    return x
+
+
+def _time_fn(fn, number, repeat):
+    # returns the best mean time per call over ``repeat`` runs of ``number`` calls
+    for _ in range(max(1, number // 10)):
+        _block_until_ready(fn())
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            _block_until_ready(fn())
+        times.append((time.perf_counter() - start) / number)
+    return min(times)
+
+
+def _peak_memory(fn):
+    # peak memory allocated through the python allocator during a single call,
+    # which includes numpy buffers but not memory owned by other frameworks
+    gc.collect()
+    tracemalloc.start()
+    try:
+        _block_until_ready(fn())
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _git_commit():
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    *,
+    backends: Sequence[str] = BACKENDS,
+    cases: Optional[Sequence[str]] = None,
+    number: int = 100,
+    repeat: int = 5,
+    seed: int = 0,
+) -> Dict:
+    """Time each benchmark case through ivy and through the raw backend.
+
+    Backends which cannot be imported are skipped.
+
+    Parameters
+    ----------
+    backends
+        Backends to run the cases with. Default is all of numpy, jax, tensorflow and
+        torch.
+    cases
+        Names of the cases to run. Default is ``None``, which runs all of them.
+    number
+        Number of calls per timing run.
+    repeat
+        Number of timing runs, the fastest of which is reported.
+    seed
+        Seed used to generate the inputs.
+
+    Returns
+    -------
+    ret
+        Dict with the ``"meta"`` data of the run, and a list of ``"results"``, one
+        per backend and case.
+    """
+    cases = list(CASES) if cases is None else cases
+    results: List[Dict] = []
+    skipped = []
+    for backend in backends:
+        if importlib.util.find_spec(backend) is None:
+            skipped.append(backend)
+            continue
+        ivy.set_backend(backend)
+        try:
+            for name in cases:
+                case = CASES[name]
+                ivy_fn, raw_fn, num_elements = case.setup(seed)
+                ivy_time = _time_fn(ivy_fn, number, repeat)
+                raw_time = _time_fn(raw_fn, number, repeat) if raw_fn else None
+                results.append(
+                    {
+                        "backend": backend,
+                        "case": case.name,
+                        "category": case.category,
+                        "ivy_time": ivy_time,
+                        "raw_time": raw_time,
+                        "overhead_ratio": ivy_time / raw_time if raw_time else None,
+                        "throughput": (
+                            num_elements / ivy_time if num_elements else None
+                        ),
+                        "ivy_peak_memory": _peak_memory(ivy_fn),
+                        "raw_peak_memory": _peak_memory(raw_fn) if raw_fn else None,
+                    }
+                )
+        finally:
+            ivy.unset_backend()
+    return {
+        "meta": {
+            "ivy_version": ivy.__version__,
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "number": number,
+            "repeat": repeat,
+            "skipped_backends": skipped,
+        },
+        "results": results,
+    }
+
+
+def save_results(results: Dict, path: str):
+    """Save benchmark results to a json file."""
+    with open(path, "w") as f:
+        json.dump(results, f, indent=4)
+
+
+def load_results(path: str) -> Dict:
+    """Load benchmark results from a json file."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_results(
+    baseline: Dict, current: Dict, *, threshold: float = 0.1
+) -> List[Dict]:
+    """Compare the ivy timings of two benchmark runs.
+
+    Parameters
+    ----------
+    baseline
+        Results of the reference run, as returned by ``run_benchmarks``.
+    current
+        Results of the run to check.
+    threshold
+        Relative slowdown above which a case is flagged as a regression.
+
+    Returns
+    -------
+    ret
+        One entry per backend and case present in both runs, with the relative
+        change in ivy time and whether it is a regression.
+    """
+    baseline_times = {
+        (r["backend"], r["case"]): r["ivy_time"] for r in baseline["results"]
+    }
+    comparison = []
+    for r in current["results"]:
+        key = (r["backend"], r["case"])
+        if key not in baseline_times:
+            continue
+        change = r["ivy_time"] / baseline_times[key] - 1
+        comparison.append(
+            {
+                "backend": r["backend"],
+                "case": r["case"],
+                "baseline_time": baseline_times[key],
+                "current_time": r["ivy_time"],
+                "change": change,
+                "regression": change > threshold,
+            }
+        )
+    return comparison
@@ -57,6 +57,15 @@ def test_outputs_to_frontend_arrays(dtype_and_x):
     assert isinstance(output, Tensor)
     assert str(input_ivy.dtype) == str(output.dtype)
     assert ivy.all(input_ivy == output.ivy_array)
+    # the returned ivy array is wrapped without a copy
+    assert output.ivy_array is input_ivy
+
+    # check for native array
+    input_native = ivy.native_array(input_ivy)
+    output = outputs_to_frontend_arrays(_fn)(input_native)
+    assert isinstance(output, Tensor)
+    assert ivy.as_ivy_dtype(input_native.dtype) == str(output.dtype)
+    assert ivy.all(input_native == output.ivy_array.data)
 
 
 @given(
@@ -86,3 +95,29 @@ def test_to_ivy_arrays_and_back(dtype_and_x):
     assert isinstance(output, Tensor)
     assert input_frontend.dtype == output.dtype
     assert ivy.all(input_frontend.ivy_array == output.ivy_array)
+
+
+def test_outputs_to_frontend_arrays_default_dtypes():
+    def _default_dtypes():
+        return ivy.default_int_dtype(), ivy.default_float_dtype()
+
+    int_stack = list(ivy.default_int_dtype_stack)
+    float_stack = list(ivy.default_float_dtype_stack)
+    # the torch default dtypes are set within the frontend function, including
+    # within nested frontend functions
+    assert outputs_to_frontend_arrays(_default_dtypes)() == ("int64", "float32")
+    nested_fn = outputs_to_frontend_arrays(
+        lambda: outputs_to_frontend_arrays(_default_dtypes)()
+    )
+    assert nested_fn() == ("int64", "float32")
+
+    # and the default dtype stacks are restored afterwards, including on errors
+    def _raise():
+        raise ValueError
+
+    try:
+        outputs_to_frontend_arrays(_raise)()
+    except ValueError:
+        pass
+    assert list(ivy.default_int_dtype_stack) == int_stack
+    assert list(ivy.default_float_dtype_stack) == float_stack
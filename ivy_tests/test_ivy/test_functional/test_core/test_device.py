@@ -2,6 +2,7 @@
 
 # global
 import io
+import json
 import multiprocessing
 import os
 import re
@@ -442,6 +443,57 @@ def test_profiler(
     assert not os.path.exists(fw_log_dir), "Profiler recreated logging folder"
 
 
+# profiler statistics of the ivy functions
+def test_profiler_stats(tmp_path):
+    add = ivy.add
+    x = ivy.ones((4, 3), dtype="float32")
+    w = ivy.ones((2, 3), dtype="float32")
+    with ivy.Profiler(str(tmp_path)) as profiler:
+        for _ in range(3):
+            y = ivy.linear(x, w)
+        _ = ivy.add(x, x)
+
+    # the ivy namespace is restored when stopped
+    assert ivy.add is add
+    stats = profiler.stats
+    assert stats["linear"]["calls"] == 3
+    assert stats["add"]["calls"] >= 1
+    assert stats["linear"]["bytes"] == 3 * y.size * 4
+    assert stats["linear"]["signatures"][0] == ("float32[4, 3], float32[2, 3]", 3)
+    for fn_stats in stats.values():
+        assert fn_stats["self_time"] <= fn_stats["total_time"]
+        assert fn_stats["kernel_time"] <= fn_stats["self_time"]
+        assert np.isclose(
+            fn_stats["overhead_time"],
+            fn_stats["self_time"] - fn_stats["kernel_time"],
+        )
+        assert fn_stats["kernel_time"] <= fn_stats["total_kernel_time"]
+        assert fn_stats["total_kernel_time"] <= fn_stats["total_time"]
+    # linear is composed of other ivy functions, which take most of its time, and
+    # the kernel time of which is in its total kernel time
+    assert stats["linear"]["self_time"] < stats["linear"]["total_time"]
+    assert stats["linear"]["total_kernel_time"] > stats["linear"]["kernel_time"]
+
+    # the table is sorted by the requested statistic
+    table = profiler.table(sort_by="calls", limit=3)
+    calls = [int(line.split()[1]) for line in table.splitlines()[1:]]
+    assert len(calls) == 3 and calls == sorted(calls, reverse=True)
+
+    # the profile is saved as a chrome trace and a table
+    assert sorted(os.listdir(tmp_path)) == ["ivy_profile.log", "ivy_trace.json"]
+    with open(os.path.join(tmp_path, "ivy_trace.json")) as f:
+        events = json.load(f)["traceEvents"]
+    assert len(events) == sum([s["calls"] for s in stats.values()])
+    assert [e["name"] for e in events].count("linear") == 3
+
+    # only the most recent calls are kept for the trace
+    with ivy.Profiler(max_events=2) as profiler:
+        for _ in range(3):
+            ivy.add(x, x)
+    assert len(profiler._events) == 2
+    assert profiler.stats["add"]["calls"] == 3
+
+
 @handle_test(
     fn_tree="functional.ivy.num_ivy_arrays_on_dev",
     num=helpers.ints(min_value=0, max_value=5),
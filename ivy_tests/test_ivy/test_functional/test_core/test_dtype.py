@@ -3,6 +3,8 @@
 # global
 import numpy as np
 import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from hypothesis import strategies as st
 import typing
 from types import SimpleNamespace
@@ -775,6 +777,44 @@ def test_default_float_dtype(
     assert ivy.default_float_dtype() == ivy.float32
 
 
+# set_default_float_dtype
+@handle_test(fn_tree="functional.ivy.set_default_float_dtype")
+def test_set_default_float_dtype_per_thread():
+    float_dtypes = ["float16", "float32", "float64"]
+    barrier = threading.Barrier(len(float_dtypes))
+
+    def _fn(float_dtype):
+        ivy.set_default_float_dtype(float_dtype)
+        # all threads have set their default before any of them reads it back
+        barrier.wait()
+        ret = ivy.default_float_dtype()
+        x = ivy.array([1.0, 2.0])
+        ivy.unset_default_float_dtype()
+        return ret, x.dtype
+
+    with ThreadPoolExecutor(max_workers=len(float_dtypes)) as executor:
+        results = list(executor.map(_fn, float_dtypes))
+    for float_dtype, (default, array_dtype) in zip(float_dtypes, results):
+        assert default == float_dtype
+        assert array_dtype == float_dtype
+    assert ivy.default_float_dtype() == ivy.float32
+
+
+@handle_test(fn_tree="functional.ivy.set_default_float_dtype")
+def test_set_default_float_dtype_inherited_by_threads():
+    # threads start from the defaults set in the main thread
+    ivy.set_default_float_dtype("float64")
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            default, array_dtype = executor.submit(
+                lambda: (ivy.default_float_dtype(), ivy.array([1.0]).dtype)
+            ).result()
+    finally:
+        ivy.unset_default_float_dtype()
+    assert default == "float64"
+    assert array_dtype == "float64"
+
+
 # default_int_dtype
 @handle_test(
     fn_tree="functional.ivy.default_int_dtype",
@@ -17,6 +17,7 @@ try:
 except ImportError:
     jnp = SimpleNamespace()
 
+import einops
 import pytest
 from hypothesis import given, assume, strategies as st
 import numpy as np
@@ -974,6 +975,70 @@ def test_cache_fn_with_args():
     assert ret0 is not ret1
 
 
+def test_cache_fn_lru():
+    def func(x, /, *, y=1):
+        return ivy.array([x + y])
+
+    cached_fn = ivy.cache_fn(func, max_size=2)
+    ret0 = cached_fn(0)
+
+    # positional, keyword and default arguments share the same entry
+    assert cached_fn(0, y=1) is ret0
+    assert cached_fn.cache_info()["hits"] == 1
+    assert cached_fn.cache_info()["misses"] == 1
+
+    # the least recently used entry is evicted
+    ret1 = cached_fn(1)
+    assert cached_fn(0) is ret0
+    cached_fn(2)
+    assert cached_fn(0) is ret0
+    assert cached_fn(1) is not ret1
+    assert cached_fn.cache_info()["evictions"] == 2
+    assert cached_fn.cache_info()["size"] == 2
+
+    # array arguments are keyed by identity by default, or by shape and dtype
+    def array_func(x):
+        return ivy.zeros_like(x)
+
+    x0, x1 = ivy.array([1.0, 2.0]), ivy.array([3.0, 4.0])
+    cached_array_fn = ivy.cache_fn(array_func)
+    assert cached_array_fn(x0) is cached_array_fn(x0)
+    assert cached_array_fn(x0) is not cached_array_fn(x1)
+    ivy.clear_fn_cache(array_func)
+
+    def shape_func(x):
+        return ivy.zeros_like(x)
+
+    cached_shape_fn = ivy.cache_fn(shape_func, array_key="shape_dtype")
+    assert cached_shape_fn(x0) is cached_shape_fn(x1)
+    ivy.clear_fn_cache(shape_func)
+
+    # equal values of different types are cached separately, and dicts with keys
+    # which can't be compared are still cached
+    def typed_func(x):
+        return [x]
+
+    cached_typed_fn = ivy.cache_fn(typed_func)
+    assert cached_typed_fn(1) is not cached_typed_fn(True)
+    assert cached_typed_fn(1.0) is not cached_typed_fn(1)
+    assert cached_typed_fn({1: 0, "a": 0}) is cached_typed_fn({"a": 0, 1: 0})
+    ivy.clear_fn_cache(typed_func)
+
+
+def test_clear_fn_cache():
+    def func(x):
+        return ivy.array([x])
+
+    cached_fn = ivy.cache_fn(func)
+    ret0 = cached_fn(0)
+    assert cached_fn(0) is ret0
+    ivy.clear_fn_cache(cached_fn)
+    assert cached_fn.cache_info()["size"] == 0
+    assert cached_fn(0) is not ret0
+    ivy.clear_fn_cache()
+    assert cached_fn.cache_info()["size"] == 0
+
+
 def test_framework_setting_with_threading():
     if ivy.current_backend_str() == "jax":
         # Numpy is the conflicting framework being tested against
@@ -1266,6 +1331,52 @@ def test_einops_repeat(
     )
 
 
+# einops patterns with ellipses, unit axes and anonymous axes, compared with einops
+@given(
+    fn_and_pattern=st.sampled_from(
+        [
+            ("rearrange", "... n (h f) -> ... h n f", {"h": 2}),
+            ("rearrange", "... h q f -> ... q (h f)", {}),
+            ("rearrange", "a ... -> (... a)", {}),
+            ("rearrange", "a b () c -> c 1 (b a)", {}),
+            ("rearrange", "... c -> (...) c", {}),
+            ("rearrange", "a ... -> a (...)", {}),
+            ("reduce", "... c -> c", {}),
+            ("reduce", "a b c d -> c a", {}),
+            ("reduce", "(a1 a) b c d -> a1 () d", {"a1": 2}),
+            ("repeat", "... q k -> ... h q k", {"h": 3}),
+            ("repeat", "a b c d -> (a 2) d (c r) b", {"r": 2}),
+        ]
+    ),
+    reduction=st.sampled_from(["min", "max", "sum", "mean", "prod"]),
+)
+def test_einops_patterns(fn_and_pattern, reduction, on_device):
+    fn_name, pattern, axes_lengths = fn_and_pattern
+    x = np.random.uniform(size=(4, 3, 1, 2)).astype("float32")
+    args = (reduction,) if fn_name == "reduce" else ()
+    # the second call replays the cached plan
+    for _ in range(2):
+        ret = getattr(ivy, "einops_" + fn_name)(
+            ivy.array(x, device=on_device), pattern, *args, **axes_lengths
+        )
+        assert isinstance(ret, ivy.Array)
+        assert np.allclose(
+            ivy.to_numpy(ret),
+            getattr(einops, fn_name)(x, pattern, *args, **axes_lengths),
+        )
+
+
+# einops_reduce over multiple non-trailing axes
+@pytest.mark.parametrize("reduction", ["min", "max", "sum", "mean", "prod"])
+def test_einops_reduce_multiple_axes(reduction, on_device):
+    x = np.random.uniform(size=(2, 3, 4, 5)).astype("float32")
+    ret = ivy.einops_reduce(ivy.array(x, device=on_device), "a b c d -> c", reduction)
+    assert ret.shape == (4,)
+    assert np.allclose(
+        ivy.to_numpy(ret), einops.reduce(x, "a b c d -> c", reduction), rtol=1e-4
+    )
+
+
 # container types
 def test_container_types():
     cont_types = ivy.container_types()
@@ -2086,3 +2197,44 @@ def test_vmap(func, arrays_and_axes, in_axes_as_cont):
         pass
     else:
         assert False, "One of the results is None while other isn't"
+
+
+def _fn4(x, y):
+    return ivy.relu(ivy.sum(ivy.matmul(x, y) + 1.0, axis=-1))
+
+
+def _fn5(x, y):
+    return ivy.concat([x[..., :1], ivy.softmax(x, axis=0)], axis=-1) * ivy.mean(y)
+
+
+def _fn6(x, y):
+    # data dependent control flow, which cannot be batched
+    return x if ivy.sum(x) > 0 else ivy.matmul(x, y)
+
+
+def _fn7(x, y):
+    # norms over all of the axes and over the last one
+    return ivy.vector_norm(x, keepdims=True) + ivy.vector_norm(y, axis=-1)
+
+
+# vmap with batching rules
+@pytest.mark.parametrize("func", [_fn4, _fn5, _fn6, _fn7])
+@pytest.mark.parametrize("in_axes", [0, (1, None), (None, 0)])
+def test_vmap_batching_rules(func, in_axes):
+    x = np.random.uniform(size=(3, 3, 4)).astype("float32")
+    y = np.random.uniform(size=(3, 4, 3)).astype("float32")
+    if in_axes == (None, 0):
+        x = x[0]
+    elif in_axes == (1, None):
+        y = y[0]
+    ret = ivy.vmap(func, in_axes=in_axes, out_axes=0)(x, y)
+
+    axes = in_axes if isinstance(in_axes, tuple) else (in_axes, in_axes)
+    examples = zip(
+        *[
+            np.moveaxis(arr, axis, 0) if axis is not None else [arr] * 3
+            for arr, axis in zip([x, y], axes)
+        ]
+    )
+    expected = ivy.stack([func(*example) for example in examples])
+    assert_all_close(ivy.to_numpy(ret), ivy.to_numpy(expected), rtol=1e-5)
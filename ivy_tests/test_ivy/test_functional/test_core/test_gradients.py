@@ -2,6 +2,7 @@
 
 # global
 from hypothesis import strategies as st
+import threading
 import pytest
 import numpy as np
 
@@ -80,6 +81,25 @@ def test_unset_with_grads(grads):
     assert with_grads_stack[0:-1] == ivy.with_grads_stack
 
 
+def test_with_grads_per_thread():
+    ivy.set_with_grads(False)
+    results = list()
+
+    def _fn():
+        # starting from the main thread's mode, which the thread's own changes
+        # then leave untouched
+        results.append(ivy.with_grads())
+        ivy.set_with_grads(True)
+        results.append(ivy.with_grads())
+
+    thread = threading.Thread(target=_fn)
+    thread.start()
+    thread.join()
+    assert results == [False, True]
+    assert not ivy.with_grads()
+    ivy.unset_with_grads()
+
+
 # stop_gradient
 @handle_test(
     fn_tree="functional.ivy.stop_gradient",
@@ -441,6 +441,29 @@ def test_nested_map_w_extra_nest_types(fn):
     assert ivy.all(x_copy["b"]["c"] == x["b"]["c"])
 
 
+# tree_flatten and tree_unflatten
+@pytest.mark.parametrize(
+    "x, num_leaves",
+    [
+        ({"a": [[0, 1], [2, 3]], "b": {"c": [[0], [1]]}}, 6),
+        ((1, [2, (3, None)], {"d": "e"}), 5),
+        (3, 1),
+    ],
+)
+def test_tree_flatten_and_unflatten(x, num_leaves):
+    leaves, treedef = ivy.tree_flatten(x)
+    # ivy's own implementation, not a backend function of the same name
+    assert isinstance(treedef, ivy.TreeDef)
+    assert len(leaves) == treedef.num_leaves == num_leaves
+    assert ivy.tree_unflatten(treedef, leaves) == x
+
+    # nests of the same structure share their treedef
+    new_leaves, new_treedef = ivy.tree_flatten(ivy.nested_map(x, str))
+    assert new_treedef is treedef
+    assert new_leaves == [str(leaf) for leaf in leaves]
+    assert ivy.tree_unflatten(treedef, new_leaves) == ivy.nested_map(x, str)
+
+
 # nested_any
 @pytest.mark.parametrize("x", [{"a": [[0, 1], [2, 3]], "b": {"c": [[0], [1]]}}])
 @pytest.mark.parametrize("fn", [lambda x: True if x % 2 == 0 else False])
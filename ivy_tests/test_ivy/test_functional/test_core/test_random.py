@@ -1,6 +1,8 @@
 """Collection of tests for unified reduction functions."""
 
 # global
+import numpy as np
+import pytest
 from hypothesis import strategies as st
 
 # local
@@ -281,6 +283,55 @@ def test_randint(
         assert ivy.all(v >= low) and ivy.all(v < high)
 
 
+# PRNGKey
+def test_prng_key():
+    # the keys are those of jax.random, for all backends
+    assert ivy.to_numpy(ivy.PRNGKey(42)).tolist() == [0, 42]
+    assert ivy.to_numpy(ivy.PRNGKey(2**32 + 1)).tolist() == [1, 1]
+    assert ivy.to_numpy(ivy.split_key(ivy.PRNGKey(0))).tolist() == [
+        [4146024105, 967050713],
+        [2718843009, 1272950319],
+    ]
+    assert ivy.split_key(ivy.PRNGKey(0), num=5).shape == (5, 2)
+    assert ivy.to_numpy(ivy.fold_in(ivy.PRNGKey(0), 1)).tolist() == [
+        928981903,
+        3453687069,
+    ]
+
+
+@pytest.mark.parametrize(
+    "fn_name, args, kwargs, expected",
+    [
+        (
+            "random_uniform",
+            (),
+            {"shape": (3,), "dtype": "float64"},
+            [0.7298189202240498, 0.8691936429139384, 0.872300410378318],
+        ),
+        (
+            "random_normal",
+            (),
+            {"shape": (3,), "dtype": "float64"},
+            [-0.14551933368063805, 0.0751823832394783, 1.5188971495975898],
+        ),
+        ("randint", (0, 100), {"shape": (5,)}, [64, 32, 19, 88, 84]),
+        ("multinomial", (10, 5), {}, [[6, 3, 1, 8, 8]]),
+        ("multinomial", (10, 5), {"replace": False}, [[5, 6, 1, 9, 2]]),
+        ("shuffle", (np.arange(8),), {}, [2, 7, 4, 6, 0, 1, 3, 5]),
+    ],
+)
+def test_random_with_key(fn_name, args, kwargs, expected):
+    fn = ivy.__dict__[fn_name]
+    args = tuple(ivy.array(a) if isinstance(a, np.ndarray) else a for a in args)
+    key = ivy.PRNGKey(42)
+    ret = ivy.to_numpy(fn(*args, key=key, **kwargs))
+    # the samples only depend on the key, and are the same for all backends
+    assert np.array_equal(ivy.to_numpy(fn(*args, key=key, **kwargs)), ret)
+    assert np.allclose(ret, expected)
+    other = ivy.to_numpy(fn(*args, key=ivy.split_key(key)[0], **kwargs))
+    assert not np.array_equal(other, ret)
+
+
 # seed
 @handle_test(
     fn_tree="functional.ivy.seed",
@@ -198,3 +198,83 @@ def test_sparse_csc(
         class_name=class_name,
         method_name=method_name,
     )
+
+
+# csr - matmul
+@handle_method(
+    method_tree="SparseArray.matmul",
+    sparse_data=_sparse_csr_indices_values_shape(),
+    dense_cols=helpers.ints(min_value=1, max_value=4),
+    data=st.data(),
+)
+def test_sparse_csr_matmul(
+    sparse_data,
+    dense_cols,
+    data,
+    init_as_variable_flags: pf.AsVariableFlags,
+    init_native_array_flags: pf.NativeArrayFlags,
+    class_name,
+    method_name,
+    ground_truth_backend,
+):
+    crow_indices, col_indices, value_dtype, values, shape = sparse_data
+    x = data.draw(helpers.array_values(dtype=value_dtype, shape=(shape[1], dense_cols)))
+    helpers.test_method(
+        ground_truth_backend=ground_truth_backend,
+        init_input_dtypes=["int64", "int64", value_dtype],
+        init_as_variable_flags=init_as_variable_flags,
+        init_num_positional_args=0,
+        init_native_array_flags=init_native_array_flags,
+        init_all_as_kwargs_np={
+            "csr_crow_indices": crow_indices,
+            "csr_col_indices": col_indices,
+            "values": values,
+            "dense_shape": shape,
+        },
+        method_input_dtypes=[value_dtype],
+        method_as_variable_flags=[False],
+        method_num_positional_args=1,
+        method_native_array_flags=[False],
+        method_container_flags=[False],
+        method_all_as_kwargs_np={"x": x},
+        class_name=class_name,
+        method_name=method_name,
+    )
+
+
+# coo - sum
+@handle_method(
+    method_tree="SparseArray.sum",
+    sparse_data=_sparse_coo_indices_values_shape(),
+    axis=st.sampled_from([None, 0, 1, -1]),
+)
+def test_sparse_coo_sum(
+    sparse_data,
+    axis,
+    init_as_variable_flags: pf.AsVariableFlags,
+    init_native_array_flags: pf.NativeArrayFlags,
+    class_name,
+    method_name,
+    ground_truth_backend,
+):
+    coo_ind, val_dtype, val, shp = sparse_data
+    helpers.test_method(
+        ground_truth_backend=ground_truth_backend,
+        init_input_dtypes=["int64", val_dtype],
+        init_as_variable_flags=init_as_variable_flags,
+        init_num_positional_args=0,
+        init_native_array_flags=init_native_array_flags,
+        init_all_as_kwargs_np={
+            "coo_indices": coo_ind,
+            "values": val,
+            "dense_shape": shp,
+        },
+        method_input_dtypes=[],
+        method_as_variable_flags=[],
+        method_num_positional_args=0,
+        method_native_array_flags=[],
+        method_container_flags=[False],
+        method_all_as_kwargs_np={"axis": axis},
+        class_name=class_name,
+        method_name=method_name,
+    )
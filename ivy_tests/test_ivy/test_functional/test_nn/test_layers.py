@@ -1,7 +1,8 @@
 """Collection of tests for unified neural network layers."""
 
 # global
-from hypothesis import strategies as st, assume
+import numpy as np
+from hypothesis import given, strategies as st, assume
 
 # local
 import ivy
@@ -199,6 +200,38 @@ def test_scaled_dot_product_attention(
     )
 
 
+# scaled_dot_product_attention with chunked keys
+@given(
+    num_queries=st.integers(min_value=1, max_value=6),
+    num_keys=st.integers(min_value=1, max_value=12),
+    chunk_size=st.integers(min_value=1, max_value=8),
+    with_mask=st.booleans(),
+    mask_num_keys=st.sampled_from([None, 1]),
+    is_causal=st.booleans(),
+)
+def test_scaled_dot_product_attention_chunked(
+    num_queries, num_keys, chunk_size, with_mask, mask_num_keys, is_causal
+):
+    q = ivy.random_normal(shape=(2, num_queries, 4), seed=0)
+    k = ivy.random_normal(shape=(2, num_keys, 4), seed=1)
+    v = ivy.random_normal(shape=(2, num_keys, 3), seed=2)
+    mask = None
+    if with_mask:
+        # either a full mask, or one broadcast along the keys
+        mask_shape = (2, num_queries, mask_num_keys or num_keys)
+        mask = ivy.random_uniform(shape=mask_shape, seed=3) > 0.3
+    ret = ivy.scaled_dot_product_attention(
+        q, k, v, 0.5, mask=mask, is_causal=is_causal, chunk_size=chunk_size
+    )
+    if is_causal:
+        # the last query is aligned with the last key
+        query_positions = np.arange(num_keys - num_queries, num_keys)[:, None]
+        causal_mask = ivy.array(np.arange(num_keys) <= query_positions)
+        mask = causal_mask if mask is None else ivy.logical_and(mask, causal_mask)
+    ret_dense = ivy.scaled_dot_product_attention(q, k, v, 0.5, mask=mask)
+    assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(ret_dense), atol=1e-5)
+
+
 @st.composite
 def x_and_mha(draw, dtypes):
     dtype = draw(dtypes)
@@ -884,3 +917,38 @@ def test_lstm_update(
         bias=bias,
         recurrent_bias=recurrent_bias,
     )
+
+
+# lstm_update over long sequences, against a step by step reference
+@given(
+    timesteps=st.integers(min_value=1, max_value=200),
+    batch_shape=st.sampled_from([(), (3,), (2, 2)]),
+    with_bias=st.booleans(),
+)
+def test_lstm_update_long_sequence(timesteps, batch_shape, with_bias):
+    x = ivy.random_normal(shape=batch_shape + (timesteps, 3), seed=0)
+    init_h = ivy.random_normal(shape=batch_shape + (4,), seed=1)
+    init_c = ivy.random_normal(shape=batch_shape + (4,), seed=2)
+    kernel = ivy.random_normal(shape=(3, 16), seed=3) * 0.5
+    recurrent_kernel = ivy.random_normal(shape=(4, 16), seed=4) * 0.5
+    bias = ivy.random_normal(shape=(16,), seed=5) if with_bias else None
+    hts, ct = ivy.lstm_update(
+        x, init_h, init_c, kernel, recurrent_kernel, bias=bias, recurrent_bias=bias
+    )
+    assert hts.shape == batch_shape + (timesteps, 4)
+    assert ct.shape == batch_shape + (4,)
+
+    def _sigmoid(z):
+        return 1 / (1 + np.exp(-z))
+
+    x, h, c = ivy.to_numpy(x), ivy.to_numpy(init_h), ivy.to_numpy(init_c)
+    kernel, recurrent_kernel = ivy.to_numpy(kernel), ivy.to_numpy(recurrent_kernel)
+    bias = 2 * ivy.to_numpy(bias) if with_bias else 0
+    for t in range(timesteps):
+        i, f, g, o = np.split(
+            x[..., t, :] @ kernel + h @ recurrent_kernel + bias, 4, -1
+        )
+        c = _sigmoid(f) * c + _sigmoid(i) * np.tanh(g)
+        h = _sigmoid(o) * np.tanh(c)
+        assert np.allclose(ivy.to_numpy(hts[..., t, :]), h, atol=1e-4)
+    assert np.allclose(ivy.to_numpy(ct), c, atol=1e-4)
@@ -240,6 +240,43 @@ def test_array_property_size(
     ivy.assertions.check_equal(x.size, size_gt)
 
 
+@handle_test(
+    fn_tree="functional.ivy.native_array",  # dummy fn_tree
+    dtype_x=helpers.dtype_and_values(
+        available_dtypes=helpers.get_dtypes("valid"),
+        min_num_dims=1,
+    ),
+)
+def test_array_from_native(
+    dtype_x,
+):
+    _, data = dtype_x
+    data = ivy.native_array(data[0])
+    x = Array._from_native(data)
+    y = Array(data)
+    assert not hasattr(x, "__dict__")
+    ivy.assertions.check_equal(x.dtype, y.dtype)
+    ivy.assertions.check_equal(x.device, y.device)
+    ivy.assertions.check_equal(x.shape, y.shape)
+    ivy.assertions.check_equal(x.size, y.size)
+
+    # the metadata follows the native array when it is replaced
+    x.data = ivy.native_array([[0, 1, 2]], dtype="int32")
+    ivy.assertions.check_equal(x.dtype, "int32")
+    ivy.assertions.check_equal(x.shape, ivy.Shape((1, 3)))
+    ivy.assertions.check_equal(x.size, 3)
+
+
+def test_array_metadata_with_changed_backend():
+    # the lazy metadata is read with the backend of the native array, even when
+    # the global backend has changed since the array was created
+    for data in [np.array([1.0, 2.0], dtype="float16"), np.array(1.0, "float16")]:
+        x = Array._from_native(data)
+        x.backend = "jax" if ivy.current_backend_str() != "jax" else "torch"
+        ivy.assertions.check_equal(x.dtype, "float16")
+        ivy.assertions.check_equal(x.device, "cpu")
+
+
 @handle_test(
     fn_tree="functional.ivy.native_array",  # dummy fn_tree
     dtype_x=helpers.dtype_and_values(
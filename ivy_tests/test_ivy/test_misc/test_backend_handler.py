@@ -24,7 +24,7 @@ import numpy as np
 
 # local
 import ivy
-from ivy.backend_handler import _backend_dict
+from ivy.backend_handler import _backend_dict, _determine_backend_from_args
 
 from ivy_tests.test_ivy.helpers.available_frameworks import available_frameworks
 
@@ -72,12 +72,17 @@ def test_set_backend(backend, array_type):
 
     ivy.set_backend(backend)
     stack_after = ivy.backend_stack
-    # check that the function id has changed as inverse=True.
-    ivy.assertions.check_equal(func_address_before, id(ivy.sum), inverse=True)
+    backend = importlib.import_module(_backend_dict[backend])
+    # check that the function id has changed as inverse=True, unless the same
+    # backend was already set, in which case its cached namespace is reused
+    ivy.assertions.check_equal(
+        func_address_before,
+        id(ivy.sum),
+        inverse=not stack_before or stack_before[-1] is not backend,
+    )
     # using ivy assertions to ensure the desired backend is set
     ivy.assertions.check_less(len(stack_before), len(stack_after))
-    ivy.assertions.check_equal(ivy.current_backend_str(), backend)
-    backend = importlib.import_module(_backend_dict[backend])
+    ivy.assertions.check_equal(ivy.current_backend_str(), backend.current_backend_str())
     ivy.assertions.check_equal(stack_after[-1], backend)
     x = ivy.array([1, 2, 3])
     ivy.assertions.check_equal(str(type(ivy.to_native(x))), array_type)
@@ -96,8 +101,13 @@ def test_unset_backend(backend):
 
     unset_backend = ivy.unset_backend()
     stack_after_unset = ivy.backend_stack
-    # check that the function id has changed as inverse=True.
-    ivy.assertions.check_equal(func_address_before_unset, id(ivy.sum), inverse=True)
+    # check that the function id has changed as inverse=True, unless the same
+    # backend is still set, in which case its cached namespace is reused
+    ivy.assertions.check_equal(
+        func_address_before_unset,
+        id(ivy.sum),
+        inverse=not stack_after_unset or stack_after_unset[-1] is not unset_backend,
+    )
     ivy.assertions.check_equal(
         unset_backend, importlib.import_module(_backend_dict[backend])
     )
@@ -166,3 +176,13 @@ def test_get_backend(backend):
 
     # checking whether the backend is returned correctly
     ivy.assertions.check_equal(ivy.get_backend(backend), imported_backend)
+
+
+def test_determine_backend_from_args():
+    x = np.array([1.0])
+    assert _determine_backend_from_args([1, "a"]) is None
+    assert _determine_backend_from_args([1, x]).current_backend_str() == "numpy"
+    assert (
+        _determine_backend_from_args([[1, {"a": (2, x)}]]).current_backend_str()
+        == "numpy"
+    )
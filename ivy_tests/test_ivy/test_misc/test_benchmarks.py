@@ -0,0 +1,40 @@
+# global
+import pytest
+
+# local
+from ivy_benchmarks import CASES, compare_results, run_benchmarks
+from ivy_tests.test_ivy.helpers.available_frameworks import available_frameworks
+
+
+@pytest.mark.parametrize("backend", available_frameworks)
+@pytest.mark.parametrize("case", ["add_small", "container_map", "sgd_step"])
+def test_run_benchmarks(backend, case):
+    results = run_benchmarks(backends=[backend], cases=[case], number=2, repeat=1)
+    assert results["meta"]["skipped_backends"] == []
+    (result,) = results["results"]
+    assert result["backend"] == backend
+    assert result["case"] == case
+    assert result["category"] == CASES[case].category
+    assert result["ivy_time"] > 0
+    assert result["overhead_ratio"] == result["ivy_time"] / result["raw_time"]
+    assert result["throughput"] > 0
+
+
+def test_compare_benchmark_results():
+    baseline = {
+        "results": [
+            {"backend": "numpy", "case": "add", "ivy_time": 1.0},
+            {"backend": "numpy", "case": "sum", "ivy_time": 1.0},
+        ]
+    }
+    current = {
+        "results": [
+            {"backend": "numpy", "case": "add", "ivy_time": 1.05},
+            {"backend": "numpy", "case": "sum", "ivy_time": 1.5},
+            {"backend": "numpy", "case": "matmul", "ivy_time": 1.0},
+        ]
+    }
+    comparison = compare_results(baseline, current, threshold=0.1)
+    assert [c["case"] for c in comparison] == ["add", "sum"]
+    assert [c["regression"] for c in comparison] == [False, True]
+    assert comparison[1]["change"] == pytest.approx(0.5)
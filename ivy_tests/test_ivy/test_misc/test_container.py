@@ -2,7 +2,6 @@
 import os
 import queue
 import pytest
-import random
 import numpy as np
 import multiprocessing
 import pickle
@@ -2474,6 +2473,42 @@ def test_container_to_and_from_disk_as_hdf5(device):
     os.remove(save_filepath)
 
 
+def test_container_from_disk_as_hdf5_lazy(device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk.hdf5"
+    dict_in = {
+        "a": ivy.array([1.0, 2.0, 3.0, 4.0], device=device),
+        "b": {
+            "c": ivy.array([[1, 2], [3, 4], [5, 6], [7, 8]], device=device),
+        },
+    }
+    container = Container(dict_in)
+    container.cont_to_disk_as_hdf5(save_filepath)
+
+    loaded_container = Container.cont_from_disk_as_hdf5(
+        save_filepath, slice(1, 4), lazy=True
+    )
+
+    # key and key chain access
+    assert np.array_equal(ivy.to_numpy(loaded_container.a), np.array([2.0, 3.0, 4.0]))
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container["b/c"]), np.array([[3, 4], [5, 6], [7, 8]])
+    )
+
+    # batch slicing
+    sliced_container = loaded_container[1:3]
+    assert np.array_equal(ivy.to_numpy(sliced_container.a), np.array([3.0, 4.0]))
+    assert np.array_equal(
+        ivy.to_numpy(sliced_container.b.c), np.array([[5, 6], [7, 8]])
+    )
+    indexed_container = loaded_container[-1]
+    assert np.array_equal(ivy.to_numpy(indexed_container.b.c), np.array([7, 8]))
+
+    os.remove(save_filepath)
+
+
 def test_container_to_disk_shuffle_and_from_disk_as_hdf5(device):
     if ivy.current_backend_str() == "tensorflow":
         # container disk saving requires eager execution
@@ -2499,9 +2534,7 @@ def test_container_to_disk_shuffle_and_from_disk_as_hdf5(device):
     container_shuffled = Container.cont_from_disk_as_hdf5(save_filepath, slice(3))
 
     # testing
-    data = np.array([1, 2, 3])
-    random.seed(0)
-    random.shuffle(data)
+    data = np.array([1, 2, 3])[np.random.RandomState(0).permutation(3)]
 
     assert (ivy.to_numpy(container_shuffled["a"]) == data).all()
     assert (ivy.to_numpy(container_shuffled.a) == data).all()
@@ -90,3 +90,73 @@ def test_to_native_arrays_and_back():
 def test_integer_arrays_to_float(x, expected):
     # Todo: Fix dtype issue
     assert ivy.array_equal(ivy.func_wrapper.integer_arrays_to_float(_fn1)(x), expected)
+
+
+@pytest.mark.parametrize(
+    ("args", "kwargs", "expected"),
+    [
+        ((1, 2.0), {}, 0),
+        ((ivy.array(1),), {}, ivy.func_wrapper._HAS_IVY_ARRAY),
+        (([1, 2],), {}, ivy.func_wrapper._HAS_SEQUENCE),
+        (
+            ([ivy.array(1)],),
+            {},
+            ivy.func_wrapper._HAS_SEQUENCE | ivy.func_wrapper._HAS_IVY_ARRAY,
+        ),
+        ((ivy.Container(a=ivy.array(1)),), {}, ivy.func_wrapper._HAS_CONTAINER),
+        ((), {"out": None}, 0),
+        ((), {"out": ivy.array(1)}, ivy.func_wrapper._HAS_OUT),
+    ],
+)
+def test_classify_args(args, kwargs, expected):
+    assert ivy.func_wrapper._classify_args(args, kwargs) == expected
+
+
+def test_fused_dispatcher():
+    x = ivy.array([1.0, 2.0])
+    # each argument signature gets its own cached plan
+    ret = ivy.add(x, x)
+    plans = ivy.add._dispatch_plans
+    num_plans = len(plans)
+    assert isinstance(ret, ivy.Array)
+    assert ivy.array_equal(ret, ivy.array([2.0, 4.0]))
+    ivy.add(x, x)
+    assert len(plans) == num_plans
+    ret = ivy.add([1.0, 2.0], x)
+    assert len(plans) == num_plans + 1
+    assert ivy.array_equal(ret, ivy.array([2.0, 4.0]))
+    # containers and out arguments still go through the full wrapping
+    ret = ivy.add(ivy.Container(a=x), x)
+    assert ivy.array_equal(ret.a, ivy.array([2.0, 4.0]))
+    out = ivy.zeros(2)
+    ret = ivy.add(x, x, out=out)
+    assert ret is out
+    assert ivy.array_equal(out, ivy.array([2.0, 4.0]))
+
+
+def _fn8(x: Union[ivy.Array, ivy.NativeArray], /, *, y: ivy.Array = None):
+    return x, y
+
+
+def test_handle_array_like_kwargs():
+    assert isinstance(handle_array_like(_fn2)(x=[1, 2]), ivy.Array)
+    x, y = handle_array_like(_fn8)([1, 2], y=(3, 4))
+    assert isinstance(x, ivy.Array)
+    assert isinstance(y, ivy.Array)
+
+
+def test_get_array_like_params():
+    assert ivy.func_wrapper._get_array_like_params(_fn1) == ((), ())
+    assert ivy.func_wrapper._get_array_like_params(_fn2) == ((0,), ("x",))
+    assert ivy.func_wrapper._get_array_like_params(_fn4) == ((), ())
+    assert ivy.func_wrapper._get_array_like_params(_fn8) == ((0,), ("y",))
+
+
+def test_get_first_array():
+    x = ivy.array([1.0])
+    y = ivy.native_array([2.0])
+    assert ivy.func_wrapper._get_first_array(1, "a", x, y) is x
+    assert ivy.func_wrapper._get_first_array(1, [2, (y,)], x) is y
+    assert ivy.func_wrapper._get_first_array(1, {"a": [None, x]}, y) is x
+    assert ivy.func_wrapper._get_first_array(1, 2, b=[3], a=y) is y
+    assert ivy.func_wrapper._get_first_array(1, [2.0], a={"b": 3}) is None
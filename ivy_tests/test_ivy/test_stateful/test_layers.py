@@ -2,7 +2,8 @@
 
 # global
 import numpy as np
-from hypothesis import strategies as st, assume
+import pytest
+from hypothesis import given, strategies as st, assume
 
 # local
 import ivy
@@ -330,6 +331,77 @@ def test_multi_head_attention_layer(
     assert_same_type_and_shape([ret_np_flat, ret_np_from_gt_flat])
 
 
+# multi_head_attention with a key and value cache
+@given(
+    prompt_lengths=st.lists(
+        st.integers(min_value=1, max_value=4), min_size=1, max_size=3
+    ),
+    num_steps=st.integers(min_value=1, max_value=3),
+)
+def test_multi_head_attention_layer_kv_cache(prompt_lengths, num_steps, on_device):
+    batch_size, max_prompt_length = len(prompt_lengths), max(prompt_lengths)
+    layer = ivy.MultiHeadAttention(8, num_heads=2, head_dim=4, device=on_device)
+    x = ivy.random_normal(
+        shape=(batch_size, max_prompt_length + num_steps, 8), seed=0, device=on_device
+    )
+    cache = layer.init_kv_cache(batch_size, max_prompt_length + num_steps)
+
+    # prompts of different lengths, padded to the longest one
+    ret = layer(x[:, :max_prompt_length], kv_cache=cache, new_lengths=prompt_lengths)
+    rets = [[ret[i, :length]] for i, length in enumerate(prompt_lengths)]
+    # then one token at a time for each sequence
+    for step in range(num_steps):
+        tokens = ivy.stack(
+            [
+                x[i, length + step : length + step + 1]
+                for i, length in enumerate(prompt_lengths)
+            ]
+        )
+        ret = layer(tokens, kv_cache=cache)
+        for i in range(batch_size):
+            rets[i].append(ret[i])
+    assert cache.lengths == tuple(length + num_steps for length in prompt_lengths)
+
+    # which matches causal attention over each whole sequence
+    for i, length in enumerate(prompt_lengths):
+        ret_full = layer(x[i : i + 1, : length + num_steps], is_causal=True)[0]
+        assert np.allclose(
+            ivy.to_numpy(ivy.concat(rets[i], axis=0)), ivy.to_numpy(ret_full), atol=1e-5
+        )
+
+    cache.trim(1)
+    assert cache.lengths == (1,) * batch_size
+    cache.reset()
+    assert cache.lengths == (0,) * batch_size
+
+
+# the cache of backends without in-place updates, such as jax and tensorflow
+@pytest.mark.parametrize("inplace", [True, False])
+def test_kv_cache_update(inplace, on_device, monkeypatch):
+    monkeypatch.setattr(ivy, "inplace_arrays_supported", lambda *_: inplace)
+    cache = ivy.KVCache(2, 4, 1, 2, device=on_device)
+    k = ivy.reshape(ivy.arange(8, dtype="float32", device=on_device), (2, 1, 2, 2))
+    # the same number of tokens for both sequences, then a different number
+    cache.update(k, k)
+    keys, values, mask = cache.update(k + 10, k + 10, new_lengths=[1, 2])
+    expected = np.concatenate([ivy.to_numpy(k), ivy.to_numpy(k + 10)], axis=2)
+    expected[0, :, 3] = 0
+    assert np.allclose(ivy.to_numpy(keys), expected)
+    assert np.allclose(ivy.to_numpy(values), expected)
+    assert cache.lengths == (3, 4)
+    assert mask.shape == (2, 1, 2, 4)
+
+    # padded new tokens which would overflow the cache, of which only the valid ones
+    # are written
+    cache = ivy.KVCache(2, 4, 1, 2, device=on_device)
+    cache.update(k, k, new_lengths=[1, 1])
+    cache.update(k, k)
+    keys, _, _ = cache.update(k + 10, k + 10, new_lengths=[1, 1])
+    assert cache.lengths == (4, 4)
+    assert keys.shape == (2, 1, 4, 2)
+    assert np.allclose(ivy.to_numpy(keys[:, :, 3]), ivy.to_numpy(k[:, :, 0] + 10))
+
+
 # Convolutions #
 # -------------#
 
@@ -1010,3 +1010,61 @@ def test_module_track_submod_call_order(
             module._dl0._l0.v_with_top_v_key_chains(flatten_key_chains=True).to_numpy(),
         ]
     )
+
+
+# call without tracking
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+)
+def test_module_call_without_tracking(
+    batch_shape, input_channels, output_channels, on_device
+):
+    x = ivy.astype(
+        ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
+        "float32",
+    )
+    module = ivy.Sequential(
+        ivy.Linear(input_channels, 64, device=on_device),
+        ivy.Linear(64, output_channels, device=on_device),
+        device=on_device,
+    )
+    ret = module(x)
+    linear = module._submodules[0]
+    native_v = linear._native_v_cache[2]
+
+    # the native variables are reused while the variables are unchanged
+    assert np.allclose(ivy.to_numpy(module(x)), ivy.to_numpy(ret))
+    assert linear._native_v_cache[2] is native_v
+    assert not module.submod_rets and not module.submod_call_order
+
+    # and converted again once they change
+    module.v.submodules.v0.w = module.v.submodules.v0.w * 2
+    new_ret = module(x)
+    assert linear._native_v_cache[2] is not native_v
+    assert not np.allclose(ivy.to_numpy(new_ret), ivy.to_numpy(ret))
+
+    # the top-level call with the default variables runs on the module's own
+    # variables, such that changes to them are kept
+    class _Counter(ivy.Module):
+        def _create_variables(self, device, dtype=None):
+            return {"count": ivy.zeros((1,), device=device)}
+
+        def _forward(self, x):
+            assert isinstance(self.v.count, ivy.Array)
+            self.v.count = self.v.count + 1
+            return x
+
+    counter = _Counter(device=on_device)
+    for _ in range(3):
+        counter(x)
+    assert ivy.to_numpy(counter.v.count).item() == 3
+
+    # tracking state left by a tracked call is cleared by an untracked one
+    module(x, track_submod_call_order=True)
+    assert module.submod_call_order
+    module(x)
+    assert not module.submod_rets and not module.submod_call_order
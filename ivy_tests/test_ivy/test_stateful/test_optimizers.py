@@ -2,9 +2,12 @@
 """Collection of tests for Ivy optimizers."""
 
 # global
-from hypothesis import strategies as st
+import pytest
+from hypothesis import given, strategies as st
+import numpy as np
 
 # local
+import ivy
 import ivy.functional.backends.numpy as ivy_np
 import ivy_tests.test_ivy.helpers as helpers
 import ivy_tests.test_ivy.helpers.test_parameter_flags as pf
@@ -246,3 +249,40 @@ def test_lamb_optimizer(
         method_name=method_name,
         device_=on_device,
     )
+
+
+# step with flat parameters
+@given(
+    optimizer=st.sampled_from(["SGD", "LARS", "Adam", "LAMB"]),
+    lr=helpers.floats(min_value=1e-4, max_value=0.1),
+    num_steps=st.integers(min_value=1, max_value=3),
+)
+def test_optimizer_step_with_flat_parameters(optimizer, lr, num_steps, on_device):
+    module = ivy.Sequential(
+        ivy.Linear(3, 4, device=on_device),
+        ivy.Linear(4, 2, device=on_device),
+        device=on_device,
+    )
+    v = module.v.cont_deep_copy()
+    flat = module.flatten_v()
+    optimizer_nested = getattr(ivy, optimizer)(lr=lr, inplace=False)
+    optimizer_flat = getattr(ivy, optimizer)(lr=lr)
+    for i in range(num_steps):
+        grads = v.cont_map(lambda x, _: x * 0.5 + i)
+        v = optimizer_nested.step(v, grads)
+        module.v = optimizer_flat.step(flat, grads)
+
+    # the update of the buffers matches the leaf by leaf update
+    for kc, x in v.cont_to_iterator():
+        assert np.allclose(
+            ivy.to_numpy(module.v.cont_at_key_chain(kc)), ivy.to_numpy(x), atol=1e-5
+        )
+    flat_norm = flat.vector_norm(flat.pack(v))
+    assert np.allclose(ivy.to_numpy(flat.vector_norm()), ivy.to_numpy(flat_norm))
+    clipped = flat.clip_vector_norm(flat.pack(v), 1.0)
+    assert np.allclose(ivy.to_numpy(flat.vector_norm(clipped)), 1.0, atol=1e-5)
+
+    # the buffers are always updated in-place, which optimizers constructed with
+    # inplace=False don't support
+    with pytest.raises(ivy.exceptions.IvyException):
+        optimizer_nested.step(flat, grads)